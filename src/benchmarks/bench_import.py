@@ -0,0 +1,128 @@
+"""
+Import-Benchmark (Kaltstart).
+
+Misst in frischen Python-Prozessen, was ein Worker beim Start für die Fuzzy-API bezahlt: Wall-Clock-Zeit
+bis zum ersten nutzbaren Objekt, die kumulierte Importzeit aus `python -X importtime` und welche
+Module dabei geladen werden. Referenz ist `import numpy`, die einzige Pflicht-Abhängigkeit des Kerns.
+
+Das Skript endet mit Exit-Code 1, wenn ein Szenario Streamlit, matplotlib oder pandas lädt oder
+mehr als --budget-ms über der NumPy-Referenz liegt.
+
+Aufruf (aus src/):
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 20 --budget-ms 30 --output import.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+#: Szenario -> Python-Code, der in einem frischen Prozess ausgeführt wird
+SCENARIOS = {
+    "numpy (Referenz)": "import numpy",
+    "import fuzzylogic": "import fuzzylogic",
+    "fuzzylogic.FuzzyController": "import fuzzylogic; fuzzylogic.FuzzyController",
+    "default_controller().decide": (
+        "import fuzzylogic; "
+        "fuzzylogic.default_controller().decide({'Health': 30, 'Enemies': 90, 'Distance': 8.0})"
+    ),
+    "load_snapshot": None,  # wird nur mit --snapshot gemessen
+}
+
+#: Module, die ein headless Worker nie laden darf
+FORBIDDEN = ("streamlit", "matplotlib", "pandas")
+
+_PROBE = """
+import json, sys, time
+sys.stderr.write("--probe--\\n")
+t0 = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - t0
+print(json.dumps([elapsed, sorted(m.split('.')[0] for m in sys.modules)]))
+"""
+
+def _env() -> dict:
+    # src/ auf den Pfad, falls das Paket nicht installiert ist
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return env
+
+def measure(code: str, repeat: int) -> dict:
+    """
+    Führt code repeat-mal in je einem neuen Interpreter aus.
+
+    Returns:
+        dict: median_ms, min_ms, importtime_ms (kumuliert, Median), modules (Anzahl) und forbidden
+            (geladene Module aus FORBIDDEN).
+    """
+    env = _env()
+    wall, cumulative, modules = [], [], set()
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _PROBE.format(code=code)],
+                              capture_output=True, text=True, env=env, check=True)
+        elapsed, loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+        wall.append(elapsed * 1e3)
+        modules = set(loaded)
+        # Zeilen "import time: self [us] | cumulative | name" nach dem Marker (ohne Interpreter-Start);
+        # Top-Level-Module haben keine Einrückung
+        total = 0
+        for line in proc.stderr.split("--probe--", 1)[-1].splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith("  "):
+                total += int(parts[1])
+        cumulative.append(total / 1e3)
+    return {
+        "median_ms": statistics.median(wall),
+        "min_ms": min(wall),
+        "importtime_ms": statistics.median(cumulative),
+        "modules": len(modules),
+        "forbidden": sorted(set(FORBIDDEN) & modules),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaltstart-Benchmark für den Import der Fuzzy-API.")
+    parser.add_argument("--repeat", type=int, default=10, help="Prozesse pro Szenario (Median)")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Erlaubte Mehrkosten gegenüber 'import numpy' in ms (Median, Default: 50)")
+    parser.add_argument("--snapshot", help="Zusätzlich load_snapshot(<Datei>) messen")
+    parser.add_argument("--output", help="Ergebnisse als JSON speichern")
+    args = parser.parse_args(argv)
+
+    scenarios = dict(SCENARIOS)
+    if args.snapshot:
+        scenarios["load_snapshot"] = f"import fuzzylogic; fuzzylogic.load_snapshot({args.snapshot!r})"
+    results = {}
+    for name, code in scenarios.items():
+        if code is None:
+            continue
+        results[name] = measure(code, args.repeat)
+        r = results[name]
+        print(f"{name:<32} {r['median_ms']:>8.1f} ms (min {r['min_ms']:.1f})  importtime {r['importtime_ms']:>7.1f} ms"
+              f"  {r['modules']:>4} Module", flush=True)
+
+    reference = results.pop("numpy (Referenz)")["median_ms"]
+    failures = []
+    for name, r in results.items():
+        if r["forbidden"]:
+            failures.append(f"{name} lädt {', '.join(r['forbidden'])}")
+        if r["median_ms"] - reference > args.budget_ms:
+            failures.append(f"{name}: {r['median_ms'] - reference:.1f} ms über numpy (Budget {args.budget_ms:.0f} ms)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                                "repeat": args.repeat, "numpy_ms": reference},
+                       "results": results}, fh, indent=2)
+    for failure in failures:
+        print(f"FEHLER {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"Alle Szenarien innerhalb von {args.budget_ms:.0f} ms über numpy, keine UI-Module geladen.")
+
+if __name__ == "__main__":
+    main()
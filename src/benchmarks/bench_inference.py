@@ -0,0 +1,260 @@
+"""
+Benchmark-Suite für die Inferenz-Pipeline.
+
+Misst FuzzyController.infer / defuzzify / defuzzify_exact / decide_batch (min/max und additiv
+product/sum), FuzzyVariable.fuzzify und die einzelnen Defuzzifier-Methoden über synthetische
+Controller und variiert dabei Regelanzahl, Anzahl Input-Variablen und Terme, Output-Auflösung,
+Batchgröße und MF-Typ (config.MF_TYPES).
+
+Die Ergebnisse werden als JSON geschrieben. Mit --baseline wird gegen eine frühere Ergebnisdatei
+desselben Sweeps (Default oder --quick) verglichen; verschlechtert sich eine Metrik um mehr als
+--tolerance, endet das Skript mit Exit-Code 1.
+
+Aufruf (aus src/):
+    python -m benchmarks.bench_inference --quick --output bench.json
+    python -m benchmarks.bench_inference --quick --baseline bench.json --tolerance 0.25 --track 'infer*'
+"""
+
+import argparse
+import fnmatch
+import itertools
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+from fuzzylogic.config import MF_TYPES
+from fuzzylogic.fuzzy_logic.defuzzifier import Defuzzifier
+from fuzzylogic.fuzzy_logic.fuzzy_controller import FuzzyController
+from fuzzylogic.fuzzy_logic.fuzzy_rule import FuzzyRule
+from fuzzylogic.fuzzy_logic.fuzzy_variable import FuzzyVariable
+from fuzzylogic.fuzzy_logic.workspace import InferenceWorkspace
+
+METHODS = ['min_of_max', 'max_of_max', 'mean_of_max', 'centroid']
+
+#: Sweep-Parameter (Default und --quick)
+SWEEPS = {
+    "full": {
+        "rules": [18, 100, 1000],
+        "inputs": [3, 6],
+        "terms": [3, 7],
+        "resolution": [100, 500, 2000],
+        "batch": [1, 64, 1024, 16384],
+        "mf": list(MF_TYPES),
+    },
+    "quick": {
+        "rules": [18, 200],
+        "inputs": [3],
+        "terms": [3],
+        "resolution": [500],
+        "batch": [1, 1024],
+        "mf": list(MF_TYPES),
+    },
+}
+
+def synthetic_variable(name: str, n_terms: int, mf_type: str, domain=(0.0, 100.0)) -> FuzzyVariable:
+    """
+    Erzeugt eine Variable mit n_terms gleichmäßig verteilten Termen des gegebenen MF-Typs.
+    """
+    lo, hi = domain
+    step = (hi - lo) / (n_terms - 1)
+    terms = {}
+    for k in range(n_terms):
+        center = lo + k * step
+        if mf_type == "Trapezoid":
+            params = [center - step, center - step / 4, center + step / 4, center + step]
+        elif mf_type == "Triangle":
+            params = [center - step, center, center + step]
+        else:
+            params = [step / 2, 2, center]
+        terms[f"t{k}"] = MF_TYPES[mf_type]["func"](*params)
+    return FuzzyVariable(name, terms, domain)
+
+def synthetic_controller(n_inputs: int, n_terms: int, n_rules: int, mf_type: str,
+                         resolution: int = 500, seed: int = 0, **kwargs) -> FuzzyController:
+    """
+    Erzeugt einen Controller mit zufälliger Regelbasis (1..n_inputs Antezedenzien pro Regel).
+    Weitere kwargs (z.B. implication, aggregation) gehen an FuzzyController.
+    """
+    rng = np.random.default_rng(seed)
+    input_vars = {f"X{i}": synthetic_variable(f"X{i}", n_terms, mf_type) for i in range(n_inputs)}
+    output_var = synthetic_variable("Y", n_terms, mf_type)
+    names = list(input_vars)
+    rules = []
+    for _ in range(n_rules):
+        k = rng.integers(1, n_inputs + 1)
+        chosen = rng.choice(names, size=k, replace=False)
+        antecedents = [(str(v), f"t{rng.integers(n_terms)}") for v in chosen]
+        rules.append(FuzzyRule(antecedents, ("Y", f"t{rng.integers(n_terms)}")))
+    return FuzzyController(input_vars, output_var, rules, resolution=resolution, **kwargs)
+
+def random_inputs(controller, batch: int, seed: int = 1) -> dict:
+    """Zufällige Crisp-Eingaben innerhalb der Domänen."""
+    rng = np.random.default_rng(seed)
+    return {name: rng.uniform(*var.domain, batch) for name, var in controller.input_vars.items()}
+
+def timeit(fn, min_time: float = 0.05, repeat: int = 3) -> float:
+    """
+    Misst die Laufzeit eines Aufrufs in Sekunden (bestes Ergebnis aus repeat Messreihen,
+    jede Messreihe läuft mindestens min_time Sekunden).
+    """
+    fn()
+    number, elapsed = 1, 0.0
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+def _key(name: str, params: dict) -> str:
+    return name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+
+def run(sweep: dict, min_time: float) -> list:
+    """
+    Führt alle Messungen des Sweeps aus.
+
+    Returns:
+        list: [{'key', 'name', 'params', 'seconds'}, ...] (Sekunden pro Aufruf bzw. pro Zeile)
+    """
+    results = []
+
+    def record(name, params, seconds):
+        results.append({"key": _key(name, params), "name": name, "params": params, "seconds": seconds})
+        print(f"{results[-1]['key']:<90} {seconds * 1e6:>12.2f} µs", flush=True)
+
+    grid = itertools.product(sweep["mf"], sweep["inputs"], sweep["terms"], sweep["rules"], sweep["resolution"])
+    for mf, n_inputs, n_terms, n_rules, resolution in grid:
+        params = {"mf": mf, "inputs": n_inputs, "terms": n_terms, "rules": n_rules, "resolution": resolution}
+        controller = synthetic_controller(n_inputs, n_terms, n_rules, mf, resolution)
+        single = {name: col[0] for name, col in random_inputs(controller, 1).items()}
+        _, agg, ys = controller.infer(single)
+
+        record("infer", params, timeit(lambda: controller.infer(single), min_time))
+        record("decide", params, timeit(lambda: controller.decide(single), min_time))
+        for method in METHODS:
+            record(f"defuzzify.{method}", params, timeit(lambda: controller.defuzzify(ys, method), min_time))
+            record(f"defuzzify_exact.{method}", params,
+                   timeit(lambda: controller.defuzzify_exact(agg, method), min_time))
+        additive = synthetic_controller(n_inputs, n_terms, n_rules, mf, resolution,
+                                        implication='product', aggregation='sum')
+        for batch in sweep["batch"]:
+            inputs = random_inputs(controller, batch)
+            per_row = timeit(lambda: controller.decide_batch(inputs), min_time) / batch
+            record("decide_batch_per_row", dict(params, batch=batch), per_row)
+            per_row = timeit(lambda: additive.decide_batch(inputs), min_time) / batch
+            record("decide_batch_additive_per_row", dict(params, batch=batch), per_row)
+            workspace = InferenceWorkspace(controller, np.float32, capacity=min(batch, 4096))
+            out = np.empty(batch, np.float32)
+            per_row = timeit(lambda: workspace.decide_batch(inputs, out=out), min_time) / batch
+            record("workspace_float32_per_row", dict(params, batch=batch), per_row)
+
+    # Bausteine, die nur von Termanzahl/MF-Typ bzw. Auflösung abhängen
+    for mf, n_terms in itertools.product(sweep["mf"], sweep["terms"]):
+        var = synthetic_variable("X", n_terms, mf)
+        record("fuzzify", {"mf": mf, "terms": n_terms}, timeit(lambda: var.fuzzify(42.0), min_time))
+    for resolution in sweep["resolution"]:
+        xs = np.linspace(0, 100, resolution)
+        ys = np.minimum(0.7, np.maximum(0, 1 - np.abs(xs - 40) / 30))
+        for method in METHODS:
+            f = getattr(Defuzzifier, method)
+            record(f"Defuzzifier.{method}", {"resolution": resolution}, timeit(lambda: f(xs, ys), min_time))
+    return results
+
+def compare(results: list, baseline: dict, tolerance: float, track: list = None) -> tuple:
+    """
+    Vergleicht Ergebnisse mit einer Baseline (gleiches JSON-Format, gleicher Sweep).
+    Überwachte Metriken, die nur auf einer Seite vorkommen, und Muster ohne Treffer werden als
+    fehlend gemeldet, damit die Prüfung nicht unbemerkt leer läuft.
+
+    Args:
+        results (list): Aktuelle Ergebnisse aus run().
+        baseline (dict): Geladene Baseline-Datei.
+        tolerance (float): Erlaubte relative Verschlechterung.
+        track (list, optional): fnmatch-Muster der überwachten Metriken (Default: alle).
+
+    Returns:
+        tuple: (regressions, missing) mit regressions als [(key, baseline_seconds, current_seconds, ratio), ...]
+            und missing als Liste von Meldungen.
+    """
+    def tracked(key):
+        return not track or any(fnmatch.fnmatch(key, pattern) for pattern in track)
+
+    base = {r["key"]: r["seconds"] for r in baseline["results"]}
+    current = {r["key"]: r["seconds"] for r in results}
+    regressions, missing = [], []
+    for key, seconds in current.items():
+        if not tracked(key):
+            continue
+        old = base.get(key)
+        if old is None:
+            missing.append(f"{key} fehlt in der Baseline")
+        elif seconds > old * (1 + tolerance):
+            regressions.append((key, old, seconds, seconds / old))
+    missing += [f"{key} fehlt in den aktuellen Ergebnissen" for key in base
+                if key not in current and tracked(key)]
+    for pattern in track or ():
+        if not any(fnmatch.fnmatch(key, pattern) for key in (*current, *base)):
+            missing.append(f"Muster '{pattern}' passt auf keine Metrik")
+    return regressions, missing
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark-Suite für die Fuzzy-Inferenz.")
+    parser.add_argument("--quick", action="store_true", help="Kleiner Sweep (z.B. für CI)")
+    parser.add_argument("--output", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--baseline", help="JSON-Ergebnisse, gegen die verglichen wird")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Erlaubte relative Verschlechterung gegenüber der Baseline (Default: 0.25)")
+    parser.add_argument("--track", action="append", default=[], metavar="MUSTER",
+                        help="Nur Metriken prüfen, deren Key auf das Muster passt, z.B. 'decide_batch*'")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Mindestdauer je Messreihe in s")
+    args = parser.parse_args(argv)
+    sweep = "quick" if args.quick else "full"
+
+    baseline = None
+    if args.baseline:
+        # Vor dem Messen prüfen: verschiedene Sweeps haben kaum gemeinsame Metriken
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        base_sweep = baseline.get("meta", {}).get("sweep")
+        if base_sweep is not None and base_sweep != sweep:
+            parser.error(f"Baseline {args.baseline} wurde mit Sweep '{base_sweep}' erzeugt, dieser Lauf "
+                         f"nutzt '{sweep}'" + (" (ohne --quick aufrufen)" if base_sweep == "full"
+                                               else " (mit --quick aufrufen)"))
+
+    results = run(SWEEPS[sweep], args.min_time)
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "sweep": sweep,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if baseline is not None:
+        regressions, missing = compare(results, baseline, args.tolerance, args.track)
+        for key, old, new, ratio in regressions:
+            print(f"REGRESSION {key}: {old * 1e6:.2f} µs -> {new * 1e6:.2f} µs ({ratio:.2f}x)")
+        for message in missing:
+            print(f"FEHLT {message}")
+        if regressions or missing:
+            sys.exit(1)
+        print(f"Keine Regression über {args.tolerance:.0%} gegenüber {args.baseline}.")
+
+if __name__ == "__main__":
+    main()
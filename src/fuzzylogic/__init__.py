@@ -0,0 +1,87 @@
+"""
+fuzzylogic: Öffentliche, headless API des Fuzzy-Logic-Controllers.
+
+Alle Namen werden erst beim ersten Zugriff importiert (PEP 562, Modul-__getattr__). `import fuzzylogic`
+kostet dadurch praktisch nichts; der Kern (fuzzy_logic, runtime) braucht nur NumPy. Streamlit und
+matplotlib werden nie implizit geladen, sondern nur über die optionalen Namen unter _OPTIONAL.
+
+Verwendung:
+    import fuzzylogic as fl
+    controller = fl.default_controller()
+    value = controller.decide({'Health': 30, 'Enemies': 90, 'Distance': 8.0})
+    fl.command_for(value)
+
+Kaltstart messen (aus src/): python -m benchmarks.bench_import
+"""
+
+import importlib
+
+__version__ = "0.1.0"
+
+#: Öffentlicher Name -> Modul, das ihn definiert (nur NumPy als Abhängigkeit)
+_EXPORTS = {
+    # Membership Functions
+    "MembershipFunction": "fuzzylogic.fuzzy_logic.membership_function",
+    "ParametricMembershipFunction": "fuzzylogic.fuzzy_logic.membership_function",
+    "Trapezoid": "fuzzylogic.membership_function",
+    "Triangle": "fuzzylogic.membership_function",
+    "Bell": "fuzzylogic.membership_function",
+    "trap_mf": "fuzzylogic.membership_function",
+    "tri_mf": "fuzzylogic.membership_function",
+    "bell_mf": "fuzzylogic.membership_function",
+    "MF_CLASSES": "fuzzylogic.membership_function",
+    # Variablen, Regeln, Controller
+    "FuzzyVariable": "fuzzylogic.fuzzy_logic.fuzzy_variable",
+    "FuzzyRule": "fuzzylogic.fuzzy_logic.fuzzy_rule",
+    "CompiledRuleBase": "fuzzylogic.fuzzy_logic.rule_base",
+    "FuzzyController": "fuzzylogic.fuzzy_logic.fuzzy_controller",
+    "Defuzzifier": "fuzzylogic.fuzzy_logic.defuzzifier",
+    "InferenceStats": "fuzzylogic.fuzzy_logic.profiling",
+    "InferenceWorkspace": "fuzzylogic.fuzzy_logic.workspace",
+    "InferenceExplanation": "fuzzylogic.fuzzy_logic.explanation",
+    "IncrementalInference": "fuzzylogic.fuzzy_logic.incremental",
+    "MultiOutputController": "fuzzylogic.fuzzy_logic.multi_output",
+    "SugenoController": "fuzzylogic.fuzzy_logic.sugeno",
+    "SugenoVariable": "fuzzylogic.fuzzy_logic.sugeno",
+    "LinearConsequent": "fuzzylogic.fuzzy_logic.sugeno",
+    "ControlSurface": "fuzzylogic.fuzzy_logic.lookup_table",
+    "analyze_rules": "fuzzylogic.fuzzy_logic.rule_optimizer",
+    "optimize_rules": "fuzzylogic.fuzzy_logic.rule_optimizer",
+    "save_snapshot": "fuzzylogic.fuzzy_logic.snapshot",
+    "load_snapshot": "fuzzylogic.fuzzy_logic.snapshot",
+    # Headless-Laufzeit
+    "default_controller": "fuzzylogic.runtime.defaults",
+    "default_variable": "fuzzylogic.runtime.defaults",
+    "default_rules": "fuzzylogic.runtime.defaults",
+    "command_for": "fuzzylogic.runtime.commands",
+    "commands_for": "fuzzylogic.runtime.commands",
+    "ParallelScorer": "fuzzylogic.runtime.parallel",
+    "score_parallel": "fuzzylogic.runtime.parallel",
+    "run_stream": "fuzzylogic.runtime.streaming",
+    "run_simulation": "fuzzylogic.runtime.simulation",
+}
+
+#: Optionale Teile mit schweren Abhängigkeiten (pip install fuzzylogic[ui]); Name -> Modul
+_OPTIONAL = {
+    "ui_helper": "fuzzylogic.ui.ui_helper",
+    "plots": "fuzzylogic.ui.plots",
+}
+
+__all__ = sorted(_EXPORTS) + sorted(_OPTIONAL)
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    elif name in _OPTIONAL:
+        try:
+            value = importlib.import_module(_OPTIONAL[name])
+        except ImportError as exc:
+            raise ImportError(f"fuzzylogic.{name} benötigt die optionalen UI-Abhängigkeiten "
+                              f"(pip install 'fuzzylogic[ui]'): {exc}") from exc
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # weitere Zugriffe ohne __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
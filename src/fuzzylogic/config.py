@@ -3,24 +3,29 @@ Konfiguration für das Fuzzy-Logic-System:
 - Definitionen der Membership-Function-Typen und deren Parameter
 - Hilfetexte für UI-Tooltips
 - Variable-Konfigurationen für Health, Enemies, Distance, Outlook
+- Default-Regelbasis
+- Schwellenwerte für die Ausgabekommandos
 """
 
-from modules.membership_function import trap_mf, tri_mf, bell_mf
+from fuzzylogic.membership_function import trap_mf, tri_mf, bell_mf, Trapezoid, Triangle, Bell
 
 #: Definition der verfügbaren Membership-Function-Typen
 MF_TYPES = {
     "Trapezoid": {
         "func": trap_mf,
+        "cls": Trapezoid,
         "params": ["a", "b", "c", "d"],
         "default": [0, 0, 25, 50]
     },
     "Triangle": {
         "func": tri_mf,
+        "cls": Triangle,
         "params": ["a", "b", "c"],
         "default": [25, 50, 75]
     },
     "Bell": {
         "func": bell_mf,
+        "cls": Bell,
         "params": ["a", "b", "c"],
         "default": [15, 4, 50]
     }
@@ -84,4 +89,35 @@ VAR_CONFIG = {
             "good":   ("Trapezoid", [50, 75, 100, 100])
         }
     }
-}
\ No newline at end of file
+}
+
+#: Default-Regelbasis: ({Input-Variable: Term, ...}, (Output-Variable, Term))
+DEFAULT_RULES = [
+    ({"Health": "strong", "Enemies": "low"}, ("Outlook", "good")),
+    ({"Health": "strong", "Enemies": "mod"}, ("Outlook", "good")),
+    ({"Health": "strong", "Enemies": "high"}, ("Outlook", "medium")),
+    ({"Health": "medium", "Enemies": "low"}, ("Outlook", "good")),
+    ({"Health": "medium", "Enemies": "mod"}, ("Outlook", "medium")),
+    ({"Health": "medium", "Enemies": "high"}, ("Outlook", "poor")),
+    ({"Health": "weak", "Enemies": "low"}, ("Outlook", "medium")),
+    ({"Health": "weak", "Enemies": "mod"}, ("Outlook", "poor")),
+    ({"Health": "weak", "Enemies": "high"}, ("Outlook", "poor")),
+    ({"Distance": "near", "Enemies": "low"}, ("Outlook", "good")),
+    ({"Distance": "near", "Enemies": "mod"}, ("Outlook", "good")),
+    ({"Distance": "near", "Enemies": "high"}, ("Outlook", "medium")),
+    ({"Distance": "medium", "Enemies": "low"}, ("Outlook", "good")),
+    ({"Distance": "medium", "Enemies": "mod"}, ("Outlook", "medium")),
+    ({"Distance": "medium", "Enemies": "high"}, ("Outlook", "poor")),
+    ({"Distance": "far", "Enemies": "low"}, ("Outlook", "medium")),
+    ({"Distance": "far", "Enemies": "mod"}, ("Outlook", "poor")),
+    ({"Distance": "far", "Enemies": "high"}, ("Outlook", "poor")),
+]
+
+#: Schwellenwerte für Ausgabekommandos: (Untergrenze, Kommando), absteigend geprüft
+COMMAND_THRESHOLDS = [
+    (66, "ANGRIFF"),
+    (34, "VERTEIDIGUNG"),
+]
+
+#: Kommando, falls keine Schwelle erreicht wird
+COMMAND_DEFAULT = "RÜCKZUG"
@@ -0,0 +1 @@
+"""Fuzzy-Inferenz: Variablen, Regeln, kompilierte Regelbasis, Controller und Defuzzifizierung (nur NumPy)."""
@@ -0,0 +1,151 @@
+"""
+Defuzzifizierungsmethoden für Fuzzy-Logic-Systeme.
+Stellt gängige Techniken bereit, um aus einer Fuzzy-Ausgabemenge einen Crisp-Wert zu berechnen.
+"""
+
+import numpy as np
+
+class Defuzzifier:
+    """
+    Sammlung statischer Methoden zur Defuzzifizierung von Fuzzy-Ausgaben.
+    Alle Methoden erwarten:
+        xs (np.ndarray): x-Werte (Domäne der Output-MF)
+        ys (np.ndarray): Zugehörige μ-Werte (Mitgliedschaft), Form (n,) oder (batch, n)
+    Rückgabe jeweils: float (crisper Output-Wert) bzw. np.ndarray (batch,) bei 2D-Eingabe
+    """
+
+    @staticmethod
+    def min_of_max(xs, ys):
+        """
+        Gibt das Minimum aller x zurück, für die die MF ihr Maximum erreicht (first-max).
+
+        Args:
+            xs (np.ndarray): X-Achse der Output-MF
+            ys (np.ndarray): Zugehörige MF-Werte
+        Returns:
+            float: Linker Wert bei Maximum
+        """
+        is_max = ys == ys.max(axis=-1, keepdims=True)
+        return np.where(is_max, xs, np.inf).min(axis=-1)
+
+    @staticmethod
+    def max_of_max(xs, ys):
+        """
+        Gibt das Maximum aller x zurück, für die die MF ihr Maximum erreicht (last-max).
+
+        Args:
+            xs (np.ndarray): X-Achse der Output-MF
+            ys (np.ndarray): Zugehörige MF-Werte
+        Returns:
+            float: Rechter Wert bei Maximum
+        """
+        is_max = ys == ys.max(axis=-1, keepdims=True)
+        return np.where(is_max, xs, -np.inf).max(axis=-1)
+
+    @staticmethod
+    def mean_of_max(xs, ys):
+        """
+        Gibt das arithmetische Mittel aller x zurück, für die die MF ihr Maximum erreicht (center-of-maxima).
+
+        Args:
+            xs (np.ndarray): X-Achse der Output-MF
+            ys (np.ndarray): Zugehörige MF-Werte
+        Returns:
+            float: Mittelwert der Maxima
+        """
+        is_max = ys == ys.max(axis=-1, keepdims=True)
+        return (xs * is_max).sum(axis=-1) / is_max.sum(axis=-1)
+
+    @staticmethod
+    def centroid(xs, ys):
+        """
+        Berechnet das Flächenschwerpunkt-Verfahren (center-of-gravity/centroid).
+
+        Args:
+            xs (np.ndarray): X-Achse der Output-MF
+            ys (np.ndarray): Zugehörige MF-Werte
+        Returns:
+            float: Schwerpunkt der Fläche unter der MF
+        """
+        area = ys.sum(axis=-1)
+        moment = (xs * ys).sum(axis=-1)
+        # Leere Ausgabemenge (keine Regel feuert) ergibt 0
+        return np.divide(moment, area, out=np.zeros_like(moment), where=area != 0)
+
+    # --- Exakte Varianten auf stückweise linearen Segmenten (siehe envelope.clipped_envelope) ---
+    # segments = (x0, x1, y0, y1): die Ausgabemenge ist auf [x0[i], x1[i]] linear von y0[i] nach y1[i].
+
+    @staticmethod
+    def _max_points(segments):
+        """
+        Bestimmt die Stellen, an denen die Hüllkurve ihr Maximum erreicht.
+
+        Returns:
+            tuple: (Endpunkte beim Maximum, Plateau-Segmente als (x0, x1))
+        """
+        x0, x1, y0, y1 = segments
+        max_y = max(y0.max(), y1.max())
+        at0 = np.isclose(y0, max_y, rtol=1e-9, atol=1e-12)
+        at1 = np.isclose(y1, max_y, rtol=1e-9, atol=1e-12)
+        points = np.concatenate([x0[at0], x1[at1]])
+        plateau = at0 & at1 & (x1 > x0)
+        return points, (x0[plateau], x1[plateau])
+
+    @staticmethod
+    def min_of_max_exact(segments):
+        """
+        Exaktes first-max auf einer stückweise linearen Ausgabemenge.
+
+        Args:
+            segments (tuple): (x0, x1, y0, y1) Segmente der Ausgabemenge
+        Returns:
+            float: Linker Wert bei Maximum
+        """
+        points, _ = Defuzzifier._max_points(segments)
+        return points.min()
+
+    @staticmethod
+    def max_of_max_exact(segments):
+        """
+        Exaktes last-max auf einer stückweise linearen Ausgabemenge.
+
+        Args:
+            segments (tuple): (x0, x1, y0, y1) Segmente der Ausgabemenge
+        Returns:
+            float: Rechter Wert bei Maximum
+        """
+        points, _ = Defuzzifier._max_points(segments)
+        return points.max()
+
+    @staticmethod
+    def mean_of_max_exact(segments):
+        """
+        Exaktes center-of-maxima: Schwerpunkt der Plateaus auf Maximalhöhe,
+        bzw. Mittel der Spitzen, falls das Maximum nur in einzelnen Punkten erreicht wird.
+
+        Args:
+            segments (tuple): (x0, x1, y0, y1) Segmente der Ausgabemenge
+        Returns:
+            float: Mittelwert der Maxima
+        """
+        points, (p0, p1) = Defuzzifier._max_points(segments)
+        length = (p1 - p0).sum()
+        if length > 0:
+            return ((p1 - p0) * (p0 + p1) / 2).sum() / length
+        return np.unique(points).mean()
+
+    @staticmethod
+    def centroid_exact(segments):
+        """
+        Exakter Flächenschwerpunkt einer stückweise linearen Ausgabemenge (geschlossene Form).
+
+        Args:
+            segments (tuple): (x0, x1, y0, y1) Segmente der Ausgabemenge
+        Returns:
+            float: Schwerpunkt der Fläche unter der MF
+        """
+        x0, x1, y0, y1 = segments
+        width = x1 - x0
+        area = (width * (y0 + y1) / 2).sum()
+        moment = (width / 6 * (x0 * (2 * y0 + y1) + x1 * (y0 + 2 * y1))).sum()
+        return moment / area if area != 0 else 0.0
@@ -0,0 +1,110 @@
+"""
+Envelope-Modul:
+Berechnet die aggregierte Output-Menge max_t min(α_t, μ_t(x)) exakt als stückweise lineare Funktion,
+sofern alle aktiven Outputterms stückweise linear sind (Trapez, Dreieck).
+Damit kann ohne Sampling-Gitter defuzzifiziert werden.
+"""
+
+import numpy as np
+
+def _line_ends(mfs, degrees, u, v):
+    """
+    Wertet die geclippten Terme auf jedem Intervall [u, v] aus, auf dem sie linear sind,
+    und extrapoliert die Geraden auf die Intervallgrenzen (Grenzwerte von innen).
+
+    Returns:
+        tuple: (left, right) jeweils (Terme × Intervalle)
+    """
+    width = v - u
+    p = u + width / 3
+    q = u + 2 * width / 3
+    yp = np.array([np.minimum(deg, mf(p)) for mf, deg in zip(mfs, degrees)])
+    yq = np.array([np.minimum(deg, mf(q)) for mf, deg in zip(mfs, degrees)])
+    step = yq - yp
+    return yp - step, yq + step
+
+def clipped_envelope(mfs: list, degrees: list, domain: tuple):
+    """
+    Berechnet die exakte stückweise lineare Hüllkurve der geclippten Outputterms.
+
+    Die Knickstellen ergeben sich aus den Eckpunkten der Terme, den Schnittpunkten ihrer Flanken
+    mit dem jeweiligen Clip-Level α und den Schnittpunkten der Terme untereinander.
+    Zwischen zwei Knickstellen ist die Hüllkurve linear.
+
+    Args:
+        mfs (list): MembershipFunctions der Outputterms.
+        degrees (list): Aggregierte Stärke α je Outputterm (gleiche Reihenfolge).
+        domain (tuple): (min, max) Wertebereich der Output-Variable.
+
+    Returns:
+        tuple | None: Segmente (x0, x1, y0, y1) als np.ndarrays, oder None, wenn ein aktiver
+            Term nicht stückweise linear ist (dann muss gesampelt werden).
+    """
+    lo, hi = float(domain[0]), float(domain[1])
+    active = [(mf, float(deg)) for mf, deg in zip(mfs, degrees) if deg > 0]
+    if not active:
+        return (np.array([lo]), np.array([hi]), np.zeros(1), np.zeros(1))
+
+    knots = [lo, hi]
+    for mf, deg in active:
+        bp = mf.breakpoints()
+        if bp is None:
+            return None
+        xs, ys = bp
+        knots.extend(xs)
+        # Schnittpunkte der Flanken mit dem Clip-Level
+        x0, x1, y0, y1 = xs[:-1], xs[1:], ys[:-1], ys[1:]
+        crosses = (x1 > x0) & ((y0 - deg) * (y1 - deg) < 0)
+        knots.extend(x0[crosses] + (deg - y0[crosses]) / (y1[crosses] - y0[crosses])
+                     * (x1[crosses] - x0[crosses]))
+
+    mfs_a = [mf for mf, _ in active]
+    degs_a = [deg for _, deg in active]
+    knots = np.unique(np.clip(knots, lo, hi))
+    u, v = knots[:-1], knots[1:]
+
+    # Schnittpunkte zwischen je zwei Termen innerhalb eines Intervalls ergänzen
+    if len(active) > 1 and len(u):
+        left, right = _line_ends(mfs_a, degs_a, u, v)
+        extra = []
+        for s in range(len(active)):
+            for t in range(s + 1, len(active)):
+                dl, dr = left[s] - left[t], right[s] - right[t]
+                hit = dl * dr < 0
+                extra.append(u[hit] + dl[hit] / (dl[hit] - dr[hit]) * (v[hit] - u[hit]))
+        knots = np.unique(np.concatenate([knots] + extra))
+        u, v = knots[:-1], knots[1:]
+
+    left, right = _line_ends(mfs_a, degs_a, u, v)
+    y0 = np.maximum(left.max(axis=0), 0.0)
+    y1 = np.maximum(right.max(axis=0), 0.0)
+    return u, v, y0, y1
+
+def term_moments(mf, domain: tuple, resolution: int = 2001) -> tuple:
+    """
+    Fläche und Schwerpunkt eines einzelnen (ungeclippten) Terms über der Domäne.
+    Stückweise lineare Terme werden exakt berechnet, alle anderen über resolution Stützstellen.
+
+    Args:
+        mf (MembershipFunction): Term.
+        domain (tuple): (min, max) Wertebereich der Output-Variable.
+        resolution (int): Stützstellen für nicht-lineare Terme (z.B. Bell).
+
+    Returns:
+        tuple: (area, centroid); bei Fläche 0 ist der Schwerpunkt die Mitte der Domäne.
+    """
+    lo, hi = float(domain[0]), float(domain[1])
+    segments = clipped_envelope([mf], [1.0], domain)
+    if segments is not None:
+        x0, x1, y0, y1 = segments
+        width = x1 - x0
+        area = float((width * (y0 + y1) / 2).sum())
+        moment = float((width / 6 * (x0 * (2 * y0 + y1) + x1 * (y0 + 2 * y1))).sum())
+    else:
+        xs = np.linspace(lo, hi, resolution)
+        ys = mf(xs)
+        area = float(np.trapezoid(ys, xs))
+        moment = float(np.trapezoid(xs * ys, xs))
+    if area == 0:
+        return 0.0, (lo + hi) / 2
+    return area, moment / area
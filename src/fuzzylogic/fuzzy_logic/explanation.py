@@ -0,0 +1,66 @@
+"""
+Explanation-Modul:
+Zwischenergebnisse einer Einzel-Inferenz als Arrays, z.B. für Visualisierungen. Enthält die
+gesampelten Input-MFs, die geclippten Output-Mengen jeder gefeuerten Regel und jedes Outputterms
+sowie die aggregierte Output-Menge, sodass Plots nichts neu sampeln oder nachrechnen müssen.
+"""
+
+import numpy as np
+
+class InferenceExplanation:
+    """
+    Ergebnis von FuzzyController.explain. Alle Output-Arrays beziehen sich auf das Gitter xs.
+
+    Attributes:
+        inputs (dict): Name -> Crisp-Eingabewert.
+        fuzzified (dict): Name -> {Term: Zugehörigkeit} wie bei infer.
+        input_samples (dict): Name -> (xs, labels, curves) mit den gesampelten Input-MFs
+            (curves: Terme × Stützstellen, Zeilen in der Reihenfolge von labels).
+        xs (np.ndarray): Stützstellen der Output-Domäne.
+        output_terms (list): Labels der Outputterms (Zeilen von term_curves und term_sets).
+        term_curves (np.ndarray): (Outputterms × len(xs)) ungewichtete Output-MFs.
+        rules (np.ndarray): Indizes der gefeuerten Regeln in controller.rules (aufsteigend).
+        rule_strengths (np.ndarray): Aktivierungsstärke jeder gefeuerten Regel (> 0).
+        rule_terms (np.ndarray): Outputterm-Index der Konsequenz jeder gefeuerten Regel.
+        rule_sets (np.ndarray): (gefeuerte Regeln × len(xs)) implizierte Output-Menge je Regel.
+        term_degrees (np.ndarray): (Outputterms,) aggregierte Stärke je Outputterm.
+        term_sets (np.ndarray): (Outputterms × len(xs)) implizierte Output-Menge je Term.
+        ys (np.ndarray): Aggregierte Output-MF über xs (identisch zu infer).
+    """
+
+    def __init__(self, inputs: dict, fuzzified: dict, input_samples: dict, xs: np.ndarray,
+                 output_terms: list, term_curves: np.ndarray, rules: np.ndarray,
+                 rule_strengths: np.ndarray, rule_terms: np.ndarray, rule_sets: np.ndarray,
+                 term_degrees: np.ndarray, term_sets: np.ndarray, ys: np.ndarray):
+        self.inputs = inputs
+        self.fuzzified = fuzzified
+        self.input_samples = input_samples
+        self.xs = xs
+        self.output_terms = output_terms
+        self.term_curves = term_curves
+        self.rules = rules
+        self.rule_strengths = rule_strengths
+        self.rule_terms = rule_terms
+        self.rule_sets = rule_sets
+        self.term_degrees = term_degrees
+        self.term_sets = term_sets
+        self.ys = ys
+
+    @property
+    def agg(self) -> dict:
+        """Aggregierte Stärke je Outputterm als dict wie bei infer."""
+        return dict(zip(self.output_terms, self.term_degrees.tolist()))
+
+    def strongest(self, limit: int) -> np.ndarray:
+        """
+        Positionen (in rules / rule_sets) der limit stärksten gefeuerten Regeln, in Regelreihenfolge.
+
+        Args:
+            limit (int): Maximale Anzahl.
+
+        Returns:
+            np.ndarray: Aufsteigende Positionen.
+        """
+        if len(self.rules) <= limit:
+            return np.arange(len(self.rules))
+        return np.sort(np.argsort(-self.rule_strengths, kind='stable')[:limit])
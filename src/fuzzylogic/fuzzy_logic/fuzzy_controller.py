@@ -0,0 +1,658 @@
+"""
+FuzzyController-Modul:
+Kapselt die gesamte Fuzzy-Inferenz inklusive Fuzzifizierung, Regelanwendung, Aggregation und Defuzzifizierung.
+"""
+
+import time
+
+import numpy as np
+from fuzzylogic.fuzzy_logic.defuzzifier import Defuzzifier
+from fuzzylogic.fuzzy_logic.envelope import clipped_envelope, term_moments
+from fuzzylogic.fuzzy_logic.explanation import InferenceExplanation
+from fuzzylogic.fuzzy_logic.fuzzy_rule import RuleList
+from fuzzylogic.fuzzy_logic.profiling import InferenceStats
+from fuzzylogic.fuzzy_logic.rule_base import CompiledRuleBase
+from fuzzylogic.fuzzy_logic.workspace import InferenceWorkspace
+
+def _probor(a, b, out=None):
+    """Probabilistisches OR: a + b - a·b."""
+    return np.subtract(a + b, a * b, out=out)
+
+def fuzzify_columns(input_vars: dict, crisp_inputs: dict) -> np.ndarray:
+    """
+    Vektorisierte Fuzzifizierung: wertet jede Term-MF einmal über die ganze Spalte ihrer Variable aus.
+
+    Args:
+        input_vars (dict): Name -> FuzzyVariable.
+        crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+
+    Returns:
+        np.ndarray: (batch × Inputterms) Fuzzifizierungsmatrix, Spalten in der Reihenfolge der
+            Variablen und ihrer Terme (wie FuzzyController.input_terms bzw. CompiledRuleBase.input_terms).
+    """
+    columns = {name: np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float)) for name in input_vars}
+    batch = len(next(iter(columns.values()))) if columns else 0
+    input_terms = [(name, term) for name, var in input_vars.items() for term in var.terms]
+    memberships = np.empty((batch, len(input_terms)))
+    for i, (name, term) in enumerate(input_terms):
+        memberships[:, i] = input_vars[name].terms[term](columns[name])
+    return memberships
+
+#: Implikationsoperatoren: (Termstärke, gesampelte Term-MF) -> Output-Menge des Terms
+IMPLICATIONS = {"min": np.minimum, "product": np.multiply}
+#: Aggregationsoperatoren (paarweise): zwei Output-Mengen -> kombinierte Output-Menge
+AGGREGATIONS = {"max": np.maximum, "sum": np.add, "probor": _probor}
+
+class FuzzyController:
+    """
+    FuzzyController führt die Kernlogik eines Fuzzy-Systems aus:
+    - Fuzzifizierung der Eingaben
+    - Auswertung der Fuzzy-Regeln
+    - Aggregation der Output-Fuzzy-Sets
+    - Defuzzifizierung des Gesamtergebnisses
+
+    Implikation ('min' = Clipping, 'product' = Skalierung) und Aggregation ('max', 'sum', 'probor')
+    sind wählbar. Regeln mit gleicher Konsequenz werden zuerst mit dem Aggregationsoperator zu einer
+    Termstärke zusammengefasst, dann werden die Terme implikiert und aggregiert. Die Kombination
+    product/sum ist das additive Standardmodell: ihr Schwerpunkt folgt in O(Terme) aus den
+    vorberechneten Flächen und Schwerpunkten der Terme (defuzzify_additive).
+
+    Attributes:
+        input_vars (dict): Name -> FuzzyVariable für alle Eingabegrößen.
+        output_var (FuzzyVariable): Output-Fuzzy-Variable.
+        rules (RuleList): Regelbasis; zugewiesene Listen werden in eine RuleList kopiert, die
+            Änderungen mitzählt.
+        resolution (int): Anzahl Stützstellen für die Diskretisierung der Output-Domäne.
+        xs (np.ndarray): X-Achse für die Output-MF (Diskretisierung).
+        term_curves (np.ndarray): (Outputterms × resolution) gesampelte Output-MFs über xs.
+        term_areas (np.ndarray): (Outputterms,) exakte Fläche jedes Outputterms über der Domäne.
+        term_centroids (np.ndarray): (Outputterms,) Schwerpunkt jedes Outputterms.
+        implication (str): Implikationsoperator, Schlüssel von IMPLICATIONS.
+        aggregation (str): Aggregationsoperator, Schlüssel von AGGREGATIONS.
+        compiled_rules (CompiledRuleBase): Regelbasis als Index-Arrays (wird bei Bedarf neu kompiliert).
+        stats (InferenceStats | None): Profiling-Zähler, None wenn Profiling deaktiviert ist.
+    """
+    def __init__(self, input_vars: dict, output_var, rules: list, resolution: int = 500,
+                 implication: str = 'min', aggregation: str = 'max'):
+        """
+        Initialisiert den Controller mit Input-Variablen, Output-Variable und Regelsatz.
+
+        Args:
+            input_vars (dict): Name -> FuzzyVariable für Input-Variablen.
+            output_var (FuzzyVariable): Die Output-Variable.
+            rules (list): Liste der FuzzyRule-Objekte.
+            resolution (int): Anzahl Stützstellen der Output-Domäne (Default: 500).
+            implication (str): 'min' (Default) oder 'product'.
+            aggregation (str): 'max' (Default), 'sum' oder 'probor'.
+
+        Raises:
+            ValueError: Bei unbekanntem Implikations- oder Aggregationsoperator.
+        """
+        self._setup(input_vars, output_var, rules, resolution, implication, aggregation)
+        self._refresh_curves()
+
+    @classmethod
+    def from_cache(cls, input_vars: dict, output_var, rules: list, xs: np.ndarray,
+                   term_curves: np.ndarray, compiled_rules: CompiledRuleBase,
+                   term_areas: np.ndarray = None, term_centroids: np.ndarray = None,
+                   implication: str = 'min', aggregation: str = 'max') -> 'FuzzyController':
+        """
+        Erzeugt einen Controller direkt aus bereits berechneten Arrays (z.B. aus einem Snapshot),
+        ohne die Output-Terme wie __init__ zu sampeln. Die Arrays werden nicht kopiert und dürfen
+        read-only sein (Memory-Mapping).
+
+        Args:
+            input_vars (dict): Name -> FuzzyVariable für Input-Variablen.
+            output_var (FuzzyVariable): Die Output-Variable.
+            rules (list): Liste der FuzzyRule-Objekte.
+            xs, term_curves, compiled_rules, term_areas, term_centroids: siehe restore_cache.
+            implication (str): 'min' (Default) oder 'product'.
+            aggregation (str): 'max' (Default), 'sum' oder 'probor'.
+
+        Returns:
+            FuzzyController: Einsatzbereiter Controller, resolution = len(xs).
+        """
+        controller = cls.__new__(cls)
+        controller._setup(input_vars, output_var, rules, len(xs), implication, aggregation)
+        controller.restore_cache(xs, term_curves, compiled_rules, term_areas, term_centroids)
+        return controller
+
+    def _setup(self, input_vars: dict, output_var, rules: list, resolution: int,
+               implication: str, aggregation: str):
+        """Setzt Attribute und leere Caches (ohne Sampling), gemeinsam für __init__ und from_cache."""
+        if implication not in IMPLICATIONS:
+            raise ValueError(f"Unbekannte Implikation: {implication} (erwartet: {', '.join(IMPLICATIONS)})")
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unbekannte Aggregation: {aggregation} (erwartet: {', '.join(AGGREGATIONS)})")
+        self.implication = implication
+        self.aggregation = aggregation
+        self.input_vars = input_vars
+        self.output_var = output_var
+        self._rules_version = 0
+        self.rules = rules
+        self.resolution = resolution
+        self._curve_key = None
+        self._rules_key = None
+        self.stats = None
+        self._workspace = None
+        self._input_samples = {}
+
+    def enable_profiling(self, hook=None) -> InferenceStats:
+        """
+        Aktiviert die Instrumentierung der Pipeline-Stufen.
+
+        Args:
+            hook (callable, optional): Callback hook(stage, seconds, info) nach jeder Stufe.
+
+        Returns:
+            InferenceStats: Zählerobjekt (auch über self.stats erreichbar).
+        """
+        self.stats = InferenceStats(hook)
+        return self.stats
+
+    def disable_profiling(self):
+        """Deaktiviert die Instrumentierung wieder."""
+        self.stats = None
+
+    def _refresh_curves(self):
+        """
+        Sampelt xs und alle Output-Terme neu, falls sich Output-Variable, deren Terme/Domäne
+        oder die Auflösung seit dem letzten Aufruf geändert haben.
+        """
+        key = self._curve_cache_key()
+        if key == self._curve_key:
+            return
+        lo, hi = self.output_var.domain
+        self._xs = np.linspace(lo, hi, self.resolution)
+        self._output_terms = list(self.output_var.terms)
+        curves = np.empty((len(self._output_terms), self.resolution))
+        for k, mf in enumerate(self.output_var.terms.values()):
+            curves[k] = mf(self._xs)
+        self._term_curves = curves
+        self._refresh_moments()
+        self._curve_key = key
+
+    def _refresh_moments(self):
+        """Berechnet Fläche und Schwerpunkt jedes Outputterms (exakt für Trapez/Dreieck)."""
+        moments = [term_moments(mf, self.output_var.domain) for mf in self.output_var.terms.values()]
+        self._term_areas = np.array([area for area, _ in moments]).reshape(len(moments))
+        self._term_centroids = np.array([c for _, c in moments]).reshape(len(moments))
+
+    def _curve_cache_key(self) -> tuple:
+        return (id(self.output_var), self.output_var.version, self.resolution)
+
+    @property
+    def rules(self) -> RuleList:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list):
+        self._rules = RuleList(rules)
+        self._rules_version += 1
+
+    def _rules_cache_key(self) -> tuple:
+        # Versionszähler statt der Regeln selbst: Kosten pro Zugriff unabhängig von der Regelanzahl
+        return (self._rules_version, self._rules.version, id(self.input_vars),
+                tuple(var.version for var in self.input_vars.values()), self._curve_key)
+
+    def restore_cache(self, xs: np.ndarray, term_curves: np.ndarray, compiled_rules: CompiledRuleBase,
+                      term_areas: np.ndarray = None, term_centroids: np.ndarray = None):
+        """
+        Übernimmt bereits berechnete Output-Kurven und Regelbasis (z.B. aus einem Snapshot),
+        statt sie neu zu sampeln bzw. zu kompilieren. Die Arrays dürfen read-only sein (Memory-Mapping).
+
+        Args:
+            xs (np.ndarray): Stützstellen der Output-Domäne (Länge self.resolution).
+            term_curves (np.ndarray): (Outputterms × resolution) gesampelte Output-MFs.
+            compiled_rules (CompiledRuleBase): Kompilierte Regelbasis passend zu self.rules.
+            term_areas (np.ndarray, optional): (Outputterms,) Flächen der Terme; ohne sie werden
+                Flächen und Schwerpunkte neu berechnet.
+            term_centroids (np.ndarray, optional): (Outputterms,) Schwerpunkte der Terme.
+        """
+        self._xs = xs
+        self._term_curves = term_curves
+        self._output_terms = list(self.output_var.terms)
+        if term_areas is None or term_centroids is None:
+            self._refresh_moments()
+        else:
+            self._term_areas = term_areas
+            self._term_centroids = term_centroids
+        self._curve_key = self._curve_cache_key()
+        self._compiled = compiled_rules
+        self._rules_key = self._rules_cache_key()
+
+    def invalidate_cache(self):
+        """
+        Verwirft die gesampelten Output-Kurven und die kompilierte Regelbasis.
+        Nur nötig, wenn eine MembershipFunction oder eine FuzzyRule selbst verändert wurde;
+        Änderungen an Termen/Domänen der Variablen sowie Hinzufügen, Entfernen und Ersetzen
+        von Regeln in self.rules werden automatisch erkannt.
+        """
+        self._curve_key = None
+        self._rules_key = None
+        self._input_samples = {}
+
+    @property
+    def xs(self) -> np.ndarray:
+        self._refresh_curves()
+        return self._xs
+
+    @property
+    def term_curves(self) -> np.ndarray:
+        self._refresh_curves()
+        return self._term_curves
+
+    @property
+    def term_areas(self) -> np.ndarray:
+        self._refresh_curves()
+        return self._term_areas
+
+    @property
+    def term_centroids(self) -> np.ndarray:
+        self._refresh_curves()
+        return self._term_centroids
+
+    @property
+    def is_additive(self) -> bool:
+        """True für Produkt-Implikation mit Summen-Aggregation (Schwerpunkt in O(Terme))."""
+        return self.implication == 'product' and self.aggregation == 'sum'
+
+    @property
+    def output_terms(self) -> list:
+        """Reihenfolge der Zeilen von term_curves bzw. der Spalten von agg in infer_batch."""
+        self._refresh_curves()
+        return self._output_terms
+
+    @property
+    def compiled_rules(self) -> CompiledRuleBase:
+        self._refresh_curves()
+        key = self._rules_cache_key()
+        if key != self._rules_key:
+            self._compiled = CompiledRuleBase.compile(self.rules, self.input_vars, self._output_terms)
+            self._rules_key = key
+        return self._compiled
+
+    def compile(self) -> CompiledRuleBase:
+        """
+        Sampelt die Output-Terme und kompiliert die Regelbasis sofort statt bei der ersten Inferenz
+        (z.B. beim Aufbau eines gecachten Controllers). Ist nichts geändert, kostet der Aufruf nur
+        die Prüfung der Cache-Schlüssel.
+
+        Returns:
+            CompiledRuleBase: Die aktuelle kompilierte Regelbasis.
+        """
+        return self.compiled_rules
+
+    def infer(self, crisp_inputs: dict):
+        """
+        Fuzzy-Inferenzpipeline: Fuzzifizierung -> Regelbewertung -> Aggregation -> Aggregiertes Output-Set.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+
+        Returns:
+            fuzzified (dict): Für jede Inputvariable die Fuzzy-Zugehörigkeitswerte zum Input.
+            agg (dict): Aggregierte Stärke für jeden Outputterm.
+            ys (np.ndarray): Aggregierte Output-Membership-Function über self.xs.
+        """
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+
+        # 1. Fuzzifizierung der Eingabewerte
+        fuzzified = {name: var.fuzzify(crisp_inputs[name])
+                     for name, var in self.input_vars.items()}
+        memberships = np.array([fuzzified[name][term] for name, term in self.input_terms()])
+        if stats:
+            stats.lap('fuzzify', t0)
+
+        agg, ys = self._infer_memberships(memberships)
+        return fuzzified, agg, ys
+
+    def _infer_memberships(self, memberships: np.ndarray):
+        """
+        Schritte 2-3 der Einzel-Inferenz für einen bereits fuzzifizierten Vektor
+        (Spalten wie self.input_terms()), z.B. geteilt zwischen mehreren Outputs.
+
+        Returns:
+            tuple: (agg, ys) wie bei infer.
+        """
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+
+        # 2. Regelbewertung (Min-AND über die Antezedenzien); über den invertierten Index
+        #    werden nur Regeln ausgewertet, deren Antezedenzien alle aktiv sind
+        rule_base = self.compiled_rules
+        rules, strengths = rule_base.active_strengths(memberships)
+        if stats:
+            t0 = stats.lap('rules', t0, **stats.count_rules(strengths, total=len(rule_base.live)))
+
+        # 3. Aggregation (pro Outputterm das Maximum aller Regeln) und
+        #    aggregiertes Output-MF (pro x: max über alle terms der min(term-mf, degree))
+        degrees = rule_base.aggregate_sparse(rules, strengths, self.aggregation)
+        agg = dict(zip(rule_base.output_terms, degrees.tolist()))
+        ys = self.aggregate_curves(degrees)
+        if stats:
+            stats.lap('aggregate', t0)
+        return agg, ys
+
+    def sample_inputs(self, n: int = 400) -> dict:
+        """
+        Sampelt die MFs aller Input-Variablen vektorisiert über ihre Domäne. Das Ergebnis wird pro
+        Variable gecacht und erst neu berechnet, wenn sich deren Terme oder Domäne ändern.
+
+        Args:
+            n (int): Anzahl Stützstellen je Variable.
+
+        Returns:
+            dict: Name -> (xs, labels, curves) mit curves als (Terme × n) Array.
+        """
+        samples = {}
+        for name, var in self.input_vars.items():
+            key = (id(var), var.version, n)
+            cached = self._input_samples.get(name)
+            if cached is None or cached[0] != key:
+                xs = np.linspace(var.domain[0], var.domain[1], n)
+                curves = np.empty((len(var.terms), n))
+                for k, mf in enumerate(var.terms.values()):
+                    curves[k] = mf(xs)
+                cached = self._input_samples[name] = (key, (xs, list(var.terms), curves))
+            samples[name] = cached[1]
+        return samples
+
+    def explain(self, crisp_inputs: dict, n_input: int = 400) -> InferenceExplanation:
+        """
+        Einzel-Inferenz wie infer, liefert aber alle Zwischenergebnisse als Arrays:
+        gesampelte Input-MFs, implizierte Output-Mengen je gefeuerter Regel und je Outputterm
+        sowie die aggregierte Output-Menge (bitgleich zu infer).
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+            n_input (int): Stützstellen der gesampelten Input-MFs.
+
+        Returns:
+            InferenceExplanation: Zwischenergebnisse der Inferenz.
+        """
+        fuzzified = {name: var.fuzzify(crisp_inputs[name])
+                     for name, var in self.input_vars.items()}
+        memberships = np.array([fuzzified[name][term] for name, term in self.input_terms()])
+
+        rule_base = self.compiled_rules
+        rules, strengths = rule_base.active_strengths(memberships)
+        fired = strengths > 0
+        rules, strengths = rules[fired], strengths[fired]
+        degrees = rule_base.aggregate_sparse(rules, strengths, self.aggregation)
+
+        implication = IMPLICATIONS[self.implication]
+        combine = AGGREGATIONS[self.aggregation]
+        curves = self.term_curves
+        rule_terms = rule_base.consequent_idx[rules]
+        rule_sets = implication(strengths[:, None], curves[rule_terms])
+        term_sets = implication(degrees[:, None], curves)
+        # Gleiche Reihenfolge und Operationen wie aggregate_curves
+        ys = np.zeros(len(self.xs))
+        for k in np.flatnonzero(degrees):
+            combine(ys, term_sets[k], out=ys)
+
+        return InferenceExplanation(
+            inputs={name: crisp_inputs[name] for name in self.input_vars},
+            fuzzified=fuzzified, input_samples=self.sample_inputs(n_input),
+            xs=self.xs, output_terms=self.output_terms, term_curves=curves,
+            rules=rules, rule_strengths=strengths, rule_terms=rule_terms, rule_sets=rule_sets,
+            term_degrees=degrees, term_sets=term_sets, ys=ys)
+
+    def aggregate_curves(self, agg: np.ndarray) -> np.ndarray:
+        """
+        Baut die aggregierte Output-Menge aus Termstärken: pro Term Implikation mit der
+        gesampelten Term-MF, dann Aggregation über alle Terme. Terme mit Stärke 0 tragen nichts bei.
+
+        Args:
+            agg (np.ndarray): (Outputterms,) oder (batch × Outputterms) Termstärken.
+
+        Returns:
+            np.ndarray: (len(xs),) bzw. (batch × len(xs)) aggregierte Output-MF(s).
+        """
+        agg = np.asarray(agg, dtype=float)
+        implication = IMPLICATIONS[self.implication]
+        combine = AGGREGATIONS[self.aggregation]
+        curves = self.term_curves
+        ys = np.zeros(agg.shape[:-1] + (len(self.xs),))
+        for k in range(len(curves)):
+            degree = agg[..., k, None]
+            if not degree.any():
+                continue
+            combine(ys, implication(degree, curves[k]), out=ys)
+        return ys
+
+    def defuzzify_additive(self, agg):
+        """
+        Schwerpunkt des additiven Modells (product/sum) in geschlossener Form:
+        Σ wₖ·Aₖ·cₖ / Σ wₖ·Aₖ mit Termstärke wₖ, Fläche Aₖ und Schwerpunkt cₖ jedes Outputterms.
+        Kein Sampling-Gitter, Kosten O(Terme) pro Entscheidung.
+
+        Args:
+            agg (dict | np.ndarray): Termstärken wie von infer (dict) oder als Array
+                (Outputterms,) bzw. (batch × Outputterms) in der Reihenfolge self.output_terms.
+
+        Returns:
+            float | np.ndarray: Crisp-Ausgabe(n); 0, wenn keine Regel feuert.
+        """
+        if isinstance(agg, dict):
+            agg = [agg[t] for t in self.output_terms]
+        weights = np.asarray(agg, dtype=float) * self.term_areas
+        moment = weights @ self.term_centroids
+        area = weights.sum(axis=-1)
+        value = np.divide(moment, area, out=np.zeros_like(moment), where=area != 0)
+        return float(value) if value.ndim == 0 else value
+
+    def defuzzify(self, ys: np.ndarray, method: str = 'centroid') -> float:
+        """
+        Führt Defuzzifizierung durch, um aus dem Output-MF einen Crisp-Wert zu berechnen.
+
+        Args:
+            ys (np.ndarray): Das aggregierte Output-MF über self.xs.
+            method (str): Name der Defuzzifizierungsstrategie
+                ('min_of_max', 'max_of_max', 'mean_of_max', 'centroid', ...)
+
+        Returns:
+            float: Crisp-Ausgabewert nach Defuzzifizierung.
+        """
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+        f = getattr(Defuzzifier, method)
+        value = float(f(self.xs, ys))
+        if stats:
+            stats.lap('defuzzify', t0)
+        return value
+
+    def defuzzify_exact(self, agg, method: str = 'centroid') -> float:
+        """
+        Analytische Defuzzifizierung direkt aus den aggregierten Termstärken, ohne Sampling-Gitter.
+        Bei min/max wird die geclippte Hüllkurve der Trapez-/Dreiecksterme exakt aus ihren Eckpunkten
+        berechnet, beim additiven Modell (product/sum) liefert 'centroid' defuzzify_additive.
+        Ist ein aktiver Term nicht stückweise linear (Bell) oder gibt es für die gewählten Operatoren
+        keine geschlossene Form, wird auf das Sampling über self.xs (Auflösung self.resolution)
+        zurückgefallen.
+
+        Args:
+            agg (dict | np.ndarray): Aggregierte Stärke je Outputterm (wie von infer geliefert,
+                oder als Array in der Reihenfolge self.output_terms).
+            method (str): Name der Defuzzifizierungsstrategie
+                ('min_of_max', 'max_of_max', 'mean_of_max', 'centroid')
+
+        Returns:
+            float: Crisp-Ausgabewert nach Defuzzifizierung.
+        """
+        terms = self.output_terms
+        degrees = [agg[t] for t in terms] if isinstance(agg, dict) else list(agg)
+        if self.is_additive and method == 'centroid':
+            return self.defuzzify_additive(degrees)
+        segments = None
+        if (self.implication, self.aggregation) == ('min', 'max') and not np.isnan(degrees).any():
+            segments = clipped_envelope(list(self.output_var.terms.values()), degrees,
+                                        self.output_var.domain)
+        if segments is None:
+            return self.defuzzify(self.aggregate_curves(degrees), method)
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+        f = getattr(Defuzzifier, method + '_exact')
+        value = float(f(segments))
+        if stats:
+            stats.lap('defuzzify', t0)
+        return value
+
+    def decide(self, crisp_inputs: dict, method: str = 'centroid') -> float:
+        """
+        Schlanker Einzelpfad: liefert nur den Crisp-Wert, ohne fuzzified/agg-Dicts und ohne
+        Temporärarrays (vorallozierte Puffer, siehe InferenceWorkspace). Ergebnis wie
+        decide_batch für eine Zeile.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+            method (str): Name der Defuzzifizierungsstrategie.
+
+        Returns:
+            float: Crisp-Ausgabewert.
+        """
+        if self._workspace is None:
+            self._workspace = InferenceWorkspace(self)
+        return self._workspace.decide(crisp_inputs, method)
+
+    def infer_batch(self, crisp_inputs: dict):
+        """
+        Vektorisierte Inferenzpipeline für viele Eingaben gleichzeitig (z.B. alle NPCs eines Ticks).
+        Alle Schritte arbeiten auf Matrizen, es gibt keine Python-Schleife pro Sample.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+
+        Returns:
+            memberships (np.ndarray): (batch × Inputterms) Fuzzifizierungsmatrix,
+                Spaltenreihenfolge wie self.input_terms().
+            strengths (np.ndarray): (batch × Regeln) Aktivierungsstärken der Regeln.
+            agg (np.ndarray): (batch × Outputterms) aggregierte Stärke je Outputterm.
+            ys (np.ndarray): (batch × len(self.xs)) aggregierte Output-MFs.
+        """
+        # 1. Fuzzifizierung: eine Spalte pro (Variable, Term)
+        memberships = self._fuzzify_batch_timed(crisp_inputs)
+        strengths, agg, t0 = self._strengths_memberships(memberships)
+
+        # 4. Aggregiertes Output-MF je Sample: Implikation je Term, Aggregation über die Terme
+        ys = self.aggregate_curves(agg)
+        if self.stats:
+            self.stats.lap('aggregate', t0, len(ys))
+        return memberships, strengths, agg, ys
+
+    def _fuzzify_batch_timed(self, crisp_inputs: dict) -> np.ndarray:
+        """fuzzify_batch mit Profiling der Stufe 'fuzzify'."""
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+        memberships = self.fuzzify_batch(crisp_inputs)
+        if stats:
+            stats.lap('fuzzify', t0, len(memberships))
+        return memberships
+
+    def _strengths_memberships(self, memberships: np.ndarray):
+        """
+        Schritte 2-3 der Batch-Pipeline (Regelbewertung, Aggregation der Regelstärken)
+        für eine bereits berechnete Fuzzifizierungsmatrix.
+
+        Returns:
+            tuple: (strengths, agg, t0) mit t0 als Startzeit der Aggregationsstufe.
+        """
+        rule_base = self.compiled_rules
+        stats = self.stats
+        t0 = time.perf_counter() if stats else 0.0
+        batch = len(memberships)
+
+        # 2. Regelbewertung: Minimum über die Antezedenz-Spalten jeder Regel
+        strengths = rule_base.firing_strengths(memberships)
+        if stats:
+            t0 = stats.lap('rules', t0, batch, **stats.count_rules(strengths, batch))
+
+        # 3. Aggregation: pro Outputterm alle zugehörigen Regeln mit dem Aggregationsoperator
+        agg = rule_base.aggregate(strengths, self.aggregation)
+        return strengths, agg, t0
+
+    def _decide_memberships(self, memberships: np.ndarray, method: str = 'centroid') -> np.ndarray:
+        """
+        Regelbewertung, Aggregation und Defuzzifizierung für eine bereits berechnete
+        Fuzzifizierungsmatrix (batch × Inputterms), z.B. geteilt zwischen mehreren Outputs.
+
+        Returns:
+            np.ndarray: (batch,) Crisp-Ausgabewerte.
+        """
+        _, agg, t0 = self._strengths_memberships(memberships)
+        return self._defuzzify_agg(agg, method, t0)
+
+    def _defuzzify_agg(self, agg: np.ndarray, method: str = 'centroid', t0: float = None) -> np.ndarray:
+        """
+        Aggregiertes Output-MF und Defuzzifizierung für eine Matrix von Termstärken (batch × Outputterms).
+
+        Returns:
+            np.ndarray: (batch,) Crisp-Ausgabewerte.
+        """
+        stats = self.stats
+        if stats and t0 is None:
+            t0 = time.perf_counter()
+        if self.is_additive and method == 'centroid':
+            if stats:
+                t0 = stats.lap('aggregate', t0, len(agg))
+            out = self.defuzzify_additive(agg)
+        else:
+            ys = self.aggregate_curves(agg)
+            if stats:
+                t0 = stats.lap('aggregate', t0, len(agg))
+            out = getattr(Defuzzifier, method)(self.xs, ys)
+        if stats:
+            stats.lap('defuzzify', t0, len(agg))
+        return out
+
+    def fuzzify_batch(self, crisp_inputs: dict) -> np.ndarray:
+        """
+        Fuzzifiziert Spalten von Crisp-Werten für alle Input-Variablen auf einmal.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+
+        Returns:
+            np.ndarray: (batch × Inputterms) Fuzzifizierungsmatrix, Spalten wie self.input_terms().
+        """
+        return fuzzify_columns(self.input_vars, crisp_inputs)
+
+    def decide_batch(self, crisp_inputs: dict, method: str = 'centroid',
+                     chunk_size: int = 4096) -> np.ndarray:
+        """
+        Berechnet für viele Eingaben direkt die Crisp-Ausgaben.
+        Die Eingaben werden in Blöcken von chunk_size Zeilen verarbeitet,
+        damit die (batch × len(xs))-Zwischenmatrix im Speicher begrenzt bleibt.
+        Im additiven Modell (product/sum) mit 'centroid' entfällt diese Matrix ganz
+        (siehe defuzzify_additive).
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+            method (str): Name der Defuzzifizierungsstrategie.
+            chunk_size (int): Maximale Anzahl Zeilen pro Block.
+
+        Returns:
+            np.ndarray: (batch,) Crisp-Ausgabewerte.
+        """
+        columns = {name: np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+                   for name in self.input_vars}
+        batch = len(next(iter(columns.values()))) if columns else 0
+        out = np.empty(batch)
+        for start in range(0, batch, chunk_size):
+            chunk = {name: col[start:start + chunk_size] for name, col in columns.items()}
+            memberships = self._fuzzify_batch_timed(chunk)
+            out[start:start + chunk_size] = self._decide_memberships(memberships, method)
+        return out
+
+    def input_terms(self) -> list:
+        """
+        Liefert die Spaltenreihenfolge der Fuzzifizierungsmatrix aus infer_batch.
+
+        Returns:
+            list: [(var_name, term_label), ...] in Reihenfolge der Input-Variablen und ihrer Terme.
+        """
+        return [(name, term) for name, var in self.input_vars.items() for term in var.terms]
+
+
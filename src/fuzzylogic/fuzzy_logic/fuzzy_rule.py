@@ -0,0 +1,112 @@
+"""
+FuzzyRule-Modul:
+Definiert eine Fuzzy-Regel ("IF ... THEN ...") für Fuzzy-Logic-Systeme.
+"""
+
+class FuzzyRule:
+    """
+    Eine Fuzzy-Regel nach dem Schema:
+        IF <Antezedenz1> AND <Antezedenz2> ... THEN <Konsequenz>
+    
+    Attributes:
+        antecedents (list): Liste von (var_name, term_label)-Tupeln für die Bedingungen.
+        consequent (tuple): (var_name, term_label) für die Konsequenz.
+    """
+    def __init__(self, antecedents: list, consequent: tuple):
+        """
+        Initialisiert eine neue Fuzzy-Regel.
+
+        Args:
+            antecedents (list): Liste der Bedingungen [(var_name, term_label), ...]
+            consequent (tuple): Konsequenz als (var_name, term_label)
+        """
+        self.antecedents = antecedents
+        self.consequent = consequent
+
+    def evaluate(self, fuzzified_inputs: dict) -> float:
+        """
+        Bewertet die Regel für gegebene fuzzifizierte Eingaben.
+        Die AND-Verknüpfung erfolgt als Minimum der Grade der Antezedenzien.
+
+        Args:
+            fuzzified_inputs (dict): { var_name: {term_label: degree, ...}, ... }
+        
+        Returns:
+            float: Stärke (alpha) der Regelaktivierung (zwischen 0 und 1).
+        """
+        degrees = []
+        for var, term in self.antecedents:
+            deg = fuzzified_inputs[var].get(term, 0.0)
+            degrees.append(deg)
+        return min(degrees) if degrees else 0.0
+
+class RuleList(list):
+    """
+    Liste von FuzzyRule-Objekten, die jede Änderung mitzählt (analog zu TermDict).
+    Dadurch können abgeleitete Caches (z.B. die kompilierte Regelbasis im FuzzyController)
+    Hinzufügen, Entfernen und Ersetzen von Regeln über einen Zahlenvergleich erkennen,
+    statt die ganze Liste pro Inferenz zu vergleichen.
+
+    Attributes:
+        version (int): Wird bei jeder Änderung an der Liste erhöht.
+    """
+    version = 0
+
+    def __init__(self, rules=()):
+        super().__init__(rules)
+        # Auch als Instanzattribut, damit Pickle den Stand nach dem Wiederherstellen der Elemente setzt
+        self.version = 0
+
+    def _touch(self):
+        self.version = self.version + 1
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._touch()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._touch()
+        return result
+
+    def append(self, rule):
+        super().append(rule)
+        self._touch()
+
+    def extend(self, rules):
+        super().extend(rules)
+        self._touch()
+
+    def insert(self, index, rule):
+        super().insert(index, rule)
+        self._touch()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._touch()
+        return result
+
+    def remove(self, rule):
+        super().remove(rule)
+        self._touch()
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._touch()
+
+    def reverse(self):
+        super().reverse()
+        self._touch()
@@ -0,0 +1,253 @@
+"""
+FuzzyVariable-Modul:
+Repräsentiert eine linguistische Variable mit mehreren Fuzzy-Terms (Labels).
+"""
+
+import math
+from collections import OrderedDict
+
+from fuzzylogic.fuzzy_logic.support_index import SupportIndex
+
+class TermDict(dict):
+    """
+    Dict Label -> MembershipFunction, das jede Änderung mitzählt.
+    Dadurch können abgeleitete Caches (z.B. gesampelte Kurven im FuzzyController)
+    erkennen, dass die Terme editiert wurden.
+
+    Attributes:
+        version (int): Wird bei jeder Änderung am Dict erhöht.
+    """
+    version = 0
+
+    def _touch(self):
+        self.version = self.version + 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._touch()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._touch()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._touch()
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._touch()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._touch()
+
+class FuzzifyCache:
+    """
+    Begrenzter LRU-Cache für FuzzyVariable.fuzzify bei quantisierten Eingaben.
+    Eingaben werden auf ein Vielfaches von step gerundet; die Zugehörigkeiten werden am
+    gerundeten Punkt berechnet. Bei step=1 und ganzzahligen Eingaben ist das Ergebnis exakt.
+
+    Attributes:
+        step (float): Quantisierungsschritt.
+        maxsize (int): Maximale Anzahl gecachter Einträge (älteste werden verdrängt).
+        hits (int): Anzahl Cache-Treffer.
+        misses (int): Anzahl Cache-Fehlschläge.
+    """
+
+    def __init__(self, step: float = 1.0, maxsize: int = 1024):
+        self.step = step
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.version = None
+        self._entries = OrderedDict()
+
+    def clear(self):
+        """Leert den Cache (Statistiken bleiben erhalten)."""
+        self._entries.clear()
+
+    def lookup(self, var, x: float) -> dict:
+        """
+        Liefert die Fuzzifizierung von x aus dem Cache oder berechnet sie.
+
+        Args:
+            var (FuzzyVariable): Zugehörige Variable (für Terme und Versionsprüfung).
+            x (float): Crisp-Inputwert.
+
+        Returns:
+            dict: Dict[label, degree] (Kopie, darf vom Aufrufer verändert werden).
+        """
+        if not math.isfinite(x):
+            # NaN/inf lassen sich nicht quantisieren: direkt auswerten wie ohne Cache
+            return var.evaluate(x)
+        if var.version != self.version:
+            self._entries.clear()
+            self.version = var.version
+        key = round(x / self.step)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry)
+        self.misses += 1
+        xq = round(key * self.step, 12)
+        entry = var.evaluate(xq)
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return dict(entry)
+
+    def info(self) -> dict:
+        """
+        Returns:
+            dict: {'hits', 'misses', 'size', 'maxsize', 'step'}
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                "maxsize": self.maxsize, "step": self.step}
+
+class FuzzyVariable:
+    """
+    Eine Fuzzy-Variable besteht aus mehreren linguistischen Termen (z.B. 'low', 'medium', 'high'),
+    die jeweils durch eine Membership Function (MF) beschrieben werden.
+
+    Attributes:
+        name (str): Name der Variable (z.B. 'Health')
+        terms (dict): Mapping von Label (str) auf MembershipFunction
+        domain (tuple): Wertebereich (min, max) der Variable, z.B. für Plotting/Sampling
+        version (tuple): Versionsstempel, der sich bei jeder Änderung an terms oder domain ändert
+        cache (FuzzifyCache | None): Optionaler Memoization-Cache für fuzzify (siehe enable_cache)
+    """
+
+    def __init__(self, name: str, terms: dict, domain: tuple):
+        """
+        Initialisiert eine Fuzzy-Variable.
+
+        Args:
+            name (str): Name der Variable
+            terms (dict): Dict[label, MembershipFunction]
+            domain (tuple): (min, max) Wertebereich für die Variable
+        """
+        self._version = 0
+        self._index = None
+        self._index_version = None
+        self.cache = None
+        self.name = name
+        self.terms = terms
+        self.domain = domain
+
+    @property
+    def terms(self) -> dict:
+        return self._terms
+
+    @terms.setter
+    def terms(self, terms: dict):
+        self._terms = TermDict(terms)
+        self._version += 1
+
+    @property
+    def domain(self) -> tuple:
+        return self._domain
+
+    @domain.setter
+    def domain(self, domain: tuple):
+        self._domain = tuple(domain)
+        self._version += 1
+
+    @property
+    def version(self) -> tuple:
+        return (self._version, self._terms.version)
+
+    @property
+    def support_index(self) -> SupportIndex:
+        """Sortierter Index der Träger-Intervalle (wird nach Änderungen an den Termen neu gebaut)."""
+        version = self.version
+        if version != self._index_version:
+            self._index = SupportIndex.from_terms(self._terms)
+            self._index_version = version
+        return self._index
+
+    def active_terms(self, x: float) -> list:
+        """
+        Liefert die Terme, deren Träger x enthält (per Bisektion im support_index).
+
+        Args:
+            x (float): Crisp-Inputwert
+
+        Returns:
+            list: Labels aller Terme mit möglicherweise μ(x) > 0
+        """
+        return self.support_index.active(x)
+
+    def evaluate(self, x: float) -> dict:
+        """
+        Fuzzifiziert x ohne Memoization. Nur die aktiven Terme werden ausgewertet,
+        alle übrigen erhalten den Grad 0.0.
+
+        Args:
+            x (float): Crisp-Inputwert
+
+        Returns:
+            dict: Dict[label, degree] für alle Terme
+        """
+        terms = self._terms
+        if x != x:
+            # NaN liegt in keinem Träger: alle Terme auswerten, damit NaN wie im Batch-Pfad durchschlägt
+            return {label: mf(x) for label, mf in terms.items()}
+        active = self.support_index.active(x)
+        if len(active) == len(terms):
+            return {label: mf(x) for label, mf in terms.items()}
+        degrees = dict.fromkeys(terms, 0.0)
+        for label in active:
+            degrees[label] = terms[label](x)
+        return degrees
+
+    def enable_cache(self, step: float = 1.0, maxsize: int = 1024) -> FuzzifyCache:
+        """
+        Aktiviert die Memoization von fuzzify für quantisierte Eingaben.
+        Der Cache wird automatisch geleert, wenn terms oder domain geändert werden.
+
+        Args:
+            step (float): Quantisierungsschritt (z.B. 1 für Health, 0.1 für Distance)
+            maxsize (int): Maximale Anzahl Einträge (LRU-Verdrängung)
+
+        Returns:
+            FuzzifyCache: Der Cache (auch über self.cache erreichbar)
+        """
+        self.cache = FuzzifyCache(step, maxsize)
+        return self.cache
+
+    def disable_cache(self):
+        """Deaktiviert die Memoization wieder."""
+        self.cache = None
+
+    def fuzzify(self, x: float) -> dict:
+        """
+        Fuzzifiziert einen Crisp-Wert x.
+        Berechnet für jeden Term/Label die Zugehörigkeit (Degree of Membership).
+
+        Args:
+            x (float): Crisp-Inputwert
+
+        Returns:
+            dict: Dict[label, degree] mit Grad der Zugehörigkeit für jeden Term
+        """
+        if self.cache is not None:
+            return self.cache.lookup(self, x)
+        return self.evaluate(x)
@@ -0,0 +1,142 @@
+"""
+Incremental-Modul:
+Zustandsbehaftete Inferenz über viele Ticks für eine feste Menge von Agenten (eine Zeile pro Agent).
+Pro Tick werden nur die Variablen neu fuzzifiziert, deren Eingabe sich geändert hat, nur die davon
+abhängigen Regeln neu bewertet und nur Agenten defuzzifiziert, deren Termstärken sich geändert haben.
+"""
+
+import numpy as np
+
+class IncrementalInference:
+    """
+    Merkt sich pro Agent Eingaben, Fuzzifizierungsvektor, Regelstärken, Termstärken und Ausgabe
+    des letzten Ticks. Da die Output-Menge nur von den Termstärken abhängt, wird bei unveränderten
+    Termstärken der alte Crisp-Wert übernommen, ohne zu aggregieren oder zu defuzzifizieren.
+
+    Verwendung:
+        inc = IncrementalInference(controller)
+        for tick in ...:
+            outlook = inc.step({'Health': health, 'Enemies': enemies, 'Distance': distance})
+
+    Attributes:
+        controller (FuzzyController): Verwendeter Controller.
+        method (str): Defuzzifizierungsstrategie.
+        counters (dict): Kumulierte Zähler: steps, rows, refuzzified (Zeilen × Variablen),
+            rules (neu bewertete Regel-Zeilen-Paare), defuzzified und skipped (Zeilen).
+    """
+
+    def __init__(self, controller, method: str = 'centroid'):
+        """
+        Args:
+            controller (FuzzyController): Verwendeter Controller.
+            method (str): Defuzzifizierungsstrategie.
+        """
+        self.controller = controller
+        self.method = method
+        self.counters = dict.fromkeys(("steps", "rows", "refuzzified", "rules", "defuzzified", "skipped"), 0)
+        self.reset()
+
+    def reset(self):
+        """Verwirft den gespeicherten Zustand; der nächste step rechnet alle Zeilen vollständig."""
+        self._rule_base = None
+        self._key = None
+        self._inputs = None
+
+    def _prepare(self):
+        """
+        Leitet aus der kompilierten Regelbasis ab, welche Spalten und Regeln zu jeder
+        Input-Variable gehören. Ändert sich Regelbasis, Output oder Operator, wird der Zustand verworfen.
+        """
+        controller = self.controller
+        rule_base = controller.compiled_rules
+        # Die Regelbasis selbst festhalten (wie InferenceWorkspace): eine id könnte nach ihrer
+        # Freigabe an eine neue Regelbasis vergeben werden
+        key = (controller._curve_key, controller.implication, controller.aggregation)
+        if rule_base is self._rule_base and key == self._key:
+            return False
+        names = list(controller.input_vars)
+        input_terms = rule_base.input_terms
+        self._names = names
+        self._columns = {name: [i for i, (var, _) in enumerate(input_terms) if var == name]
+                         for name in names}
+        # Regel hängt von einer Variable ab, wenn einer ihrer aktiven Antezedenz-Slots auf deren Spalten zeigt
+        var_of_col = np.array([names.index(var) for var, _ in input_terms], dtype=np.intp)
+        slot_vars = var_of_col[rule_base.antecedent_idx] if len(input_terms) else rule_base.antecedent_idx
+        self._rules = {name: np.flatnonzero(((slot_vars == i) & rule_base.antecedent_mask).any(axis=1)
+                                            & rule_base.live)
+                       for i, name in enumerate(names)}
+        self._rule_base = rule_base
+        self._key = key
+        self._inputs = None
+        return True
+
+    def step(self, crisp_inputs: dict) -> np.ndarray:
+        """
+        Berechnet die Ausgaben aller Agenten für einen Tick.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (Agenten,) oder Skalar
+                (ein Agent). Die Anzahl der Agenten muss zwischen Ticks gleich bleiben,
+                sonst wird vollständig neu gerechnet.
+
+        Returns:
+            np.ndarray: (Agenten,) Crisp-Ausgabewerte.
+        """
+        controller = self.controller
+        self._prepare()
+        inputs = np.column_stack([np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+                                  for name in self._names])
+        self.counters["steps"] += 1
+        self.counters["rows"] += len(inputs)
+
+        if self._inputs is None or self._inputs.shape != inputs.shape:
+            return self._full(inputs)
+
+        rule_base = controller.compiled_rules
+        # NaN != NaN, daher zusätzlich auf "beide NaN" prüfen, sonst würde jede NaN-Zeile neu gerechnet
+        changed = (inputs != self._inputs) & ~(np.isnan(inputs) & np.isnan(self._inputs))
+        dirty_rows = changed.any(axis=1)
+        if not dirty_rows.any():
+            self.counters["skipped"] += len(inputs)
+            return self._outputs.copy()
+
+        for j, name in enumerate(self._names):
+            rows = np.flatnonzero(changed[:, j])
+            if not len(rows):
+                continue
+            terms = controller.input_vars[name].terms
+            for col in self._columns[name]:
+                self._memberships[rows, col] = terms[rule_base.input_terms[col][1]](inputs[rows, j])
+            rules = self._rules[name]
+            if len(rules):
+                sub = self._memberships[rows][:, rule_base.antecedent_idx[rules]]
+                self._strengths[np.ix_(rows, rules)] = sub.min(axis=-1)
+            self.counters["refuzzified"] += len(rows)
+            self.counters["rules"] += len(rows) * len(rules)
+        self._inputs = inputs
+
+        rows = np.flatnonzero(dirty_rows)
+        agg = rule_base.aggregate(self._strengths[rows], controller.aggregation)
+        moved = (agg != self._agg[rows]).any(axis=1)
+        rows, agg = rows[moved], agg[moved]
+        self._agg[rows] = agg
+        if len(rows):
+            self._outputs[rows] = controller._defuzzify_agg(agg, self.method)
+        self.counters["defuzzified"] += len(rows)
+        self.counters["skipped"] += len(inputs) - len(rows)
+        return self._outputs.copy()
+
+    def _full(self, inputs: np.ndarray) -> np.ndarray:
+        """Vollständige Berechnung aller Zeilen (erster Tick oder geänderte Agentenzahl)."""
+        controller = self.controller
+        rule_base = controller.compiled_rules
+        columns = {name: inputs[:, j] for j, name in enumerate(self._names)}
+        self._memberships = controller.fuzzify_batch(columns)
+        self._strengths = rule_base.firing_strengths(self._memberships)
+        self._agg = rule_base.aggregate(self._strengths, controller.aggregation)
+        self._outputs = np.asarray(controller._defuzzify_agg(self._agg, self.method), dtype=float)
+        self._inputs = inputs
+        self.counters["refuzzified"] += inputs.size
+        self.counters["rules"] += self._strengths.size
+        self.counters["defuzzified"] += len(inputs)
+        return self._outputs.copy()
@@ -0,0 +1,202 @@
+"""
+LookupTable-Modul:
+Kompiliert einen FuzzyController in eine dichte Tabelle über den Input-Domänen (Control Surface).
+Entscheidungen werden danach per multilinearer Interpolation in O(1) beantwortet.
+Tabellen können gespeichert und per Memory-Mapping von vielen Prozessen geteilt werden.
+"""
+
+import itertools
+import json
+import numpy as np
+
+def _npy_path(path: str) -> str:
+    """Ergänzt die Endung .npy, wie es np.save ohnehin tun würde."""
+    path = str(path)
+    return path if path.endswith('.npy') else path + '.npy'
+
+def _check_grid(names: list, domains: list, shape: list):
+    """
+    Prüft, ob sich über den Achsen interpolieren lässt.
+
+    Raises:
+        ValueError: Bei weniger als 2 Gitterpunkten oder leerer Domäne (min >= max) auf einer Achse.
+    """
+    if len(shape) != len(names):
+        raise ValueError(f"Tabelle hat {len(shape)} Achsen, erwartet {len(names)} ({', '.join(names)})")
+    for name, (lo, hi), n in zip(names, domains, shape):
+        if n < 2:
+            raise ValueError(f"Achse '{name}' braucht mindestens 2 Gitterpunkte, nicht {n}")
+        if not lo < hi:
+            raise ValueError(f"Achse '{name}' hat keine gültige Domäne: ({lo}, {hi})")
+
+class ControlSurface:
+    """
+    Vorberechnete Control Surface eines FuzzyControllers.
+
+    Attributes:
+        names (list): Namen der Input-Variablen (Achsenreihenfolge der Tabelle).
+        domains (list): (min, max) je Achse, aus FuzzyVariable.domain.
+        table (np.ndarray): Crisp-Ausgaben auf dem Gitter, eine Achse pro Input-Variable.
+        method (str): Defuzzifizierungsstrategie, mit der die Tabelle erzeugt wurde.
+        max_error (float | None): Maximale gemessene Abweichung zur exakten Inferenz.
+    """
+
+    def __init__(self, names: list, domains: list, table: np.ndarray, method: str,
+                 max_error: float = None):
+        """
+        Initialisiert die Control Surface aus einer bereits berechneten Tabelle.
+        Im Normalfall wird ControlSurface.compile oder ControlSurface.load verwendet.
+
+        Raises:
+            ValueError: Wenn eine Achse weniger als 2 Gitterpunkte oder eine leere Domäne hat.
+        """
+        self.names = list(names)
+        self.domains = [tuple(map(float, d)) for d in domains]
+        _check_grid(self.names, self.domains, table.shape)
+        self.table = table
+        self.method = method
+        self.max_error = max_error
+
+    @property
+    def axes(self) -> list:
+        """Gitterpunkte je Achse (np.linspace über die Domäne)."""
+        return [np.linspace(lo, hi, n) for (lo, hi), n in zip(self.domains, self.table.shape)]
+
+    @classmethod
+    def compile(cls, controller, points=33, method: str = 'centroid',
+                validate_samples: int = 10000, seed: int = 0):
+        """
+        Sampelt den Controller auf einem regulären Gitter über alle Input-Domänen.
+
+        Args:
+            controller (FuzzyController): Zu kompilierender Controller.
+            points (int | dict): Gitterpunkte pro Achse, global oder als Name -> Anzahl.
+            method (str): Name der Defuzzifizierungsstrategie.
+            validate_samples (int): Anzahl zufälliger Punkte, an denen der Interpolationsfehler
+                gegen den exakten Controller gemessen wird (0 = keine Validierung).
+            seed (int): Seed für die Validierungspunkte.
+
+        Returns:
+            ControlSurface: Kompilierte Tabelle.
+
+        Raises:
+            ValueError: Wenn eine Achse weniger als 2 Gitterpunkte oder eine leere Domäne hat.
+        """
+        names = list(controller.input_vars)
+        domains = [controller.input_vars[name].domain for name in names]
+        shape = [points[name] if isinstance(points, dict) else points for name in names]
+        _check_grid(names, domains, shape)  # vor dem Sampling, nicht erst im Konstruktor
+        axes = [np.linspace(lo, hi, n) for (lo, hi), n in zip(domains, shape)]
+        grid = np.meshgrid(*axes, indexing='ij')
+        values = controller.decide_batch({name: g.ravel() for name, g in zip(names, grid)}, method)
+        surface = cls(names, domains, values.reshape(shape), method)
+        if validate_samples:
+            surface.max_error = surface.error_against(controller, validate_samples, seed)
+        return surface
+
+    def error_against(self, controller, samples: int = 10000, seed: int = 0) -> float:
+        """
+        Misst die maximale absolute Abweichung zwischen Interpolation und exaktem Controller
+        an zufälligen Punkten der Input-Domänen.
+
+        Args:
+            controller (FuzzyController): Referenz-Controller.
+            samples (int): Anzahl zufälliger Testpunkte.
+            seed (int): Seed für den Zufallsgenerator.
+
+        Returns:
+            float: Maximaler absoluter Fehler.
+        """
+        rng = np.random.default_rng(seed)
+        inputs = {name: rng.uniform(lo, hi, samples)
+                  for name, (lo, hi) in zip(self.names, self.domains)}
+        exact = controller.decide_batch(inputs, self.method)
+        return float(np.abs(self.lookup(inputs) - exact).max())
+
+    def lookup(self, crisp_inputs: dict) -> np.ndarray:
+        """
+        Multilineare Interpolation der Tabelle für beliebig viele Eingaben.
+        Werte außerhalb der Domäne werden auf den Rand geklemmt, NaN-Eingaben liefern NaN
+        (wie decide_batch).
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert oder Array (batch,).
+
+        Returns:
+            np.ndarray: (batch,) interpolierte Crisp-Ausgaben.
+        """
+        lower, frac = [], []
+        missing = None
+        for name, (lo, hi), n in zip(self.names, self.domains, self.table.shape):
+            x = np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+            pos = np.clip((x - lo) / (hi - lo) * (n - 1), 0, n - 1)
+            nan = np.isnan(pos)
+            if nan.any():
+                # NaN nicht in einen Index casten (undefiniert); Zeile rechnen und danach maskieren
+                pos[nan] = 0.0
+                missing = nan if missing is None else missing | nan
+            i0 = np.minimum(pos.astype(np.intp), n - 2)
+            lower.append(i0)
+            frac.append(pos - i0)
+
+        out = 0.0
+        # Summe über alle 2^d Ecken der Gitterzelle, gewichtet mit dem Produkt der Anteile
+        for corner in itertools.product((0, 1), repeat=len(self.names)):
+            weight = 1.0
+            idx = []
+            for bit, i0, f in zip(corner, lower, frac):
+                weight = weight * (f if bit else 1 - f)
+                idx.append(i0 + bit)
+            out = out + weight * self.table[tuple(idx)]
+        if missing is not None:
+            out = np.where(missing, np.nan, out)
+        return np.asarray(out)
+
+    def decide(self, crisp_inputs: dict) -> float:
+        """
+        Interpoliert eine einzelne Entscheidung.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+
+        Returns:
+            float: Interpolierter Crisp-Ausgabewert.
+        """
+        return float(self.lookup(crisp_inputs)[0])
+
+    def save(self, path: str):
+        """
+        Speichert die Tabelle als .npy (memory-mappable) und die Metadaten als JSON daneben.
+
+        Args:
+            path (str): Zielpfad der Tabelle, z.B. 'outlook.npy' (Metadaten: 'outlook.npy.json').
+        """
+        path = _npy_path(path)
+        np.save(path, np.ascontiguousarray(self.table))
+        meta = {
+            "names": self.names,
+            "domains": self.domains,
+            "method": self.method,
+            "max_error": self.max_error,
+        }
+        with open(f"{path}.json", "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True):
+        """
+        Lädt eine gespeicherte Tabelle. Mit mmap=True wird sie nur eingeblendet,
+        sodass sich mehrere Prozesse dieselben Speicherseiten teilen.
+
+        Args:
+            path (str): Pfad der .npy-Tabelle.
+            mmap (bool): Tabelle read-only memory-mappen statt einlesen.
+
+        Returns:
+            ControlSurface: Geladene Tabelle.
+        """
+        path = _npy_path(path)
+        with open(f"{path}.json", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        table = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(meta["names"], meta["domains"], table, meta["method"], meta["max_error"])
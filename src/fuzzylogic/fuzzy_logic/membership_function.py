@@ -0,0 +1,153 @@
+"""
+MembershipFunction-Modul:
+Wrappt eine Funktion, die einen Wert auf einen Zugehörigkeitsgrad [0..1] abbildet.
+Erlaubt, beliebige Python-Funktionen als Fuzzy-Membership Functions zu verwenden.
+ParametricMembershipFunction ist die Basis für MFs mit bekannter Form und Parametern
+(siehe fuzzylogic.membership_function: Trapezoid, Triangle, Bell).
+"""
+
+from functools import partial
+
+import numpy as np
+
+class MembershipFunction:
+    """
+    Eine MembershipFunction kapselt eine numerische Funktion,
+    die einen Inputwert x ∈ ℝ auf einen Zugehörigkeitsgrad μ ∈ [0, 1] abbildet.
+    Damit kann jede MF (Trapez, Dreieck, Bell etc.) einfach als Python-Callable genutzt werden.
+
+    Attributes:
+        func (callable): Eine Funktion x -> μ(x), die den Zugehörigkeitsgrad zurückgibt.
+        vertices (tuple | None): (xs, ys) Eckpunkte, falls die MF stückweise linear ist, sonst None.
+    """
+
+    __slots__ = ("func", "vertices")
+
+    def __init__(self, func, vertices=None):
+        """
+        Initialisiert eine MembershipFunction mit einer gegebenen Funktion.
+
+        Args:
+            func (callable): Funktion, die für x den Zugehörigkeitsgrad μ(x) berechnet.
+            vertices (tuple, optional): (xs, ys) Eckpunkte einer stückweise linearen MF.
+                Außerhalb der Eckpunkte gilt μ = 0.
+        """
+        self.func = func
+        self.vertices = vertices
+
+    def breakpoints(self):
+        """
+        Liefert die Eckpunkte der MF, falls sie stückweise linear ist.
+        Wird für die exakte (analytische) Defuzzifizierung verwendet.
+
+        Returns:
+            tuple | None: (xs, ys) als np.ndarrays oder None für nicht-lineare MFs (z.B. Bell).
+        """
+        if self.vertices is None:
+            return None
+        xs, ys = self.vertices
+        return np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+
+    def support(self, eps: float = 0.0) -> tuple:
+        """
+        Intervall, außerhalb dessen μ(x) <= eps gilt.
+        Für beliebige Funktionen ohne Eckpunkte ist das die gesamte reelle Achse.
+
+        Args:
+            eps (float): Schwelle, unterhalb derer μ als 0 gilt.
+
+        Returns:
+            tuple: (lo, hi)
+        """
+        if self.vertices is None:
+            return -np.inf, np.inf
+        xs, _ = self.vertices
+        return float(min(xs)), float(max(xs))
+
+    def scalar(self, x: float) -> float:
+        """
+        μ(x) für einen einzelnen Python-Float. Parametrische MFs werten dabei eine reine
+        Python-Formel aus (keine NumPy-Temporärarrays), siehe InferenceWorkspace.
+
+        Args:
+            x (float): Eingabewert
+
+        Returns:
+            float: Zugehörigkeitsgrad
+        """
+        return float(self.func(x))
+
+    def __call__(self, x):
+        """
+        Erlaubt das direkte Aufrufen des Objekts wie eine Funktion: mf(x)
+        Ist die gekapselte Funktion vektorisiert, kann x auch ein np.ndarray sein.
+
+        Args:
+            x (float | np.ndarray): Eingabewert(e)
+
+        Returns:
+            float | np.ndarray: Zugehörigkeitsgrad(e) im Bereich [0, 1]
+                (float bei skalarem Input, sonst Array in der Form von x)
+        """
+        y = self.func(x)
+        if np.ndim(y) == 0:
+            return float(y)
+        return np.asarray(y, dtype=float)
+
+class ParametricMembershipFunction(MembershipFunction):
+    """
+    MembershipFunction mit bekannter Form: Typ-Tag (kind) plus kompaktes Parameter-Array.
+    Die Form wird von Unterklassen über die Modul-Funktion formula(x, **params) und die
+    Parameternamen param_names festgelegt; optional liefert scalar_formula(x, **params)
+    dieselbe Form für einzelne Floats ohne NumPy.
+    Instanzen sind picklebar (nur Klasse und Parameter werden übertragen) und hashbar;
+    gleiche Form mit gleichen Parametern ergibt gleiche Hashes, z.B. für Cache-Keys.
+
+    Attributes:
+        kind (str): Typ-Tag, entspricht dem Schlüssel in config.MF_TYPES.
+        param_names (tuple): Namen der Parameter, wie in config.MF_TYPES[kind]['params'].
+        params (np.ndarray): Nur-lesbares float64-Array der Formparameter.
+    """
+
+    __slots__ = ("params", "_scalar")
+    kind = None
+    param_names = ()
+    formula = None
+    scalar_formula = None
+
+    def __init__(self, *params):
+        """
+        Args:
+            *params (float): Formparameter in der Reihenfolge von param_names.
+        """
+        self.params = np.array(params, dtype=float)
+        self.params.flags.writeable = False
+        values = tuple(self.params.tolist())
+        kwargs = dict(zip(self.param_names, values))
+        func = partial(type(self).formula, **kwargs)
+        scalar = type(self).scalar_formula
+        self._scalar = partial(scalar, **kwargs) if scalar is not None else None
+        super().__init__(func, self._vertices(*values))
+
+    def _vertices(self, *params):
+        """Eckpunkte (xs, ys) der Form oder None, falls nicht stückweise linear."""
+        return None
+
+    def scalar(self, x: float) -> float:
+        if self._scalar is None:
+            return float(self.func(x))
+        return self._scalar(x)
+
+    def __reduce__(self):
+        return type(self), tuple(self.params.tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, ParametricMembershipFunction):
+            return NotImplemented
+        return type(self) is type(other) and np.array_equal(self.params, other.params)
+
+    def __hash__(self):
+        return hash((self.kind, self.params.tobytes()))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(repr(p) for p in self.params.tolist())})"
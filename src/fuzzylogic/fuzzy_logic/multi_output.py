@@ -0,0 +1,141 @@
+"""
+MultiOutput-Modul:
+Controller mit mehreren Output-Variablen über denselben Inputs (z.B. Outlook, Aggression, Rückzug).
+Die Fuzzifizierung läuft einmal pro Eingabe; jede Regel wird genau einmal im Teil-Controller
+ihres Outputs bewertet, Aggregation und Defuzzifizierung laufen vektorisiert je Output.
+"""
+
+import numpy as np
+from fuzzylogic.fuzzy_logic.fuzzy_controller import FuzzyController
+from fuzzylogic.fuzzy_logic.fuzzy_rule import RuleList
+
+class MultiOutputController:
+    """
+    Setzt sich aus einem FuzzyController je Output-Variable zusammen. Alle Teil-Controller teilen
+    sich das input_vars-Dict; die Regeln werden über ihre Konsequenz (out_var, term) verteilt.
+
+    Attributes:
+        input_vars (dict): Name -> FuzzyVariable für alle Eingabegrößen.
+        output_vars (dict): Name -> FuzzyVariable der Outputs.
+        rules (RuleList): Gemeinsame Regelbasis aller Outputs (zählt Änderungen mit).
+        controllers (dict): Output-Name -> FuzzyController mit den Regeln dieses Outputs.
+    """
+
+    def __init__(self, input_vars: dict, output_vars: dict, rules: list, **kwargs):
+        """
+        Args:
+            input_vars (dict): Name -> FuzzyVariable für Input-Variablen.
+            output_vars (dict): Name -> FuzzyVariable für Output-Variablen.
+            rules (list): FuzzyRule-Objekte; consequent[0] wählt den Output.
+            **kwargs: Weitere Argumente für jeden FuzzyController
+                (resolution, implication, aggregation).
+
+        Raises:
+            ValueError: Wenn keine Output-Variable angegeben ist.
+        """
+        if not output_vars:
+            raise ValueError("Mindestens eine Output-Variable erforderlich")
+        self.input_vars = input_vars
+        self.output_vars = output_vars
+        self._rules_version = 0
+        self.rules = rules
+        self.controllers = {name: FuzzyController(input_vars, var, [], **kwargs)
+                            for name, var in output_vars.items()}
+        self._routed_key = None
+        self._route()
+
+    @property
+    def rules(self) -> RuleList:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list):
+        self._rules = RuleList(rules)
+        self._rules_version += 1
+
+    def _route(self):
+        """
+        Verteilt die Regeln auf die Teil-Controller, falls sich die Regelliste geändert hat.
+
+        Raises:
+            KeyError: Wenn eine Regel einen unbekannten Output referenziert.
+        """
+        key = (self._rules_version, self._rules.version)  # wie FuzzyController._rules_cache_key
+        if key == self._routed_key:
+            return
+        routed = {name: [] for name in self.controllers}
+        for rule in self.rules:
+            routed[rule.consequent[0]].append(rule)
+        for name, controller in self.controllers.items():
+            controller.rules = routed[name]
+        self._routed_key = key
+
+    def _first(self) -> FuzzyController:
+        return next(iter(self.controllers.values()))
+
+    def input_terms(self) -> list:
+        """Spaltenreihenfolge der gemeinsamen Fuzzifizierungsmatrix."""
+        return self._first().input_terms()
+
+    def infer(self, crisp_inputs: dict):
+        """
+        Einzel-Inferenz für alle Outputs mit einer gemeinsamen Fuzzifizierung.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+
+        Returns:
+            fuzzified (dict): Für jede Inputvariable die Fuzzy-Zugehörigkeitswerte zum Input.
+            agg (dict): Output-Name -> {Outputterm: Stärke}.
+            ys (dict): Output-Name -> aggregierte Output-MF über controllers[name].xs.
+        """
+        self._route()
+        fuzzified = {name: var.fuzzify(crisp_inputs[name]) for name, var in self.input_vars.items()}
+        memberships = np.array([fuzzified[name][term] for name, term in self.input_terms()])
+        agg, ys = {}, {}
+        for name, controller in self.controllers.items():
+            agg[name], ys[name] = controller._infer_memberships(memberships)
+        return fuzzified, agg, ys
+
+    def decide(self, crisp_inputs: dict, method='centroid') -> dict:
+        """
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+            method (str | dict): Defuzzifizierungsstrategie, global oder als Output-Name -> Methode.
+
+        Returns:
+            dict: Output-Name -> Crisp-Wert.
+        """
+        _, _, ys = self.infer(crisp_inputs)
+        return {name: controller.defuzzify(ys[name], _method_for(method, name))
+                for name, controller in self.controllers.items()}
+
+    def decide_batch(self, crisp_inputs: dict, method='centroid', chunk_size: int = 4096) -> dict:
+        """
+        Vektorisierte Entscheidung für alle Outputs. Pro Block wird einmal fuzzifiziert,
+        danach bewertet jeder Teil-Controller nur seine Regeln auf der gemeinsamen Matrix.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+            method (str | dict): Defuzzifizierungsstrategie, global oder als Output-Name -> Methode.
+            chunk_size (int): Maximale Anzahl Zeilen pro Block.
+
+        Returns:
+            dict: Output-Name -> (batch,) Crisp-Ausgabewerte.
+        """
+        self._route()
+        first = self._first()
+        columns = {name: np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+                   for name in self.input_vars}
+        batch = len(next(iter(columns.values()))) if columns else 0
+        out = {name: np.empty(batch) for name in self.controllers}
+        for start in range(0, batch, chunk_size):
+            chunk = {name: col[start:start + chunk_size] for name, col in columns.items()}
+            memberships = first._fuzzify_batch_timed(chunk)
+            for name, controller in self.controllers.items():
+                out[name][start:start + chunk_size] = controller._decide_memberships(
+                    memberships, _method_for(method, name))
+        return out
+
+def _method_for(method, name: str) -> str:
+    return method.get(name, 'centroid') if isinstance(method, dict) else method
@@ -0,0 +1,100 @@
+"""
+Profiling-Modul:
+Optionale Instrumentierung des FuzzyControllers. Erfasst pro Pipeline-Stufe (Fuzzifizierung,
+Regelbewertung, Aggregation, Defuzzifizierung) Laufzeit und Aufrufzahl, gefeuerte vs. übersprungene
+Regeln sowie Batchgrößen. Ist kein InferenceStats-Objekt am Controller gesetzt, kostet das nur
+eine Attributprüfung pro Stufe.
+"""
+
+import collections
+import time
+
+#: Reihenfolge der Pipeline-Stufen
+STAGES = ("fuzzify", "rules", "aggregate", "defuzzify")
+
+class InferenceStats:
+    """
+    Sammelt Zähler und Zeiten für einen FuzzyController.
+
+    Attributes:
+        hook (callable | None): Wird nach jeder Stufe als hook(stage, seconds, info) aufgerufen,
+            z.B. um Werte an eine Metrik-Pipeline zu exportieren. info enthält 'batch' und
+            bei der Stufe 'rules' zusätzlich 'fired' und 'skipped'.
+    """
+
+    def __init__(self, hook=None):
+        """
+        Args:
+            hook (callable, optional): Callback hook(stage, seconds, info).
+        """
+        self.hook = hook
+        self.reset()
+
+    def reset(self):
+        """Setzt alle Zähler zurück."""
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.rules_fired = 0
+        self.rules_skipped = 0
+        self.rows = 0
+        self.batch_sizes = collections.Counter()
+
+    def lap(self, stage: str, t0: float, batch: int = 1, **info) -> float:
+        """
+        Verbucht die seit t0 vergangene Zeit auf eine Stufe.
+
+        Args:
+            stage (str): Name der Stufe (siehe STAGES).
+            t0 (float): Startzeit (time.perf_counter()).
+            batch (int): Anzahl der in dieser Stufe verarbeiteten Zeilen.
+            **info: Zusatzinformationen für den Hook.
+
+        Returns:
+            float: Aktuelle Zeit, als Startzeit für die nächste Stufe.
+        """
+        now = time.perf_counter()
+        self.seconds[stage] += now - t0
+        self.calls[stage] += 1
+        if self.hook is not None:
+            self.hook(stage, now - t0, dict(info, batch=batch))
+        return now
+
+    def count_rules(self, strengths, batch: int = 1, total: int = None):
+        """
+        Zählt gefeuerte (Stärke > 0) und übersprungene Regeln sowie die Batchgröße.
+
+        Args:
+            strengths (np.ndarray): (Regeln,) oder (batch × Regeln) Aktivierungsstärken.
+            batch (int): Anzahl Zeilen.
+            total (int, optional): Gesamtzahl Regel-Auswertungen, falls strengths nur die
+                ausgewerteten Regeln enthält (sparse Bewertung). Default: strengths.size.
+
+        Returns:
+            dict: {'fired', 'skipped'} für diesen Aufruf.
+        """
+        fired = int((strengths > 0).sum())
+        skipped = (int(strengths.size) if total is None else total) - fired
+        self.rules_fired += fired
+        self.rules_skipped += skipped
+        self.rows += batch
+        self.batch_sizes[batch] += 1
+        return {"fired": fired, "skipped": skipped}
+
+    def snapshot(self) -> dict:
+        """
+        Momentaufnahme aller Zähler.
+
+        Returns:
+            dict: seconds, calls und mean_us je Stufe, rules_fired, rules_skipped, rows
+                und batch_sizes (Größe -> Anzahl).
+        """
+        return {
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "mean_us": {stage: (self.seconds[stage] / self.calls[stage] * 1e6 if self.calls[stage] else 0.0)
+                        for stage in STAGES},
+            "rules_fired": self.rules_fired,
+            "rules_skipped": self.rules_skipped,
+            "rows": self.rows,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+        }
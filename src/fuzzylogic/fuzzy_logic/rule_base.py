@@ -0,0 +1,226 @@
+"""
+RuleBase-Modul:
+Kompiliert eine Liste von FuzzyRule-Objekten in Index-Arrays, sodass Regelbewertung und
+Aggregation als NumPy-Reduktionen statt als Python-Schleifen über Dicts laufen.
+"""
+
+import numpy as np
+
+def _scatter(strengths: np.ndarray, cons: np.ndarray, n_terms: int, method: str) -> np.ndarray:
+    """Reduziert die Spalten von strengths nach Konsequenz-Index cons mit dem Aggregationsoperator."""
+    shape = strengths.shape[:-1] + (n_terms,)
+    if method == 'max':
+        agg = np.zeros(shape)
+        with np.errstate(invalid='ignore'):  # NaN-Stärken (NaN-Eingaben) bleiben NaN
+            np.maximum.at(agg, (Ellipsis, cons), strengths)
+    elif method == 'sum':
+        agg = np.zeros(shape)
+        np.add.at(agg, (Ellipsis, cons), strengths)
+    elif method == 'probor':
+        # 1 - Π(1 - w): über das Produkt der Komplemente
+        rest = np.ones(shape)
+        np.multiply.at(rest, (Ellipsis, cons), 1.0 - strengths)
+        agg = 1.0 - rest
+    else:
+        raise ValueError(f"Unbekannter Aggregationsoperator: {method}")
+    return agg
+
+class CompiledRuleBase:
+    """
+    Kompilierte Darstellung einer Regelbasis.
+    Jede Antezedenz wird auf eine Spalte der Fuzzifizierungsmatrix abgebildet
+    (Spaltenreihenfolge wie input_terms), jede Konsequenz auf einen Outputterm-Index.
+
+    Attributes:
+        input_terms (list): [(var_name, term_label), ...] Spalten der Fuzzifizierungsmatrix.
+        output_terms (list): Labels der Outputterms (Spalten von agg).
+        antecedent_idx (np.ndarray): (Regeln × Slots) int, Spaltenindex pro Antezedenz-Slot.
+            Leere Slots wiederholen den ersten Index der Regel (min bleibt unverändert).
+        antecedent_mask (np.ndarray): (Regeln × Slots) bool, False = "keine Bedingung".
+        consequent_idx (np.ndarray): (Regeln,) int, Index des Outputterms jeder Regel.
+        live (np.ndarray): (Regeln,) bool, False für Regeln, die nie feuern können
+            (keine Antezedenzien oder unbekannter Term).
+        postings_ptr (np.ndarray): (Inputterms + 1,) int, CSR-Zeiger des invertierten Index.
+        postings (np.ndarray): Regelindizes je Inputterm-Spalte; die Regeln der Spalte c liegen in
+            postings[postings_ptr[c]:postings_ptr[c + 1]] (nur lebende Regeln).
+        arity (np.ndarray): (Regeln,) int, Anzahl Antezedenzien je Regel.
+        group_order (np.ndarray | None): Regelreihenfolge, in der gleiche Konsequenzen zusammenhängend
+            liegen (None, wenn die Regeln bereits gruppiert sind, z.B. nach optimize_rules).
+        group_starts (np.ndarray): Startposition jeder Konsequenz-Gruppe in dieser Reihenfolge.
+        group_terms (np.ndarray): Outputterm-Index jeder Gruppe.
+    """
+
+    def __init__(self, input_terms: list, output_terms: list, antecedent_idx: np.ndarray,
+                 antecedent_mask: np.ndarray, consequent_idx: np.ndarray, live: np.ndarray):
+        """
+        Initialisiert die kompilierte Regelbasis aus bereits berechneten Index-Arrays.
+        Im Normalfall wird stattdessen CompiledRuleBase.compile verwendet.
+        """
+        self.input_terms = input_terms
+        self.output_terms = output_terms
+        self.antecedent_idx = antecedent_idx
+        self.antecedent_mask = antecedent_mask
+        self.consequent_idx = consequent_idx
+        self.live = live
+        self._build_postings()
+        self._build_groups()
+
+    def _build_postings(self):
+        """Baut den invertierten Index (Inputterm-Spalte -> Regeln) aus den Index-Arrays."""
+        rows, slots = np.nonzero(self.antecedent_mask & self.live[:, None])
+        cols = self.antecedent_idx[rows, slots]
+        order = np.argsort(cols, kind='stable')
+        self.postings = rows[order].astype(np.intp)
+        counts = np.bincount(cols, minlength=len(self.input_terms))
+        self.postings_ptr = np.concatenate(([0], np.cumsum(counts))).astype(np.intp)
+        self.arity = self.antecedent_mask.sum(axis=1)
+        self._live_rules = np.flatnonzero(self.live)
+
+    def _build_groups(self):
+        """Gruppiert die Regeln nach Konsequenz, damit Max-Aggregation eine einzige reduceat-Reduktion ist."""
+        def runs(cons):
+            return np.flatnonzero(np.r_[True, cons[1:] != cons[:-1]]) if len(cons) \
+                else np.empty(0, dtype=np.intp)
+
+        cons = self.consequent_idx
+        starts = runs(cons)
+        if len(np.unique(cons[starts])) == len(starts):
+            # Jede Konsequenz bildet bereits genau einen zusammenhängenden Block
+            self.group_order = None
+        else:
+            self.group_order = np.argsort(cons, kind='stable')
+            cons = cons[self.group_order]
+            starts = runs(cons)
+        self.group_starts = starts
+        self.group_terms = cons[starts]
+
+    @classmethod
+    def compile(cls, rules: list, input_vars: dict, output_terms: list):
+        """
+        Übersetzt FuzzyRule-Objekte in Index-Arrays.
+
+        Args:
+            rules (list): Liste von FuzzyRule-Objekten.
+            input_vars (dict): Name -> FuzzyVariable der Eingaben.
+            output_terms (list): Labels der Outputterms in Spaltenreihenfolge.
+
+        Returns:
+            CompiledRuleBase: Kompilierte Regelbasis.
+
+        Raises:
+            KeyError: Wenn eine Regel eine unbekannte Input-Variable oder einen unbekannten
+                Outputterm referenziert (wie bei der ungecompilten Auswertung).
+        """
+        input_terms = [(name, term) for name, var in input_vars.items() for term in var.terms]
+        col_of = {key: i for i, key in enumerate(input_terms)}
+        out_of = {term: k for k, term in enumerate(output_terms)}
+
+        width = max((len(rule.antecedents) for rule in rules), default=0)
+        width = max(width, 1)
+        idx = np.zeros((len(rules), width), dtype=np.intp)
+        mask = np.zeros((len(rules), width), dtype=bool)
+        cons = np.empty(len(rules), dtype=np.intp)
+        live = np.zeros(len(rules), dtype=bool)
+
+        for j, rule in enumerate(rules):
+            cols = []
+            for var, term in rule.antecedents:
+                if var not in input_vars:
+                    raise KeyError(var)
+                cols.append(col_of.get((var, term), -1))
+            cons[j] = out_of[rule.consequent[1]]
+            if not cols or -1 in cols:
+                continue  # Unbekannter Term -> Grad 0, Regel feuert nie
+            live[j] = True
+            idx[j, :len(cols)] = cols
+            idx[j, len(cols):] = cols[0]
+            mask[j, :len(cols)] = True
+        return cls(input_terms, list(output_terms), idx, mask, cons, live)
+
+    def firing_strengths(self, memberships: np.ndarray) -> np.ndarray:
+        """
+        Bewertet alle Regeln als Minimum über ihre Antezedenz-Spalten (Min-AND).
+
+        Args:
+            memberships (np.ndarray): (Inputterms,) oder (batch × Inputterms) Fuzzifizierungswerte.
+
+        Returns:
+            np.ndarray: (Regeln,) bzw. (batch × Regeln) Aktivierungsstärken.
+        """
+        strengths = memberships[..., self.antecedent_idx].min(axis=-1)
+        strengths *= self.live
+        return strengths
+
+    def candidate_rules(self, active_cols) -> np.ndarray:
+        """
+        Ermittelt über den invertierten Index die Regeln, deren Antezedenzien alle aktiv sind.
+        Die Kosten hängen nur von den Regeln der aktiven Spalten ab, nicht von der Größe der Regelbasis.
+
+        Args:
+            active_cols (iterable): Indizes der Inputterm-Spalten mit Grad > 0.
+
+        Returns:
+            np.ndarray: Aufsteigende Regelindizes.
+        """
+        ptr = self.postings_ptr
+        hits = [self.postings[ptr[c]:ptr[c + 1]] for c in active_cols]
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+        rules, counts = np.unique(np.concatenate(hits), return_counts=True)
+        return rules[counts == self.arity[rules]]
+
+    def active_strengths(self, memberships: np.ndarray):
+        """
+        Sparse Regelbewertung für einen einzelnen Fuzzifizierungsvektor:
+        nur Regeln, deren Antezedenzien alle einen Grad > 0 haben, werden ausgewertet.
+
+        Args:
+            memberships (np.ndarray): (Inputterms,) Fuzzifizierungswerte.
+
+        Returns:
+            tuple: (rules, strengths) Regelindizes und ihre Aktivierungsstärken (> 0).
+        """
+        active = np.flatnonzero(memberships != 0)  # NaN zählt als aktiv (wie im dichten Pfad)
+        if len(active) == len(memberships):
+            rules = self._live_rules  # alles aktiv (z.B. Bell-Terme): Index bringt nichts
+        else:
+            rules = self.candidate_rules(active.tolist())
+        strengths = memberships[self.antecedent_idx[rules]].min(axis=-1)
+        return rules, strengths
+
+    def aggregate_sparse(self, rules: np.ndarray, strengths: np.ndarray,
+                         method: str = 'max') -> np.ndarray:
+        """
+        Wie aggregate, aber nur über die angegebenen Regeln (siehe active_strengths).
+
+        Args:
+            rules (np.ndarray): Regelindizes.
+            strengths (np.ndarray): Aktivierungsstärken dieser Regeln.
+            method (str): Aggregationsoperator ('max', 'sum', 'probor').
+
+        Returns:
+            np.ndarray: (Outputterms,) aggregierte Stärken.
+        """
+        return _scatter(strengths, self.consequent_idx[rules], len(self.output_terms), method)
+
+    def aggregate(self, strengths: np.ndarray, method: str = 'max') -> np.ndarray:
+        """
+        Aggregiert Regelstärken pro Outputterm als Scatter-Reduktion:
+        'max' (Max-OR), 'sum' (additiv) oder 'probor' (probabilistisches OR, a + b - a·b).
+
+        Args:
+            strengths (np.ndarray): (Regeln,) oder (batch × Regeln) Aktivierungsstärken.
+            method (str): Aggregationsoperator.
+
+        Returns:
+            np.ndarray: (Outputterms,) bzw. (batch × Outputterms) aggregierte Stärken.
+        """
+        if method != 'max' or not len(self.group_starts):
+            return _scatter(strengths, self.consequent_idx, len(self.output_terms), method)
+        # Max-OR: Regeln nach Konsequenz gruppiert, eine Reduktion über alle Gruppen
+        # (deutlich schneller als der elementweise Scatter von np.maximum.at)
+        if self.group_order is not None:
+            strengths = strengths[..., self.group_order]
+        agg = np.zeros(strengths.shape[:-1] + (len(self.output_terms),))
+        agg[..., self.group_terms] = np.maximum.reduceat(strengths, self.group_starts, axis=-1)
+        return agg
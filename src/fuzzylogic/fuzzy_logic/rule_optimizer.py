@@ -0,0 +1,183 @@
+"""
+RuleOptimizer-Modul:
+Analysiert und verdichtet eine Regelbasis vor der Inferenz. Erkannt werden exakte Duplikate,
+Regeln, die von allgemeineren Regeln mit gleicher Konsequenz abgedeckt werden (Subsumption),
+Regeln, die nie feuern können, sowie Konflikte (gleiche Bedingungen, verschiedene Konsequenzen).
+
+Bei Min-AND und Max-Aggregation gilt: Ist A ⊂ B (Antezedenzmengen) und haben beide dieselbe
+Konsequenz, dann ist μ_A >= μ_B und B trägt nie zum Maximum bei. Duplikate und abgedeckte Regeln
+lassen sich deshalb ohne Änderung der Ausgabe entfernen; bei 'sum' / 'probor' zählt jede Regel
+mit und es werden nur Regeln entfernt, die nie feuern.
+"""
+
+import itertools
+
+def rule_key(antecedents, consequent) -> tuple:
+    """
+    Hashbarer, reihenfolgeunabhängiger Schlüssel einer Regel.
+
+    Args:
+        antecedents (dict | list): {var: term} oder [(var, term), ...]
+        consequent (tuple): (out_var, term)
+
+    Returns:
+        tuple: (frozenset der Antezedenzien, Konsequenz)
+    """
+    items = antecedents.items() if isinstance(antecedents, dict) else antecedents
+    return frozenset(items), tuple(consequent)
+
+def _unreachable_reason(antecedents: frozenset, input_vars: dict):
+    """Grund, warum eine Regel nie feuert, oder None."""
+    if not antecedents:
+        return "keine Bedingung"
+    if input_vars is None:
+        return None
+    by_var = {}
+    for var, term in antecedents:
+        if var not in input_vars:
+            raise KeyError(var)  # wie CompiledRuleBase.compile
+        if term not in input_vars[var].terms:
+            return f"unbekannter Term {var}={term}"
+        by_var.setdefault(var, []).append(term)
+    for var, terms in by_var.items():
+        if len(terms) < 2:
+            continue
+        # Mehrere Terme derselben Variable: nur erfüllbar, wenn sich ihre Träger überlappen
+        lo, hi = -float("inf"), float("inf")
+        for term in terms:
+            mf = input_vars[var].terms[term]
+            if hasattr(mf, "support"):
+                a, b = mf.support()
+                lo, hi = max(lo, a), min(hi, b)
+        # Berühren sich die Träger nur in einem Punkt, entscheidet der Grad dort (z.B. 0 bei Dreiecksfüßen)
+        if lo > hi or (lo == hi and min(float(input_vars[var].terms[term](lo)) for term in terms) == 0):
+            return f"disjunkte Terme {var}={'/'.join(sorted(terms))}"
+    return None
+
+class RuleBaseReport:
+    """
+    Ergebnis der Analyse einer Regelbasis. Alle Indizes beziehen sich auf die ursprüngliche Regelliste.
+
+    Attributes:
+        total (int): Anzahl Regeln vor der Optimierung.
+        kept (list): Indizes der Regeln im optimierten Regel-Set (nach Konsequenz gruppiert).
+        duplicates (list): [(index, original_index), ...] exakte Duplikate.
+        subsumed (list): [(index, general_index), ...] Regeln, die von einer allgemeineren Regel
+            mit gleicher Konsequenz abgedeckt werden.
+        unreachable (list): [(index, reason), ...] Regeln, die nie feuern können.
+        conflicts (list): [(index, other_index), ...] gleiche Bedingungen, andere Konsequenz.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.kept = []
+        self.duplicates = []
+        self.subsumed = []
+        self.unreachable = []
+        self.conflicts = []
+
+    @property
+    def removed(self) -> int:
+        return self.total - len(self.kept)
+
+    @property
+    def reduction(self) -> float:
+        """Anteil entfernter Regeln (0..1)."""
+        return self.removed / self.total if self.total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "kept": len(self.kept),
+            "removed": self.removed,
+            "reduction": self.reduction,
+            "duplicates": len(self.duplicates),
+            "subsumed": len(self.subsumed),
+            "unreachable": len(self.unreachable),
+            "conflicts": len(self.conflicts),
+        }
+
+    def summary(self) -> str:
+        """Einzeilige Zusammenfassung, z.B. für UI oder Logs."""
+        return (f"{self.total} Regeln -> {len(self.kept)} ({self.reduction:.0%} weniger): "
+                f"{len(self.duplicates)} Duplikate, {len(self.subsumed)} abgedeckt, "
+                f"{len(self.unreachable)} nie aktiv, {len(self.conflicts)} Konflikte")
+
+def analyze_rules(rules: list, input_vars: dict = None, aggregation: str = 'max') -> RuleBaseReport:
+    """
+    Analysiert eine Regelbasis und bestimmt das verdichtete Regel-Set.
+    Subsumption wird über Hash-Lookups aller echten Teilmengen der Antezedenzien geprüft
+    (O(Regeln · 2^Antezedenzien), keine paarweisen Vergleiche).
+
+    Args:
+        rules (list): FuzzyRule-Objekte.
+        input_vars (dict, optional): Name -> FuzzyVariable; ohne sie werden unbekannte Terme
+            und disjunkte Bedingungen nicht erkannt.
+        aggregation (str): Aggregationsoperator des Controllers. Nur bei 'max' werden
+            Duplikate und abgedeckte Regeln entfernt (bei anderen nur gemeldet).
+
+    Returns:
+        RuleBaseReport: Befunde und Indizes der behaltenen Regeln.
+    """
+    report = RuleBaseReport(len(rules))
+    keys = [rule_key(rule.antecedents, rule.consequent) for rule in rules]
+    idempotent = aggregation == 'max'
+
+    first = {}          # Schlüssel -> erster Index
+    reachable = []
+    for i, key in enumerate(keys):
+        reason = _unreachable_reason(key[0], input_vars)
+        if reason is not None:
+            report.unreachable.append((i, reason))
+        elif key in first:
+            report.duplicates.append((i, first[key]))
+            if not idempotent:
+                reachable.append(i)
+        else:
+            first[key] = i
+            reachable.append(i)
+
+    # Konflikte: gleiche Bedingungen, unterschiedliche Konsequenz (erste Regel je Bedingung als Referenz)
+    by_antecedents = {}
+    for key, i in first.items():
+        other = by_antecedents.setdefault(key[0], i)
+        if other != i:
+            report.conflicts.append((i, other))
+
+    subsumed = set()
+    for key, i in first.items():
+        antecedents, consequent = key
+        for size in range(1, len(antecedents)):
+            general = next((first[(frozenset(subset), consequent)]
+                            for subset in itertools.combinations(antecedents, size)
+                            if (frozenset(subset), consequent) in first), None)
+            if general is not None:
+                report.subsumed.append((i, general))
+                subsumed.add(i)
+                break
+    report.subsumed.sort()
+    report.conflicts.sort()
+
+    kept = [i for i in reachable if not (idempotent and i in subsumed)]
+    # Nach Konsequenz gruppieren (Reihenfolge des ersten Auftretens), damit die kompilierte
+    # Regelbasis ohne Umsortieren mit einer einzigen reduceat-Reduktion aggregiert
+    group = {}
+    for i in kept:
+        group.setdefault(keys[i][1], len(group))
+    report.kept = sorted(kept, key=lambda i: group[keys[i][1]])
+    return report
+
+def optimize_rules(rules: list, input_vars: dict = None, aggregation: str = 'max'):
+    """
+    Liefert ein kleineres, äquivalentes Regel-Set für den FuzzyController.
+
+    Args:
+        rules (list): FuzzyRule-Objekte.
+        input_vars (dict, optional): Name -> FuzzyVariable (siehe analyze_rules).
+        aggregation (str): Aggregationsoperator des Controllers.
+
+    Returns:
+        tuple: (rules, report) mit der verdichteten Regelliste und dem RuleBaseReport.
+    """
+    report = analyze_rules(rules, input_vars, aggregation)
+    return [rules[i] for i in report.kept], report
@@ -0,0 +1,173 @@
+"""
+Snapshot-Modul:
+Speichert einen kompletten FuzzyController (Variablen, MF-Parameter, Regeln, kompilierte Regelbasis,
+gesampelte Output-Terme, Flächen und Schwerpunkte der Terme) als versionierte Binärdatei und lädt ihn
+per Memory-Mapping wieder. Beim Laden wird nichts neu gesampelt; Prozesse, die denselben Snapshot
+laden, teilen sich die Speicherseiten der Arrays.
+
+Aufruf von der Kommandozeile (aus src/ oder nach pip install von überall):
+    python -m fuzzylogic.fuzzy_logic.snapshot outlook.fzs
+    python -m fuzzylogic.runtime.streaming telemetry.csv scored.csv --snapshot outlook.fzs
+
+Dateiaufbau (Little Endian):
+    MAGIC (8 Bytes) | Formatversion (uint32) | Länge der Metadaten (uint64)
+    Metadaten als UTF-8-JSON | Arrays, jeweils auf ALIGN Bytes ausgerichtet
+"""
+
+import argparse
+import json
+import struct
+
+import numpy as np
+from fuzzylogic.fuzzy_logic.fuzzy_controller import FuzzyController
+from fuzzylogic.fuzzy_logic.fuzzy_rule import FuzzyRule
+from fuzzylogic.fuzzy_logic.fuzzy_variable import FuzzyVariable
+from fuzzylogic.fuzzy_logic.membership_function import ParametricMembershipFunction
+from fuzzylogic.fuzzy_logic.rule_base import CompiledRuleBase
+
+MAGIC = b"FZSNAP\x00\x00"
+FORMAT_VERSION = 1
+ALIGN = 64
+_HEADER = struct.Struct("<8sIQ")
+
+#: Arrays der kompilierten Regelbasis mit festem Datentyp
+_RULE_ARRAYS = {
+    "antecedent_idx": "<i8",
+    "antecedent_mask": "|b1",
+    "consequent_idx": "<i8",
+    "live": "|b1",
+}
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGN
+
+def _variable_meta(var: FuzzyVariable) -> dict:
+    terms = []
+    for label, mf in var.terms.items():
+        if not isinstance(mf, ParametricMembershipFunction):
+            raise TypeError(f"Term '{var.name}.{label}' ist keine parametrische MF und kann "
+                            f"nicht gespeichert werden: {mf!r}")
+        terms.append({"label": label, "kind": mf.kind, "params": mf.params.tolist()})
+    return {"name": var.name, "domain": list(map(float, var.domain)), "terms": terms}
+
+def _variable_from_meta(meta: dict) -> FuzzyVariable:
+    from fuzzylogic.membership_function import MF_CLASSES
+
+    terms = {t["label"]: MF_CLASSES[t["kind"]](*t["params"]) for t in meta["terms"]}
+    return FuzzyVariable(meta["name"], terms, tuple(meta["domain"]))
+
+def save_snapshot(controller: FuzzyController, path: str):
+    """
+    Schreibt den Controller als Snapshot-Datei.
+
+    Args:
+        controller (FuzzyController): Controller mit parametrischen MFs (Trapezoid, Triangle, Bell).
+        path (str): Zieldatei, z.B. 'outlook.fzs'.
+
+    Raises:
+        TypeError: Wenn ein Term keine ParametricMembershipFunction ist.
+    """
+    rule_base = controller.compiled_rules
+    arrays = {
+        "xs": np.ascontiguousarray(controller.xs, dtype="<f8"),
+        "term_curves": np.ascontiguousarray(controller.term_curves, dtype="<f8"),
+        "term_areas": np.ascontiguousarray(controller.term_areas, dtype="<f8"),
+        "term_centroids": np.ascontiguousarray(controller.term_centroids, dtype="<f8"),
+    }
+    for name, dtype in _RULE_ARRAYS.items():
+        arrays[name] = np.ascontiguousarray(getattr(rule_base, name), dtype=dtype)
+
+    meta = {
+        "resolution": controller.resolution,
+        "implication": controller.implication,
+        "aggregation": controller.aggregation,
+        "input_vars": [_variable_meta(var) for var in controller.input_vars.values()],
+        "input_names": list(controller.input_vars),
+        "output_var": _variable_meta(controller.output_var),
+        "rules": [[[list(a) for a in rule.antecedents], list(rule.consequent)]
+                  for rule in controller.rules],
+        "arrays": {},
+    }
+    # Offsets relativ zum Beginn des Datenbereichs; der Datenbereich selbst beginnt ausgerichtet
+    offset = 0
+    for name, arr in arrays.items():
+        offset += _padding(offset)
+        meta["arrays"][name] = {"offset": offset, "dtype": arr.dtype.str, "shape": list(arr.shape)}
+        offset += arr.nbytes
+
+    blob = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(blob)))
+        fh.write(blob)
+        fh.write(b"\x00" * _padding(_HEADER.size + len(blob)))
+        written = 0
+        for name, arr in arrays.items():
+            fh.write(b"\x00" * _padding(written))
+            written += _padding(written)
+            fh.write(arr.tobytes())
+            written += arr.nbytes
+
+def load_snapshot(path: str, mmap: bool = True) -> FuzzyController:
+    """
+    Lädt einen Controller aus einer Snapshot-Datei. Output-Kurven und Regelbasis werden
+    übernommen statt neu berechnet; mit mmap=True werden sie read-only eingeblendet.
+
+    Args:
+        path (str): Pfad der Snapshot-Datei.
+        mmap (bool): Arrays memory-mappen statt einlesen.
+
+    Returns:
+        FuzzyController: Einsatzbereiter Controller.
+
+    Raises:
+        ValueError: Wenn die Datei kein Snapshot ist oder eine unbekannte Formatversion hat.
+    """
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise ValueError(f"{path}: Datei zu kurz für einen Snapshot")
+        magic, version, meta_len = _HEADER.unpack(head)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: kein Controller-Snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: Snapshot-Format {version} wird nicht unterstützt "
+                             f"(erwartet: {FORMAT_VERSION})")
+        meta = json.loads(fh.read(meta_len).decode("utf-8"))
+    base = _HEADER.size + meta_len
+    base += _padding(base)
+
+    # Eine einzige Abbildung der Datei; die Arrays sind Views darauf
+    raw = np.memmap(path, dtype=np.uint8, mode="r") if mmap else np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for name, info in meta["arrays"].items():
+        dtype = np.dtype(info["dtype"])
+        start = base + info["offset"]
+        count = int(np.prod(info["shape"]))
+        arrays[name] = raw[start:start + count * dtype.itemsize].view(dtype).reshape(info["shape"])
+
+    input_vars = {name: _variable_from_meta(var)
+                  for name, var in zip(meta["input_names"], meta["input_vars"])}
+    output_var = _variable_from_meta(meta["output_var"])
+    rules = [FuzzyRule([tuple(a) for a in ants], tuple(cons)) for ants, cons in meta["rules"]]
+    input_terms = [(name, term) for name, var in input_vars.items() for term in var.terms]
+    rule_base = CompiledRuleBase(input_terms, list(output_var.terms),
+                                 *(arrays[name] for name in _RULE_ARRAYS))
+    # Ohne den Umweg über __init__: keine Neuberechnung der Output-Kurven, die Arrays bleiben Views
+    # auf die Datei. Ältere Snapshots ohne Flächen/Schwerpunkte berechnen diese beim Laden.
+    return FuzzyController.from_cache(input_vars, output_var, rules, arrays["xs"], arrays["term_curves"],
+                                      rule_base, arrays.get("term_areas"), arrays.get("term_centroids"),
+                                      implication=meta.get("implication", "min"),
+                                      aggregation=meta.get("aggregation", "max"))
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg: speichert den Default-Controller aus config.VAR_CONFIG als Snapshot."""
+    from fuzzylogic.runtime.defaults import default_controller
+
+    parser = argparse.ArgumentParser(description="Default-Controller als Snapshot-Datei speichern.")
+    parser.add_argument("output", help="Zieldatei, z.B. outlook.fzs")
+    parser.add_argument("--resolution", type=int, default=500)
+    args = parser.parse_args(argv)
+    save_snapshot(default_controller(resolution=args.resolution), args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Sugeno-Modul:
+Takagi-Sugeno-Kang-Inferenz (TSK). Die Konsequenzen der Regeln sind Konstanten oder lineare
+Funktionen der Crisp-Eingaben; die Ausgabe ist der mit den Regelstärken gewichtete Mittelwert.
+Es wird keine Output-Domäne diskretisiert und nicht defuzzifiziert.
+"""
+
+import numpy as np
+from fuzzylogic.fuzzy_logic.envelope import term_moments
+from fuzzylogic.fuzzy_logic.fuzzy_controller import fuzzify_columns
+from fuzzylogic.fuzzy_logic.fuzzy_rule import RuleList
+from fuzzylogic.fuzzy_logic.rule_base import CompiledRuleBase
+
+class LinearConsequent:
+    """
+    Lineare Regelkonsequenz z = bias + Σ coefficients[var] · x[var].
+    Ohne Koeffizienten ist sie eine Konstante (Singleton, Sugeno 0. Ordnung).
+
+    Attributes:
+        bias (float): Konstanter Anteil.
+        coefficients (dict): Variablenname -> Koeffizient.
+    """
+
+    def __init__(self, bias: float = 0.0, coefficients: dict = None):
+        """
+        Args:
+            bias (float): Konstanter Anteil.
+            coefficients (dict, optional): Variablenname -> Koeffizient (Default: keine).
+        """
+        self.bias = float(bias)
+        self.coefficients = dict(coefficients or {})
+
+    def __call__(self, crisp_inputs: dict):
+        """
+        Args:
+            crisp_inputs (dict): Variablenname -> Wert oder Array (batch,).
+
+        Returns:
+            float | np.ndarray: Wert der Konsequenz.
+        """
+        z = self.bias
+        for name, coef in self.coefficients.items():
+            z = z + coef * np.asarray(crisp_inputs[name], dtype=float)
+        return z
+
+    def __repr__(self):
+        return f"LinearConsequent({self.bias!r}, {self.coefficients!r})"
+
+class SugenoVariable:
+    """
+    Output-Variable eines Sugeno-Controllers: Term-Label -> Konsequenz.
+
+    Attributes:
+        name (str): Name der Output-Variable (z.B. 'Outlook').
+        terms (dict): Label -> LinearConsequent (Zahlen werden als Konstante übernommen).
+        domain (tuple | None): Optionaler Wertebereich, nur zur Dokumentation/Plotting.
+    """
+
+    def __init__(self, name: str, terms: dict, domain: tuple = None):
+        """
+        Args:
+            name (str): Name der Output-Variable.
+            terms (dict): Label -> LinearConsequent oder Zahl.
+            domain (tuple, optional): Wertebereich (min, max).
+        """
+        self.name = name
+        self.terms = {label: c if isinstance(c, LinearConsequent) else LinearConsequent(c)
+                      for label, c in terms.items()}
+        self.domain = tuple(domain) if domain is not None else None
+
+    def matrices(self, input_names: list) -> tuple:
+        """
+        Konsequenzen als Matrixform für die Batch-Auswertung.
+
+        Args:
+            input_names (list): Reihenfolge der Input-Variablen (Spalten von coef).
+
+        Returns:
+            tuple: (bias, coef) mit bias (Terme,) und coef (Terme × Inputs).
+        """
+        bias = np.array([c.bias for c in self.terms.values()])
+        coef = np.array([[c.coefficients.get(name, 0.0) for name in input_names]
+                         for c in self.terms.values()]).reshape(len(self.terms), len(input_names))
+        return bias, coef
+
+def singletons_from_mamdani(output_var, resolution: int = 2001) -> SugenoVariable:
+    """
+    Approximiert die Terme einer Mamdani-Output-Variable durch Singletons an ihren Schwerpunkten
+    (z.B. Outlook: poor/medium/good). Trapez-/Dreiecksterme werden exakt, Bell-Terme über
+    resolution Stützstellen integriert.
+
+    Args:
+        output_var (FuzzyVariable): Mamdani-Output-Variable.
+        resolution (int): Stützstellen für nicht-lineare Terme.
+
+    Returns:
+        SugenoVariable: Gleichnamige Variable mit konstanten Konsequenzen.
+    """
+    terms = {label: term_moments(mf, output_var.domain, resolution)[1]
+             for label, mf in output_var.terms.items()}
+    return SugenoVariable(output_var.name, terms, output_var.domain)
+
+class SugenoController:
+    """
+    Takagi-Sugeno-Kang-Controller mit denselben Input-Variablen und Regeln wie ein FuzzyController.
+    Die Konsequenz einer Regel (out_var, label) verweist auf einen Term der SugenoVariable.
+
+    Attributes:
+        input_vars (dict): Name -> FuzzyVariable für alle Eingabegrößen.
+        output_var (SugenoVariable): Output mit konstanten oder linearen Konsequenzen.
+        rules (RuleList): Regelbasis (zählt Änderungen mit, siehe FuzzyController.rules).
+        compiled_rules (CompiledRuleBase): Regelbasis als Index-Arrays (wird bei Bedarf neu kompiliert).
+    """
+
+    def __init__(self, input_vars: dict, output_var: SugenoVariable, rules: list):
+        """
+        Args:
+            input_vars (dict): Name -> FuzzyVariable für Input-Variablen.
+            output_var (SugenoVariable): Die Output-Variable.
+            rules (list): Liste der FuzzyRule-Objekte.
+        """
+        self.input_vars = input_vars
+        self.output_var = output_var
+        self._rules_version = 0
+        self.rules = rules
+        self._rules_key = None
+
+    @classmethod
+    def from_mamdani(cls, controller, resolution: int = 2001):
+        """
+        Erzeugt einen Sugeno-Controller 0. Ordnung aus einem FuzzyController: gleiche Inputs und
+        Regeln, Output-Terme als Singletons an ihren Schwerpunkten (siehe singletons_from_mamdani).
+
+        Args:
+            controller (FuzzyController): Mamdani-Controller.
+            resolution (int): Stützstellen für nicht-lineare Outputterms.
+
+        Returns:
+            SugenoController: Approximierender Controller.
+        """
+        return cls(controller.input_vars, singletons_from_mamdani(controller.output_var, resolution),
+                   controller.rules)
+
+    def invalidate_cache(self):
+        """
+        Verwirft die kompilierte Regelbasis und die Konsequenz-Matrizen. Nur nötig, wenn eine
+        LinearConsequent oder FuzzyRule selbst verändert wurde.
+        """
+        self._rules_key = None
+
+    @property
+    def rules(self) -> RuleList:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list):
+        self._rules = RuleList(rules)
+        self._rules_version += 1
+
+    @property
+    def compiled_rules(self) -> CompiledRuleBase:
+        key = (self._rules_version, self._rules.version, id(self.input_vars), id(self.output_var),
+               tuple(self.output_var.terms.items()), tuple(var.version for var in self.input_vars.values()))
+        if key != self._rules_key:
+            self._compiled = CompiledRuleBase.compile(self.rules, self.input_vars,
+                                                      list(self.output_var.terms))
+            self._bias, self._coef = self.output_var.matrices(list(self.input_vars))
+            self._rules_key = key
+        return self._compiled
+
+    def infer(self, crisp_inputs: dict):
+        """
+        Sugeno-Inferenz für eine Eingabe. Über den invertierten Index werden nur Regeln ausgewertet,
+        deren Antezedenzien alle aktiv sind.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+
+        Returns:
+            fuzzified (dict): Für jede Inputvariable die Fuzzy-Zugehörigkeitswerte zum Input.
+            strengths (dict): Regelindex -> Aktivierungsstärke (nur gefeuerte Regeln).
+            value (float): Gewichteter Mittelwert der Regelkonsequenzen (0.0, wenn keine Regel feuert).
+        """
+        rule_base = self.compiled_rules
+        fuzzified = {name: var.fuzzify(crisp_inputs[name]) for name, var in self.input_vars.items()}
+        memberships = np.array([fuzzified[name][term] for name, term in rule_base.input_terms])
+        rules, weights = rule_base.active_strengths(memberships)
+        total = weights.sum()
+        if total == 0:
+            return fuzzified, {}, 0.0
+        x = np.array([float(crisp_inputs[name]) for name in self.input_vars])
+        outputs = (self._bias + self._coef @ x)[rule_base.consequent_idx[rules]]
+        value = float(weights @ outputs / total)
+        return fuzzified, dict(zip(rules.tolist(), weights.tolist())), value
+
+    @staticmethod
+    def _check_method(method: str):
+        # Gleiche Signatur wie FuzzyController, damit die Laufzeit-Module (Streaming, Service,
+        # Scoring, Simulation, ControlSurface) beide Controller austauschbar aufrufen können.
+        # Der gewichtete Mittelwert ist der Schwerpunkt des Sugeno-Modells; andere Verfahren gibt es nicht.
+        if method != 'centroid':
+            raise ValueError(f"SugenoController unterstützt nur method='centroid', nicht {method!r}")
+
+    def decide(self, crisp_inputs: dict, method: str = 'centroid') -> float:
+        """
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+            method (str): Nur 'centroid' (gewichteter Mittelwert), für Kompatibilität mit FuzzyController.
+
+        Returns:
+            float: Crisp-Ausgabewert.
+
+        Raises:
+            ValueError: Bei einer anderen Methode als 'centroid'.
+        """
+        self._check_method(method)
+        return self.infer(crisp_inputs)[2]
+
+    def fuzzify_batch(self, crisp_inputs: dict) -> np.ndarray:
+        """
+        Fuzzifiziert Spalten von Crisp-Werten für alle Input-Variablen auf einmal.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+
+        Returns:
+            np.ndarray: (batch × Inputterms) Fuzzifizierungsmatrix, Spalten wie compiled_rules.input_terms.
+        """
+        return fuzzify_columns(self.input_vars, crisp_inputs)
+
+    def infer_batch(self, crisp_inputs: dict):
+        """
+        Vektorisierte Sugeno-Inferenz.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+
+        Returns:
+            memberships (np.ndarray): (batch × Inputterms) Fuzzifizierungsmatrix.
+            strengths (np.ndarray): (batch × Regeln) Aktivierungsstärken der Regeln.
+            values (np.ndarray): (batch,) Crisp-Ausgaben.
+        """
+        rule_base = self.compiled_rules
+        memberships = self.fuzzify_batch(crisp_inputs)
+        strengths = rule_base.firing_strengths(memberships)
+        x = np.column_stack([np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+                             for name in self.input_vars]) if self.input_vars else np.empty((0, 0))
+        # (batch × Terme) Konsequenzen, dann je Regel der Wert ihres Terms
+        term_values = self._bias + x @ self._coef.T
+        outputs = term_values[:, rule_base.consequent_idx]
+        total = strengths.sum(axis=-1)
+        moment = (strengths * outputs).sum(axis=-1)
+        values = np.divide(moment, total, out=np.zeros_like(moment), where=total != 0)
+        return memberships, strengths, values
+
+    def decide_batch(self, crisp_inputs: dict, method: str = 'centroid', *,
+                     chunk_size: int = 4096) -> np.ndarray:
+        """
+        Berechnet für viele Eingaben direkt die Crisp-Ausgaben (blockweise).
+        Signatur wie FuzzyController.decide_batch(crisp_inputs, method).
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+            method (str): Nur 'centroid' (gewichteter Mittelwert).
+            chunk_size (int): Maximale Anzahl Zeilen pro Block.
+
+        Returns:
+            np.ndarray: (batch,) Crisp-Ausgabewerte.
+
+        Raises:
+            ValueError: Bei einer anderen Methode als 'centroid'.
+        """
+        self._check_method(method)
+        columns = {name: np.atleast_1d(np.asarray(crisp_inputs[name], dtype=float))
+                   for name in self.input_vars}
+        batch = len(next(iter(columns.values()))) if columns else 0
+        out = np.empty(batch)
+        for start in range(0, batch, chunk_size):
+            chunk = {name: col[start:start + chunk_size] for name, col in columns.items()}
+            out[start:start + chunk_size] = self.infer_batch(chunk)[2]
+        return out
@@ -0,0 +1,62 @@
+"""
+SupportIndex-Modul:
+Sortierter Index über die Träger-Intervalle (support) der Terme einer Variable.
+Für einen Crisp-Wert werden die aktiven Terme (μ > 0 möglich) per Bisektion gefunden,
+statt alle Membership Functions auszuwerten.
+"""
+
+import bisect
+import itertools
+
+class SupportIndex:
+    """
+    Index der Träger-Intervalle [lo, hi] aller Terme, sortiert nach lo.
+    Terme ohne endlichen Träger (z.B. Bell) haben lo = -inf und sind damit immer Kandidaten.
+
+    Attributes:
+        labels (list): Term-Labels in Reihenfolge aufsteigender lo.
+        lows (list): Linke Intervallgrenzen (aufsteigend).
+        highs (list): Rechte Intervallgrenzen in derselben Reihenfolge.
+        reach (list): Laufendes Maximum von highs (monoton steigend, für die untere Bisektion).
+    """
+
+    def __init__(self, supports: dict):
+        """
+        Args:
+            supports (dict): Label -> (lo, hi) Träger-Intervall, z.B. aus MembershipFunction.support().
+        """
+        ordered = sorted(supports.items(), key=lambda item: item[1][0])
+        self.labels = [label for label, _ in ordered]
+        self.lows = [float(lo) for _, (lo, _) in ordered]
+        self.highs = [float(hi) for _, (_, hi) in ordered]
+        self.reach = list(itertools.accumulate(self.highs, max))
+
+    @classmethod
+    def from_terms(cls, terms: dict):
+        """
+        Baut den Index aus den Termen einer FuzzyVariable.
+
+        Args:
+            terms (dict): Label -> MembershipFunction
+
+        Returns:
+            SupportIndex: Index über mf.support() aller Terme (ohne support(): ganze Achse).
+        """
+        unbounded = (-float("inf"), float("inf"))
+        return cls({label: mf.support() if hasattr(mf, "support") else unbounded
+                    for label, mf in terms.items()})
+
+    def active(self, x: float) -> list:
+        """
+        Liefert alle Terme, deren Träger x enthält.
+        Kosten: O(log n + k) bei n Termen und k Kandidaten zwischen den beiden Bisektionen.
+
+        Args:
+            x (float): Crisp-Wert.
+
+        Returns:
+            list: Labels der aktiven Terme (Reihenfolge nach lo).
+        """
+        stop = bisect.bisect_right(self.lows, x)
+        start = bisect.bisect_left(self.reach, x, 0, stop)
+        return [self.labels[i] for i in range(start, stop) if self.highs[i] >= x]
@@ -0,0 +1,297 @@
+"""
+Workspace-Modul:
+Schlanker Inferenzpfad, der nur den Crisp-Wert liefert. Alle Zwischenergebnisse (Fuzzifizierung,
+Regelstärken, Termstärken, aggregierte Output-Menge) liegen in vorab allozierten Puffern, die über
+out=-Argumente wiederverwendet werden; es entstehen keine fuzzified/agg-Dicts und keine
+Temporärarrays pro Aufruf. Über dtype=np.float32 halbieren sich Speicher und Bandbreite im Batch.
+"""
+
+import numpy as np
+
+class InferenceWorkspace:
+    """
+    Vorallozierte Puffer für einen FuzzyController. Ändern sich Regelbasis, Output-Terme oder
+    Operatoren des Controllers, werden die Puffer beim nächsten Aufruf neu angelegt.
+    Die Ergebnisse entsprechen decide_batch (Sampling über xs bzw. geschlossene Form im additiven
+    Modell); Profiling (controller.stats) wird in diesem Pfad nicht erfasst.
+
+    Ein Workspace ist nicht threadsicher: pro Thread bzw. Worker einen eigenen verwenden.
+    float32 ist vor allem für 'centroid' gedacht: die max-basierten Methoden erkennen Plateaus per
+    Gleichheit und können durch Rundung auf andere Stützstellen springen.
+
+    Verwendung:
+        ws = InferenceWorkspace(controller, dtype=np.float32)
+        value = ws.decide({'Health': 30, 'Enemies': 90, 'Distance': 8.0})
+        ws.decide_batch(columns, out=values)
+
+    Attributes:
+        controller (FuzzyController): Verwendeter Controller.
+        dtype (np.dtype): Rechengenauigkeit der Puffer (float64 oder float32).
+        capacity (int): Maximale Zeilenzahl pro Block in decide_batch.
+    """
+
+    def __init__(self, controller, dtype=np.float64, capacity: int = 4096):
+        """
+        Args:
+            controller (FuzzyController): Verwendeter Controller.
+            dtype (np.dtype): np.float64 (Default) oder np.float32.
+            capacity (int): Blockgröße für decide_batch (bestimmt die Größe der Batch-Puffer).
+        """
+        self.controller = controller
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self._rule_base = None
+        self._src_curves = None
+        self._ops = None
+        self._batch = None
+
+    def _prepare(self):
+        """Legt die Einzel-Puffer an, falls sich der Controller seit dem letzten Aufruf geändert hat."""
+        controller = self.controller
+        rule_base = controller.compiled_rules
+        curves = controller.term_curves
+        if (rule_base is self._rule_base and curves is self._src_curves
+                and (controller.implication, controller.aggregation) == self._ops):
+            return
+        dtype = self.dtype
+        names = list(controller.input_vars)
+        self._names = names
+        self._columns = [(names.index(name), controller.input_vars[name].terms[term])
+                         for name, term in rule_base.input_terms]
+        self._slots = [np.ascontiguousarray(rule_base.antecedent_idx[:, s])
+                       for s in range(rule_base.antecedent_idx.shape[1])]
+        self._dead = None if rule_base.live.all() else ~rule_base.live
+        self._xs = controller.xs.astype(dtype)
+        self._curves = curves.astype(dtype)
+        self._areas = controller.term_areas.astype(dtype)
+        self._centroids = controller.term_centroids.astype(dtype)
+        self._additive = controller.is_additive
+        self._ops = (controller.implication, controller.aggregation)
+
+        n_rules, n_terms, res = len(rule_base.live), len(rule_base.output_terms), len(self._xs)
+        self._values = [0.0] * len(names)
+        self._memberships = np.zeros(len(rule_base.input_terms), dtype)
+        self._strengths = np.zeros(n_rules, dtype)
+        self._gathered = np.zeros(n_rules, dtype)
+        self._groups = np.zeros(len(rule_base.group_starts), dtype)
+        self._agg = np.zeros(n_terms, dtype)
+        self._weights = np.zeros(n_terms, dtype)
+        self._ys = np.zeros(res, dtype)
+        self._tmp = np.zeros(res, dtype)
+        self._tmp2 = np.zeros(res, dtype)
+        self._mask = np.zeros(res, bool)
+        self._rule_base = rule_base
+        self._src_curves = curves
+        self._batch = None
+
+    # --- Gemeinsame Stufen; arbeiten auf (n,)- oder (rows × n)-Puffern ---
+
+    def _rules(self, memberships, strengths, gathered):
+        """Min-AND über die Antezedenz-Slots: ein take + minimum je Slot, alles in-place."""
+        if not self._slots:
+            return
+        axis = memberships.ndim - 1
+        memberships.take(self._slots[0], axis=axis, out=strengths, mode='clip')
+        for idx in self._slots[1:]:
+            memberships.take(idx, axis=axis, out=gathered, mode='clip')
+            np.minimum(strengths, gathered, out=strengths)
+        if self._dead is not None:
+            strengths[..., self._dead] = 0
+
+    def _aggregate(self, strengths, gathered, groups, agg):
+        """Termstärken aus Regelstärken mit dem Aggregationsoperator des Controllers."""
+        rule_base = self._rule_base
+        method = self._ops[1]
+        agg.fill(0)
+        if not len(rule_base.consequent_idx):
+            return
+        cons = (Ellipsis, rule_base.consequent_idx)
+        if method == 'max':
+            src = strengths
+            if rule_base.group_order is not None:
+                strengths.take(rule_base.group_order, axis=strengths.ndim - 1, out=gathered, mode='clip')
+                src = gathered
+            np.maximum.reduceat(src, rule_base.group_starts, axis=-1, out=groups)
+            agg[..., rule_base.group_terms] = groups
+        elif method == 'sum':
+            np.add.at(agg, cons, strengths)
+        else:  # probor: 1 - Π(1 - w)
+            np.subtract(1, strengths, out=gathered)
+            agg.fill(1)
+            np.multiply.at(agg, cons, gathered)
+            np.subtract(1, agg, out=agg)
+
+    def _curves_into(self, agg, ys, tmp, tmp2):
+        """Aggregierte Output-Menge wie FuzzyController.aggregate_curves, aber in ys."""
+        implication, aggregation = self._ops
+        ys.fill(0)
+        for k, curve in enumerate(self._curves):
+            degree = agg[..., k:k + 1]
+            if not degree.any():
+                continue
+            if implication == 'min':
+                np.minimum(degree, curve, out=tmp)
+            else:
+                np.multiply(degree, curve, out=tmp)
+            if aggregation == 'max':
+                np.maximum(ys, tmp, out=ys)
+            elif aggregation == 'sum':
+                np.add(ys, tmp, out=ys)
+            else:  # (a + b) - a·b, gleiche Rechenreihenfolge wie _probor
+                np.multiply(ys, tmp, out=tmp2)
+                np.add(ys, tmp, out=ys)
+                np.subtract(ys, tmp2, out=ys)
+
+    # --- Einzel-Inferenz ---
+
+    def decide(self, crisp_inputs: dict, method: str = 'centroid') -> float:
+        """
+        Crisp-Wert für eine Eingabe ohne Allokation von Arrays oder Dicts.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+            method (str): Name der Defuzzifizierungsstrategie.
+
+        Returns:
+            float: Crisp-Ausgabewert.
+        """
+        self._prepare()
+        values = self._values
+        for i, name in enumerate(self._names):
+            values[i] = float(crisp_inputs[name])
+        memberships = self._memberships
+        for i, (var, mf) in enumerate(self._columns):
+            memberships[i] = mf.scalar(values[var])
+
+        self._rules(memberships, self._strengths, self._gathered)
+        agg = self._agg
+        self._aggregate(self._strengths, self._gathered, self._groups, agg)
+
+        if self._additive and method == 'centroid':
+            np.multiply(agg, self._areas, out=self._weights)
+            area = self._weights.sum()
+            return float(self._weights @ self._centroids / area) if area != 0 else 0.0
+
+        ys, tmp, xs = self._ys, self._tmp, self._xs
+        self._curves_into(agg, ys, tmp, self._tmp2)
+        if method == 'centroid':
+            area = ys.sum()
+            if area == 0:
+                return 0.0
+            np.multiply(xs, ys, out=tmp)
+            return float(tmp.sum() / area)
+        mask = self._mask
+        np.equal(ys, ys.max(), out=mask)
+        # Kein Maximum (NaN in ys): wie Defuzzifier ±inf bzw. NaN
+        if method == 'min_of_max':
+            i = mask.argmax()
+            return float(xs[i]) if mask[i] else np.inf
+        if method == 'max_of_max':
+            i = len(mask) - 1 - mask[::-1].argmax()
+            return float(xs[i]) if mask[i] else -np.inf
+        if method == 'mean_of_max':
+            np.multiply(xs, mask, out=tmp)
+            return float(tmp.sum() / np.count_nonzero(mask))
+        raise ValueError(f"Unbekannte Defuzzifizierungsmethode: {method}")
+
+    # --- Batch-Inferenz ---
+
+    def _prepare_batch(self):
+        """Legt die (capacity × n)-Puffer an."""
+        if self._batch is not None:
+            return self._batch
+        rows, dtype = self.capacity, self.dtype
+        n_rules, res = len(self._strengths), len(self._xs)
+        self._batch = {
+            "memberships": np.zeros((rows, len(self._memberships)), dtype),
+            "strengths": np.zeros((rows, n_rules), dtype),
+            "gathered": np.zeros((rows, n_rules), dtype),
+            "groups": np.zeros((rows, len(self._groups)), dtype),
+            "agg": np.zeros((rows, len(self._agg)), dtype),
+            "weights": np.zeros((rows, len(self._agg)), dtype),
+            "ys": np.zeros((rows, res), dtype),
+            "tmp": np.zeros((rows, res), dtype),
+            "tmp2": np.zeros((rows, res), dtype),
+            "mask": np.zeros((rows, res), bool),
+            "index": np.zeros(rows, np.intp),
+            "moment": np.zeros(rows, dtype),
+            "area": np.zeros(rows, dtype),
+            "nan": np.zeros(rows, bool),
+        }
+        return self._batch
+
+    def decide_batch(self, crisp_inputs: dict, method: str = 'centroid', out: np.ndarray = None) -> np.ndarray:
+        """
+        Vektorisierte Entscheidung in Blöcken von capacity Zeilen; alle Zwischenergebnisse liegen in den
+        Batch-Puffern des Workspaces. Nur die Fuzzifizierung ruft die (vektorisierten) MFs auf.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+            method (str): Name der Defuzzifizierungsstrategie.
+            out (np.ndarray, optional): (batch,) Zielarray; Default: neues Array mit self.dtype.
+
+        Returns:
+            np.ndarray: out mit den Crisp-Ausgabewerten.
+        """
+        self._prepare()
+        buf = self._prepare_batch()
+        columns = [np.atleast_1d(np.asarray(crisp_inputs[name])) for name in self._names]
+        batch = len(columns[0]) if columns else 0
+        if out is None:
+            out = np.empty(batch, self.dtype)
+        for start in range(0, batch, self.capacity):
+            stop = min(start + self.capacity, batch)
+            self._decide_block([col[start:stop] for col in columns], method, out[start:stop], buf, stop - start)
+        return out
+
+    def _decide_block(self, columns, method, out, buf, n):
+        b = {key: value[:n] for key, value in buf.items()}
+        memberships = b["memberships"]
+        for i, (var, mf) in enumerate(self._columns):
+            memberships[:, i] = mf(columns[var])
+
+        self._rules(memberships, b["strengths"], b["gathered"])
+        agg = b["agg"]
+        self._aggregate(b["strengths"], b["gathered"], b["groups"], agg)
+        moment, area = b["moment"], b["area"]
+
+        if self._additive and method == 'centroid':
+            weights = b["weights"]
+            np.multiply(agg, self._areas, out=weights)
+            np.matmul(weights, self._centroids, out=moment)
+            weights.sum(axis=-1, out=area)
+        else:
+            ys, tmp, xs = b["ys"], b["tmp"], self._xs
+            self._curves_into(agg, ys, tmp, b["tmp2"])
+            if method == 'centroid':
+                ys.sum(axis=-1, out=area)
+                np.multiply(ys, xs, out=tmp)
+                tmp.sum(axis=-1, out=moment)
+            elif method in ('min_of_max', 'max_of_max', 'mean_of_max'):
+                mask, index = b["mask"], b["index"]
+                ys.max(axis=-1, out=moment)
+                np.equal(ys, moment[:, None], out=mask)
+                if method in ('min_of_max', 'max_of_max'):
+                    if method == 'min_of_max':
+                        mask.argmax(axis=-1, out=index)
+                    else:
+                        mask[:, ::-1].argmax(axis=-1, out=index)
+                        np.subtract(len(xs) - 1, index, out=index)
+                    # Über den Puffer im Workspace-dtype: out darf einen anderen dtype haben
+                    np.take(xs, index, out=area)
+                    np.copyto(out, area, casting='same_kind')
+                    # Kein Maximum (NaN in ys): wie Defuzzifier ±inf
+                    np.isnan(moment, out=b["nan"])
+                    np.copyto(out, np.inf if method == 'min_of_max' else -np.inf, where=b["nan"])
+                    return
+                np.multiply(mask, xs, out=tmp)
+                tmp.sum(axis=-1, out=moment)
+                mask.sum(axis=-1, out=area)
+            else:
+                raise ValueError(f"Unbekannte Defuzzifizierungsmethode: {method}")
+        out.fill(0)
+        np.divide(moment, area, out=out, where=area != 0)
+        if method == 'mean_of_max':
+            # Kein Maximum (NaN in ys): 0/0 wie Defuzzifier.mean_of_max
+            np.equal(area, 0, out=b["nan"])
+            np.copyto(out, np.nan, where=b["nan"])
@@ -0,0 +1,178 @@
+"""
+Definition gängiger Membership Functions für das Fuzzy-Logic-System.
+Jede Funktion erzeugt ein parametrisches MF-Objekt (Trapezoid, Triangle, Bell) mit Typ-Tag
+und Parametern, das Form, Träger (support) und Eckpunkte (breakpoints) kennt.
+Alle MFs sind vektorisiert: sie akzeptieren Skalare und np.ndarrays.
+"""
+
+import numpy as np
+from fuzzylogic.fuzzy_logic.membership_function import ParametricMembershipFunction
+
+# Die Formeln sind Modul-Funktionen (statt Closures), damit die MFs picklebar bleiben
+# und z.B. an Worker-Prozesse geschickt werden können.
+
+def _trap(x, a, b, c, d):
+    x = np.asarray(x, dtype=float)
+    # Degenerierte Flanken (a == b bzw. c == d) erzeugen inf/nan, die nie ausgewählt werden
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rise = (x - a) / (b - a)
+        fall = (d - x) / (d - c)
+    y = np.where(x < b, rise, np.where(x <= c, 1.0, fall))
+    return np.where((x < a) | (x > d), 0.0, y)
+
+def _tri(x, a, b, c):
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rise = (x - a) / (b - a)
+        fall = (c - x) / (c - b)
+    # Spitze explizit (x == b), sonst 0/0 bei a == b bzw. b == c; NaN bleibt NaN (wie bei _trap)
+    y = np.where(x < b, rise, np.where(x > b, fall, np.where(x == b, 1.0, np.nan)))
+    return np.where((x < a) | (x > c), 0.0, y)
+
+def _bell(x, a, b, c):
+    x = np.asarray(x, dtype=float)
+    safe_a = max(abs(a), 1e-6)
+    # Überlauf liefert inf -> μ = 0, daher Warnungen unterdrücken
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        val = np.abs((x - c) / safe_a) ** (2 * b)
+        y = 1.0 / (1.0 + val)
+    return np.nan_to_num(y, nan=0.0)
+
+# Skalare Varianten (reine Python-Floats) für die allokationsfreie Einzel-Inferenz. Gleiche
+# Fallunterscheidung und Rechenreihenfolge wie oben: Trapez/Dreieck sind bitgleich, bei Bell kann
+# die Potenz (NumPy-SIMD vs. C pow) im letzten Bit abweichen.
+
+def _trap_scalar(x, a, b, c, d):
+    if x != x:
+        return x  # NaN bleibt NaN (wie np.where oben)
+    if x < a or x > d:
+        return 0.0
+    if x < b:
+        return (x - a) / (b - a)
+    if x <= c:
+        return 1.0
+    return (d - x) / (d - c)
+
+def _tri_scalar(x, a, b, c):
+    if x != x:
+        return x  # NaN bleibt NaN (wie np.where oben)
+    if x < a or x > c:
+        return 0.0
+    if x < b:
+        return (x - a) / (b - a)
+    if x > b:
+        return (c - x) / (c - b)
+    return 1.0
+
+def _bell_scalar(x, a, b, c):
+    try:
+        y = 1.0 / (1.0 + abs((x - c) / max(abs(a), 1e-6)) ** (2 * b))
+    except (OverflowError, ZeroDivisionError):
+        return 0.0  # wie inf in der vektorisierten Variante
+    return 0.0 if y != y else y
+
+class Trapezoid(ParametricMembershipFunction):
+    """Trapezförmige MF mit params = (a, b, c, d)."""
+
+    __slots__ = ()
+    kind = "Trapezoid"
+    param_names = ("a", "b", "c", "d")
+    formula = staticmethod(_trap)
+    scalar_formula = staticmethod(_trap_scalar)
+
+    def __init__(self, a, b, c, d):
+        super().__init__(a, b, c, d)
+
+    def _vertices(self, a, b, c, d):
+        return (a, b, c, d), (0.0, 1.0, 1.0, 0.0)
+
+    def support(self, eps: float = 0.0) -> tuple:
+        a, _, _, d = self.params.tolist()
+        return a, d
+
+class Triangle(ParametricMembershipFunction):
+    """Dreiecksförmige MF mit params = (a, b, c)."""
+
+    __slots__ = ()
+    kind = "Triangle"
+    param_names = ("a", "b", "c")
+    formula = staticmethod(_tri)
+    scalar_formula = staticmethod(_tri_scalar)
+
+    def __init__(self, a, b, c):
+        super().__init__(a, b, c)
+
+    def _vertices(self, a, b, c):
+        return (a, b, c), (0.0, 1.0, 0.0)
+
+    def support(self, eps: float = 0.0) -> tuple:
+        a, _, c = self.params.tolist()
+        return a, c
+
+class Bell(ParametricMembershipFunction):
+    """Generalisierte Bell-MF mit params = (a, b, c); nicht stückweise linear."""
+
+    __slots__ = ()
+    kind = "Bell"
+    param_names = ("a", "b", "c")
+    formula = staticmethod(_bell)
+    scalar_formula = staticmethod(_bell_scalar)
+
+    def __init__(self, a, b, c):
+        super().__init__(a, b, c)
+
+    def support(self, eps: float = 0.0) -> tuple:
+        """
+        Die Glocke ist nirgends exakt 0; mit eps > 0 wird das Intervall geliefert,
+        außerhalb dessen μ(x) <= eps gilt.
+        """
+        a, b, c = self.params.tolist()
+        if eps <= 0 or b <= 0:
+            return -np.inf, np.inf
+        if eps >= 1:
+            return c, c
+        half = max(abs(a), 1e-6) * (1.0 / eps - 1.0) ** (1.0 / (2 * b))
+        return c - half, c + half
+
+#: Typ-Tag -> Klasse, z.B. zum Wiederherstellen aus Snapshots
+MF_CLASSES = {cls.kind: cls for cls in (Trapezoid, Triangle, Bell)}
+
+def trap_mf(a, b, c, d):
+    """
+    Trapezförmige Membership Function (Trapezoid MF).
+
+    Args:
+        a (float): Startpunkt der Steigung (links unten)
+        b (float): Start des Plateaus (links oben)
+        c (float): Ende des Plateaus (rechts oben)
+        d (float): Endpunkt der Steigung (rechts unten)
+    Returns:
+        Trapezoid: Trapezförmige MF
+    """
+    return Trapezoid(a, b, c, d)
+
+def tri_mf(a, b, c):
+    """
+    Dreiecksförmige Membership Function (Triangular MF).
+
+    Args:
+        a (float): Linker Fuß (links)
+        b (float): Spitze (Peak)
+        c (float): Rechter Fuß (rechts)
+    Returns:
+        Triangle: Dreiecksförmige MF
+    """
+    return Triangle(a, b, c)
+
+def bell_mf(a, b, c):
+    """
+    Glöckchenförmige Membership Function (Generalized Bell MF).
+
+    Args:
+        a (float): Breite der Glocke (>0)
+        b (float): Steigung (Slope)
+        c (float): Zentrum (Center)
+    Returns:
+        Bell: Bell-förmige MF
+    """
+    return Bell(a, b, c)
@@ -0,0 +1 @@
+"""Headless-Laufzeit: Default-Controller, Kommandos, Streaming, Service, paralleles Scoring und Simulation."""
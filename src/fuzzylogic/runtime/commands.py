@@ -0,0 +1,37 @@
+"""
+Commands-Modul:
+Übersetzt den defuzzifizierten Outlook-Wert in ein Spielkommando (ANGRIFF / VERTEIDIGUNG / RÜCKZUG).
+"""
+
+import numpy as np
+from fuzzylogic.config import COMMAND_THRESHOLDS, COMMAND_DEFAULT
+
+def command_for(value: float) -> str:
+    """
+    Liefert das Kommando für einen einzelnen Crisp-Wert.
+
+    Args:
+        value (float): Defuzzifizierter Output-Wert.
+
+    Returns:
+        str: Kommando gemäß config.COMMAND_THRESHOLDS.
+    """
+    for threshold, command in COMMAND_THRESHOLDS:
+        if value >= threshold:
+            return command
+    return COMMAND_DEFAULT
+
+def commands_for(values: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von command_for.
+
+    Args:
+        values (np.ndarray): (batch,) defuzzifizierte Output-Werte.
+
+    Returns:
+        np.ndarray: (batch,) Kommandos als Strings.
+    """
+    values = np.asarray(values)
+    conditions = [values >= threshold for threshold, _ in COMMAND_THRESHOLDS]
+    choices = [command for _, command in COMMAND_THRESHOLDS]
+    return np.select(conditions, choices, default=COMMAND_DEFAULT)
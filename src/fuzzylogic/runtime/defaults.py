@@ -0,0 +1,57 @@
+"""
+Defaults-Modul:
+Baut Variablen, Regeln und Controller aus config.VAR_CONFIG / config.DEFAULT_RULES,
+ohne das Streamlit-UI. Grundlage für alle Headless-Werkzeuge (Streaming, Services, Simulation).
+"""
+
+from fuzzylogic.config import MF_TYPES, VAR_CONFIG, DEFAULT_RULES
+from fuzzylogic.fuzzy_logic.fuzzy_variable import FuzzyVariable
+from fuzzylogic.fuzzy_logic.fuzzy_rule import FuzzyRule
+from fuzzylogic.fuzzy_logic.fuzzy_controller import FuzzyController
+
+#: Input- und Output-Variablen der Default-Konfiguration
+INPUT_NAMES = ["Health", "Enemies", "Distance"]
+OUTPUT_NAME = "Outlook"
+
+def default_variable(name: str) -> FuzzyVariable:
+    """
+    Erzeugt eine FuzzyVariable mit den Default-MFs aus VAR_CONFIG.
+
+    Args:
+        name (str): Name der Variable, z.B. 'Health'
+
+    Returns:
+        FuzzyVariable: Variable mit Default-Termen und Domäne
+    """
+    config = VAR_CONFIG[name]
+    terms = {}
+    for label in config["labels"]:
+        mf_type, params = config["defaults"][label]
+        terms[label] = MF_TYPES[mf_type]["func"](*params)
+    return FuzzyVariable(name, terms, domain=config["domain"])
+
+def default_rules(rules: list = None) -> list:
+    """
+    Wandelt Regeln im Format von DEFAULT_RULES in FuzzyRule-Objekte um.
+
+    Args:
+        rules (list, optional): [({var: term, ...}, (out_var, term)), ...] (Default: DEFAULT_RULES)
+
+    Returns:
+        list: Liste von FuzzyRule-Objekten
+    """
+    return [FuzzyRule(list(conds.items()), cons) for conds, cons in (DEFAULT_RULES if rules is None else rules)]
+
+def default_controller(rules: list = None, **kwargs) -> FuzzyController:
+    """
+    Erzeugt den Default-Controller (Health, Enemies, Distance -> Outlook).
+
+    Args:
+        rules (list, optional): Regeln im Format von DEFAULT_RULES (Default: DEFAULT_RULES)
+        **kwargs: Weitere Argumente für FuzzyController (z.B. resolution)
+
+    Returns:
+        FuzzyController: Controller mit Default-Variablen und -Regeln
+    """
+    input_vars = {name: default_variable(name) for name in INPUT_NAMES}
+    return FuzzyController(input_vars, default_variable(OUTPUT_NAME), default_rules(rules), **kwargs)
@@ -0,0 +1,170 @@
+"""
+Parallel-Modul:
+Bewertet große Mengen von Eingaben mit einem FuzzyController auf mehreren CPU-Kernen.
+Eingaben und Ergebnisse liegen in multiprocessing.shared_memory, sodass pro Aufgabe nur
+Slice-Grenzen statt Arrays gepickelt werden. Der Controller wird einmal pro Worker übertragen
+oder, bei ParallelScorer.from_snapshot, von jedem Worker aus derselben Snapshot-Datei eingeblendet.
+"""
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+#: Controller des aktuellen Worker-Prozesses (gesetzt durch _init_worker)
+_WORKER_CONTROLLER = None
+
+def _init_worker(payload: bytes):
+    """Entpickelt den Controller einmalig beim Start eines Worker-Prozesses."""
+    global _WORKER_CONTROLLER
+    _WORKER_CONTROLLER = pickle.loads(payload)
+
+def _init_worker_snapshot(path: str):
+    """Lädt den Controller beim Worker-Start memory-mapped aus einem Snapshot."""
+    global _WORKER_CONTROLLER
+    from fuzzylogic.fuzzy_logic.snapshot import load_snapshot
+    _WORKER_CONTROLLER = load_snapshot(path)
+
+def _score_shard(in_name: str, out_name: str, names: list, batch: int,
+                 start: int, stop: int, method: str) -> int:
+    """
+    Bewertet die Zeilen [start, stop) direkt im Shared Memory.
+
+    Returns:
+        int: Anzahl bewerteter Zeilen.
+    """
+    # Worker teilen den resource_tracker des Hauptprozesses, der die Segmente auch freigibt
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    try:
+        inputs = np.ndarray((len(names), batch), dtype=np.float64, buffer=shm_in.buf)
+        outputs = np.ndarray((batch,), dtype=np.float64, buffer=shm_out.buf)
+        columns = {name: inputs[i, start:stop] for i, name in enumerate(names)}
+        outputs[start:stop] = _WORKER_CONTROLLER.decide_batch(columns, method)
+        del inputs, outputs, columns
+    finally:
+        shm_in.close()
+        shm_out.close()
+    return stop - start
+
+class ParallelScorer:
+    """
+    Prozesspool für Offline-Scoring mit einem festen FuzzyController.
+    Der Controller wird beim Start jedes Workers genau einmal entpickelt;
+    anschließend werden beliebig viele score-Aufrufe über denselben Pool verteilt.
+
+    Verwendung:
+        with ParallelScorer(controller, workers=8) as scorer:
+            outlook = scorer.score({'Health': h, 'Enemies': e, 'Distance': d})
+
+    Attributes:
+        names (list): Reihenfolge der Input-Variablen (Zeilen des Shared-Memory-Inputs).
+        workers (int): Anzahl Worker-Prozesse.
+    """
+
+    def __init__(self, controller, workers: int = None, snapshot: str = None):
+        """
+        Startet den Prozesspool.
+
+        Args:
+            controller (FuzzyController): Controller mit picklebaren MembershipFunctions.
+            workers (int, optional): Anzahl Worker (Default: os.cpu_count()).
+            snapshot (str, optional): Snapshot-Datei desselben Controllers; die Worker laden
+                dann diese Datei per Memory-Mapping, statt den Controller entpickeln.
+        """
+        self.names = list(controller.input_vars)
+        self.workers = workers or os.cpu_count() or 1
+        if snapshot is not None:
+            initializer, initargs = _init_worker_snapshot, (str(snapshot),)
+        else:
+            payload = pickle.dumps(controller, protocol=pickle.HIGHEST_PROTOCOL)
+            initializer, initargs = _init_worker, (payload,)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                         initializer=initializer, initargs=initargs)
+
+    @classmethod
+    def from_snapshot(cls, path: str, workers: int = None):
+        """
+        Startet einen Pool, dessen Worker den Controller aus einer Snapshot-Datei laden.
+        Die Arrays des Snapshots liegen dabei nur einmal im Page Cache.
+
+        Args:
+            path (str): Snapshot-Datei (siehe fuzzylogic.fuzzy_logic.snapshot.save_snapshot).
+            workers (int, optional): Anzahl Worker (Default: os.cpu_count()).
+
+        Returns:
+            ParallelScorer: Gestarteter Scorer.
+        """
+        from fuzzylogic.fuzzy_logic.snapshot import load_snapshot
+        return cls(load_snapshot(path), workers, snapshot=path)
+
+    def score(self, crisp_inputs: dict, method: str = 'centroid',
+              shard_size: int = 65536) -> np.ndarray:
+        """
+        Bewertet alle Eingaben parallel. Jeder Shard schreibt in seinen eigenen Ausschnitt
+        des Ergebnisarrays, die Reihenfolge der Eingaben bleibt daher erhalten.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+            method (str): Name der Defuzzifizierungsstrategie.
+            shard_size (int): Zeilen pro Aufgabe.
+
+        Returns:
+            np.ndarray: (batch,) Crisp-Ausgabewerte.
+        """
+        columns = [np.asarray(crisp_inputs[name], dtype=np.float64).ravel() for name in self.names]
+        batch = len(columns[0]) if columns else 0
+        if batch == 0:
+            return np.empty(0)
+
+        shm_in = shared_memory.SharedMemory(create=True, size=len(columns) * batch * 8)
+        shm_out = shared_memory.SharedMemory(create=True, size=batch * 8)
+        try:
+            inputs = np.ndarray((len(columns), batch), dtype=np.float64, buffer=shm_in.buf)
+            for i, col in enumerate(columns):
+                inputs[i] = col
+            futures = [
+                self._pool.submit(_score_shard, shm_in.name, shm_out.name, self.names, batch,
+                                  start, min(start + shard_size, batch), method)
+                for start in range(0, batch, shard_size)
+            ]
+            for future in futures:
+                future.result()
+            result = np.ndarray((batch,), dtype=np.float64, buffer=shm_out.buf).copy()
+            del inputs
+        finally:
+            shm_in.close()
+            shm_in.unlink()
+            shm_out.close()
+            shm_out.unlink()
+        return result
+
+    def close(self):
+        """Beendet den Prozesspool."""
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def score_parallel(controller, crisp_inputs: dict, method: str = 'centroid',
+                   workers: int = None, shard_size: int = 65536) -> np.ndarray:
+    """
+    Einmalige parallele Bewertung; startet und beendet dafür einen eigenen ParallelScorer.
+
+    Args:
+        controller (FuzzyController): Controller mit picklebaren MembershipFunctions.
+        crisp_inputs (dict): Zuordnung: Variablenname -> Array (batch,) mit Crisp-Werten.
+        method (str): Name der Defuzzifizierungsstrategie.
+        workers (int, optional): Anzahl Worker (Default: os.cpu_count()).
+        shard_size (int): Zeilen pro Aufgabe.
+
+    Returns:
+        np.ndarray: (batch,) Crisp-Ausgabewerte.
+    """
+    with ParallelScorer(controller, workers) as scorer:
+        return scorer.score(crisp_inputs, method, shard_size)
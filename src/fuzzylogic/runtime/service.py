@@ -0,0 +1,265 @@
+"""
+Service-Modul:
+Asyncio-Entscheidungsdienst für Game-Server. Gleichzeitige Anfragen werden zu Micro-Batches
+gesammelt (max. Batchgröße / max. Wartezeit in µs) und mit einer einzigen vektorisierten
+Inferenz beantwortet. Der HTTP-Endpunkt nutzt nur die Standardbibliothek und läuft auf localhost.
+
+Endpunkte:
+    POST /decide   {"Health": 30, "Enemies": 90, "Distance": 8.0} -> {"Outlook": ..., "Command": ...}
+    GET  /stats    Latenz-Perzentile (p50/p99) und Histogramm der Batchgrößen
+
+Aufruf von der Kommandozeile (aus src/ oder nach pip install von überall):
+    python -m fuzzylogic.runtime.service --port 8765 --max-batch 256 --max-wait-us 500
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import math
+import time
+
+import numpy as np
+from fuzzylogic.runtime.commands import command_for
+
+class MicroBatcher:
+    """
+    Sammelt einzelne Entscheidungsanfragen und wertet sie gebündelt aus.
+    Ein Batch wird abgeschickt, sobald max_batch Anfragen vorliegen oder seit der ersten
+    Anfrage max_wait_us vergangen sind. Was während einer Inferenz eintrifft, wird sofort
+    in den nächsten Batch übernommen; die Batchgröße passt sich so der Last an.
+
+    Attributes:
+        controller (FuzzyController): Verwendeter Controller.
+        max_batch (int): Maximale Anzahl Anfragen pro Batch.
+        max_wait_us (int): Maximale Wartezeit ab der ersten Anfrage eines Batches in µs.
+        method (str): Defuzzifizierungsstrategie.
+    """
+
+    def __init__(self, controller, max_batch: int = 256, max_wait_us: int = 500,
+                 method: str = 'centroid', latency_window: int = 100000):
+        """
+        Args:
+            controller (FuzzyController): Verwendeter Controller.
+            max_batch (int): Maximale Anzahl Anfragen pro Batch.
+            max_wait_us (int): Maximale Wartezeit in Mikrosekunden.
+            method (str): Defuzzifizierungsstrategie.
+            latency_window (int): Anzahl der letzten Latenzen, über die Perzentile berechnet werden.
+        """
+        self.controller = controller
+        self.max_batch = max_batch
+        self.max_wait_us = max_wait_us
+        self.method = method
+        self._names = list(controller.input_vars)
+        self._queue = None
+        self._task = None
+        self._latencies = collections.deque(maxlen=latency_window)
+        self._batch_sizes = collections.Counter()
+        self._requests = 0
+
+    def start(self):
+        """Startet den Sammel-Task in der laufenden Event-Loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Beendet den Sammel-Task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, crisp_inputs: dict) -> float:
+        """
+        Reiht eine Anfrage ein und wartet auf ihr Ergebnis.
+
+        Args:
+            crisp_inputs (dict): Zuordnung: Variablenname -> Wert.
+
+        Returns:
+            float: Crisp-Ausgabewert.
+
+        Raises:
+            KeyError: Wenn eine Input-Variable fehlt.
+            ValueError: Bei nicht numerischen oder nicht endlichen Werten (NaN, ±inf).
+        """
+        values = [float(crisp_inputs[name]) for name in self._names]
+        for name, value in zip(self._names, values):
+            if not math.isfinite(value):
+                raise ValueError(f"{name} muss endlich sein, nicht {value}")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((values, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        """Wartet auf die erste Anfrage und sammelt bis max_batch oder Deadline."""
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_us / 1e6
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            rows = np.array([values for values, _, _ in batch], dtype=float)
+            try:
+                inputs = {name: rows[:, i] for i, name in enumerate(self._names)}
+                outputs = self.controller.decide_batch(inputs, self.method).tolist()
+            except Exception as exc:  # Fehler an alle Aufrufer des Batches weiterreichen
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            now = time.perf_counter()
+            for (_, future, t0), value in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(value)
+                self._latencies.append(now - t0)
+            self._batch_sizes[len(batch)] += 1
+            self._requests += len(batch)
+
+    def stats(self) -> dict:
+        """
+        Momentaufnahme der Service-Statistiken.
+
+        Returns:
+            dict: requests, batches, p50_us, p99_us, max_us und batch_sizes (Größe -> Anzahl).
+        """
+        lat = np.fromiter(self._latencies, dtype=float) * 1e6
+        p50, p99, top = (np.percentile(lat, [50, 99]).tolist() + [lat.max()]) if len(lat) else (0.0, 0.0, 0.0)
+        return {
+            "requests": self._requests,
+            "batches": sum(self._batch_sizes.values()),
+            "p50_us": float(p50),
+            "p99_us": float(p99),
+            "max_us": float(top),
+            "batch_sizes": dict(sorted(self._batch_sizes.items())),
+        }
+
+class DecisionServer:
+    """
+    Minimaler HTTP/1.1-Server (Keep-Alive) vor einem MicroBatcher.
+
+    Attributes:
+        batcher (MicroBatcher): Gekapselter Micro-Batcher.
+        host (str): Bind-Adresse (Default: localhost).
+        port (int): Port; 0 wählt einen freien Port, der nach start() gesetzt ist.
+    """
+
+    def __init__(self, batcher: MicroBatcher, host: str = "127.0.0.1", port: int = 0):
+        self.batcher = batcher
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self) -> int:
+        """
+        Startet Batcher und Server.
+
+        Returns:
+            int: Tatsächlich gebundener Port.
+        """
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self):
+        """Stoppt Server und Batcher."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        """Startet den Server und blockiert bis zum Abbruch."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/stats":
+            return "200 OK", self.batcher.stats()
+        if method == "POST" and path == "/decide":
+            try:
+                crisp_inputs = json.loads(body)
+                value = await self.batcher.submit(crisp_inputs)
+            except (KeyError, TypeError, ValueError) as exc:
+                return "400 Bad Request", {"error": repr(exc)}
+            except Exception as exc:  # z.B. vom Batcher weitergereichte Inferenzfehler
+                return "500 Internal Server Error", {"error": repr(exc)}
+            name = self.batcher.controller.output_var.name
+            # Gültiges JSON kennt kein NaN/inf
+            return "200 OK", {name: value if math.isfinite(value) else None, "Command": command_for(value)}
+        return "404 Not Found", {"error": f"{method} {path}"}
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg mit dem Default-Controller aus config.VAR_CONFIG oder einem Snapshot."""
+    from fuzzylogic.fuzzy_logic.snapshot import load_snapshot
+    from fuzzylogic.runtime.defaults import default_controller
+
+    parser = argparse.ArgumentParser(description="Fuzzy-Entscheidungsdienst mit Micro-Batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-wait-us", type=int, default=500)
+    parser.add_argument("--method", default="centroid",
+                        choices=["min_of_max", "max_of_max", "mean_of_max", "centroid"])
+    parser.add_argument("--snapshot", help="Controller aus einer Snapshot-Datei laden")
+    args = parser.parse_args(argv)
+    controller = load_snapshot(args.snapshot) if args.snapshot else default_controller()
+
+    batcher = MicroBatcher(controller, args.max_batch, args.max_wait_us, args.method)
+    server = DecisionServer(batcher, args.host, args.port)
+    print(f"Listening on http://{args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Simulation-Modul:
+Headless-Lasttest für den Fuzzy-Controller. N Agenten entwickeln ihre Eingaben (Health, Enemies, Distance)
+über T Ticks entlang eines Random Walks oder einer vorgegebenen Spur (Trace); pro Tick werden alle Agenten
+vektorisiert entschieden und über config.COMMAND_THRESHOLDS in ANGRIFF / VERTEIDIGUNG / RÜCKZUG übersetzt.
+Gemessen werden Entscheidungen pro Sekunde, die Latenzverteilung pro Tick und der Speicher-Höchststand.
+
+Aufruf von der Kommandozeile (aus src/ oder nach pip install von überall):
+    python -m fuzzylogic.runtime.simulation --agents 10000 --ticks 500 --move-prob 0.3
+    python -m fuzzylogic.runtime.simulation --trace match.npz --incremental
+"""
+
+import argparse
+import collections
+import csv
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from fuzzylogic.runtime.commands import commands_for
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def random_walk(input_vars: dict, agents: int, ticks: int, step: float = 0.05,
+                move_prob: float = 1.0, seed: int = 0):
+    """
+    Erzeugt Eingaben als begrenzten Random Walk. Startwerte sind gleichverteilt über die Domäne;
+    pro Tick bewegt sich jede Variable eines Agenten mit Wahrscheinlichkeit move_prob um einen
+    normalverteilten Schritt (Standardabweichung step · Domänenbreite) und wird auf die Domäne begrenzt.
+
+    Args:
+        input_vars (dict): Name -> FuzzyVariable (liefert die Domänen).
+        agents (int): Anzahl Agenten.
+        ticks (int): Anzahl Ticks.
+        step (float): Schrittweite relativ zur Domänenbreite.
+        move_prob (float): Wahrscheinlichkeit, dass sich ein Wert in einem Tick ändert.
+        seed (int): Seed des Zufallsgenerators.
+
+    Yields:
+        dict: Variablenname -> (agents,) Crisp-Werte des Ticks.
+    """
+    rng = np.random.default_rng(seed)
+    domains = {name: var.domain for name, var in input_vars.items()}
+    state = {name: rng.uniform(lo, hi, agents) for name, (lo, hi) in domains.items()}
+    for _ in range(ticks):
+        for name, (lo, hi) in domains.items():
+            delta = rng.normal(0.0, step * (hi - lo), agents)
+            if move_prob < 1.0:
+                delta[rng.random(agents) >= move_prob] = 0.0
+            np.clip(state[name] + delta, lo, hi, out=state[name])
+        yield {name: values.copy() for name, values in state.items()}
+
+def load_trace(path: str) -> dict:
+    """
+    Lädt eine vorgegebene Spur.
+    .npz: je Variable ein Array (Ticks × Agenten).
+    .csv: Langformat mit den Spalten tick, agent und je einer Spalte pro Variable. Fehlt eine Zeile
+    (tick, agent), gilt der zuletzt gemeldete Wert des Agenten weiter (Forward-Fill).
+
+    Args:
+        path (str): Pfad zur Trace-Datei.
+
+    Returns:
+        dict: Variablenname -> (Ticks × Agenten) Crisp-Werte.
+
+    Raises:
+        ValueError: Wenn ein Agent in Tick 0 keinen Wert hat (nichts zum Fortschreiben).
+    """
+    if str(path).lower().endswith(".npz"):
+        with np.load(path) as data:
+            return {name: np.atleast_2d(data[name]).astype(float) for name in data.files}
+    with open(path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    if not rows:
+        return {}
+    tick = np.array([int(row["tick"]) for row in rows])
+    agent = np.array([int(row["agent"]) for row in rows])
+    shape = (tick.max() + 1, agent.max() + 1)
+    # Quellzeile je Zelle: letzter Tick <= t, in dem der Agent gemeldet wurde (-1: noch keiner)
+    source = np.full(shape, -1)
+    source[tick, agent] = tick
+    np.maximum.accumulate(source, axis=0, out=source)
+    missing = np.flatnonzero(source[0] < 0)
+    if len(missing):
+        raise ValueError(f"{path}: Agent(en) {missing[:10].tolist()} ohne Wert in Tick 0, "
+                         "die Spur ist unvollständig")
+    agents = np.arange(shape[1])
+    trace = {}
+    for name in rows[0]:
+        if name in ("tick", "agent"):
+            continue
+        values = np.empty(shape)
+        values[tick, agent] = [float(row[name]) for row in rows]
+        trace[name] = values[source, agents]
+    return trace
+
+def scripted(trace: dict):
+    """
+    Spielt eine Spur Tick für Tick ab.
+
+    Args:
+        trace (dict): Variablenname -> (Ticks × Agenten) Crisp-Werte, z.B. aus load_trace.
+
+    Yields:
+        dict: Variablenname -> (Agenten,) Crisp-Werte des Ticks.
+    """
+    ticks = min((len(values) for values in trace.values()), default=0)
+    for t in range(ticks):
+        yield {name: values[t] for name, values in trace.items()}
+
+def max_rss_bytes():
+    """Höchststand des Resident Set Size dieses Prozesses (None, wenn nicht verfügbar)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KiB, macOS Bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+def run_simulation(controller, frames, method: str = 'centroid', incremental: bool = False,
+                   trace_memory: bool = False, progress=None) -> dict:
+    """
+    Führt die Simulation aus und misst Durchsatz, Latenz und Speicher.
+    Gemessen wird pro Tick nur die Entscheidung (Inferenz + Kommandos), nicht das Erzeugen der Eingaben.
+
+    Args:
+        controller (FuzzyController): Zu verwendender Controller.
+        frames (iterable): Eingaben je Tick, z.B. aus random_walk oder scripted.
+        method (str): Name der Defuzzifizierungsstrategie.
+        incremental (bool): IncrementalInference nutzen (nur geänderte Eingaben neu rechnen).
+        trace_memory (bool): Python-Allokationen mit tracemalloc verfolgen (kostet Durchsatz).
+        progress (callable, optional): Wird nach jedem Tick mit (tick, values, commands) aufgerufen.
+
+    Returns:
+        dict: agents, ticks, decisions, seconds, decisions_per_second, p50_us / p90_us / p99_us / max_us
+            (Latenz pro Tick), commands (Kommando -> Anzahl), command_switches, tracemalloc_peak_bytes
+            und max_rss_bytes.
+    """
+    if incremental:
+        from fuzzylogic.fuzzy_logic.incremental import IncrementalInference
+        decide = IncrementalInference(controller, method).step
+    else:
+        def decide(inputs):
+            return controller.decide_batch(inputs, method)
+
+    if trace_memory:
+        tracemalloc.start()
+    latencies = []
+    counts = collections.Counter()
+    switches = 0
+    previous = None
+    agents = 0
+    try:
+        for tick, inputs in enumerate(frames):
+            t0 = time.perf_counter()
+            values = decide(inputs)
+            commands = commands_for(values)
+            latencies.append(time.perf_counter() - t0)
+
+            agents = len(values)
+            labels, n = np.unique(commands, return_counts=True)
+            counts.update(dict(zip(labels.tolist(), n.tolist())))
+            if previous is not None and len(previous) == agents:
+                switches += int(np.count_nonzero(previous != commands))
+            previous = commands
+            if progress is not None:
+                progress(tick, values, commands)
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    lat = np.array(latencies) * 1e6
+    p50, p90, p99 = np.percentile(lat, [50, 90, 99]).tolist() if len(lat) else (0.0, 0.0, 0.0)
+    seconds = float(lat.sum() / 1e6)
+    decisions = sum(counts.values())
+    return {
+        "agents": agents,
+        "ticks": len(latencies),
+        "decisions": decisions,
+        "seconds": seconds,
+        "decisions_per_second": decisions / seconds if seconds else 0.0,
+        "p50_us": float(p50),
+        "p90_us": float(p90),
+        "p99_us": float(p99),
+        "max_us": float(lat.max()) if len(lat) else 0.0,
+        "commands": dict(sorted(counts.items())),
+        "command_switches": switches,
+        "tracemalloc_peak_bytes": peak,
+        "max_rss_bytes": max_rss_bytes(),
+    }
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg mit dem Default-Controller aus config.VAR_CONFIG oder einem Snapshot."""
+    from fuzzylogic.fuzzy_logic.snapshot import load_snapshot
+    from fuzzylogic.runtime.defaults import default_controller
+
+    parser = argparse.ArgumentParser(description="Headless-Simulation vieler Agenten mit dem Fuzzy-Controller.")
+    parser.add_argument("--agents", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--step", type=float, default=0.05, help="Random-Walk-Schritt relativ zur Domänenbreite")
+    parser.add_argument("--move-prob", type=float, default=1.0,
+                        help="Wahrscheinlichkeit, dass sich ein Wert pro Tick ändert")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace", help="Vorgegebene Spur (.npz oder .csv) statt Random Walk")
+    parser.add_argument("--method", default="centroid",
+                        choices=["min_of_max", "max_of_max", "mean_of_max", "centroid"])
+    parser.add_argument("--incremental", action="store_true", help="Nur geänderte Eingaben neu rechnen")
+    parser.add_argument("--tracemalloc", action="store_true", help="Python-Allokationen verfolgen")
+    parser.add_argument("--snapshot", help="Controller aus einer Snapshot-Datei laden")
+    args = parser.parse_args(argv)
+    controller = load_snapshot(args.snapshot) if args.snapshot else default_controller()
+
+    if args.trace:
+        frames = scripted(load_trace(args.trace))
+    else:
+        frames = random_walk(controller.input_vars, args.agents, args.ticks,
+                             args.step, args.move_prob, args.seed)
+    stats = run_simulation(controller, frames, args.method, args.incremental, args.tracemalloc)
+    print(json.dumps(stats))
+
+if __name__ == "__main__":
+    main()
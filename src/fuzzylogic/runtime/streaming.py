@@ -0,0 +1,167 @@
+"""
+Streaming-Modul:
+Bewertet Telemetrie-Dateien (CSV oder NDJSON), die größer als der Arbeitsspeicher sein können.
+Die Datei wird in Blöcken fester Größe gelesen, jeder Block vektorisiert inferiert und das Ergebnis
+(Crisp-Wert + Kommando) sofort wieder weggeschrieben. Der Speicherbedarf hängt nur von chunk_size ab.
+
+Aufruf von der Kommandozeile (aus src/ oder nach pip install von überall):
+    python -m fuzzylogic.runtime.streaming telemetry.csv scored.csv --chunk-size 50000
+"""
+
+import argparse
+import csv
+import json
+import time
+
+import numpy as np
+from fuzzylogic.runtime.commands import commands_for
+
+#: Dateiendungen -> Format
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+def detect_format(path: str) -> str:
+    """
+    Bestimmt das Dateiformat anhand der Endung.
+
+    Args:
+        path (str): Dateipfad.
+
+    Returns:
+        str: 'csv' oder 'ndjson'.
+    """
+    for ext, fmt in FORMATS.items():
+        if str(path).lower().endswith(ext):
+            return fmt
+    raise ValueError(f"Unbekanntes Dateiformat: {path} (erwartet: {', '.join(FORMATS)})")
+
+def iter_chunks(fh, fmt: str, chunk_size: int):
+    """
+    Liest Zeilen blockweise aus einem geöffneten Textfile.
+
+    Args:
+        fh (file): Geöffnete Eingabedatei.
+        fmt (str): 'csv' oder 'ndjson'.
+        chunk_size (int): Maximale Anzahl Zeilen pro Block.
+
+    Yields:
+        list: Liste von Zeilen-Dicts (Spaltenname -> Rohwert).
+    """
+    rows = csv.DictReader(fh) if fmt == "csv" else (json.loads(line) for line in fh if line.strip())
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def score_chunks(controller, chunks, columns: dict = None, method: str = 'centroid'):
+    """
+    Inferiert jeden Block vektorisiert.
+
+    Args:
+        controller (FuzzyController): Zu verwendender Controller.
+        chunks (iterable): Blöcke von Zeilen-Dicts, z.B. aus iter_chunks.
+        columns (dict, optional): Variablenname -> Spaltenname in der Datei
+            (Default: Spalten heißen wie die Input-Variablen).
+        method (str): Name der Defuzzifizierungsstrategie.
+
+    Yields:
+        tuple: (rows, values, commands) je Block.
+    """
+    columns = columns or {}
+    for rows in chunks:
+        inputs = {
+            name: np.fromiter((float(row[columns.get(name, name)]) for row in rows),
+                              dtype=float, count=len(rows))
+            for name in controller.input_vars
+        }
+        values = controller.decide_batch(inputs, method)
+        yield rows, values, commands_for(values)
+
+def run_stream(controller, in_path: str, out_path: str, chunk_size: int = 10000,
+               method: str = 'centroid', columns: dict = None, progress=None) -> dict:
+    """
+    Komplette Pipeline: Datei lesen -> blockweise inferieren -> Ergebnisse inkrementell schreiben.
+    Die Ausgabe enthält die Eingabespalten plus Output-Wert und 'Command'. CSV-Ausgaben haben feste
+    Spalten: bei CSV-Eingabe deren Kopfzeile, bei NDJSON-Eingabe (Schlüssel können je Zeile variieren)
+    die Spalten der Input-Variablen; weitere Schlüssel werden dann nicht übernommen.
+
+    Args:
+        controller (FuzzyController): Zu verwendender Controller.
+        in_path (str): Eingabedatei (.csv, .ndjson oder .jsonl).
+        out_path (str): Ausgabedatei (Format ebenfalls über die Endung).
+        chunk_size (int): Zeilen pro Block.
+        method (str): Name der Defuzzifizierungsstrategie.
+        columns (dict, optional): Variablenname -> Spaltenname in der Eingabedatei.
+        progress (callable, optional): Wird nach jedem Block mit dem Zwischenstand aufgerufen.
+
+    Returns:
+        dict: {'rows', 'chunks', 'seconds', 'rows_per_second'}
+    """
+    in_fmt, out_fmt = detect_format(in_path), detect_format(out_path)
+    out_name = controller.output_var.name
+    stats = {"rows": 0, "chunks": 0, "seconds": 0.0, "rows_per_second": 0.0}
+    start = time.perf_counter()
+
+    with open(in_path, newline="", encoding="utf-8") as fin, \
+         open(out_path, "w", newline="", encoding="utf-8") as fout:
+        writer = None
+        for rows, values, commands in score_chunks(controller, iter_chunks(fin, in_fmt, chunk_size),
+                                                   columns, method):
+            if out_fmt == "csv":
+                if writer is None:
+                    if in_fmt == "csv":
+                        fields = [key for key in rows[0] if key is not None]  # None: überzählige Werte
+                    else:
+                        fields = [(columns or {}).get(name, name) for name in controller.input_vars]
+                    fields += [key for key in (out_name, "Command") if key not in fields]
+                    writer = csv.DictWriter(fout, fieldnames=fields, extrasaction="ignore")
+                    writer.writeheader()
+                for row, value, command in zip(rows, values.tolist(), commands.tolist()):
+                    row[out_name] = value
+                    row["Command"] = command
+                writer.writerows(rows)
+            else:
+                for row, value, command in zip(rows, values.tolist(), commands.tolist()):
+                    row[out_name] = value
+                    row["Command"] = command
+                    fout.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+            stats["rows"] += len(rows)
+            stats["chunks"] += 1
+            stats["seconds"] = time.perf_counter() - start
+            stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+            if progress is not None:
+                progress(dict(stats))
+    return stats
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg mit dem Default-Controller aus config.VAR_CONFIG oder einem Snapshot."""
+    from fuzzylogic.fuzzy_logic.snapshot import load_snapshot
+    from fuzzylogic.runtime.defaults import default_controller
+
+    parser = argparse.ArgumentParser(description="Telemetrie-Datei blockweise mit dem Fuzzy-Controller bewerten.")
+    parser.add_argument("input", help="Eingabedatei (.csv, .ndjson, .jsonl)")
+    parser.add_argument("output", help="Ausgabedatei (.csv, .ndjson, .jsonl)")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--method", default="centroid",
+                        choices=["min_of_max", "max_of_max", "mean_of_max", "centroid"])
+    parser.add_argument("--column", action="append", default=[], metavar="VAR=SPALTE",
+                        help="Spaltenname für eine Input-Variable, z.B. Health=hp")
+    parser.add_argument("--snapshot", help="Controller aus einer Snapshot-Datei laden")
+    args = parser.parse_args(argv)
+    controller = load_snapshot(args.snapshot) if args.snapshot else default_controller()
+
+    columns = dict(item.split("=", 1) for item in args.column)
+
+    def report(s):
+        print(f"{s['rows']:>12,} rows  {s['rows_per_second']:>12,.0f} rows/s", flush=True)
+
+    stats = run_stream(controller, args.input, args.output, args.chunk_size,
+                       args.method, columns, progress=report)
+    print(json.dumps(stats))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+Streamlit- und Plot-Hilfen für die App (src/main.py). Benötigt das Extra: pip install 'fuzzylogic[ui]'.
+Der Kern importiert dieses Paket nie.
+"""
@@ -0,0 +1,128 @@
+"""
+Plot-Hilfsfunktionen für das Streamlit-UI:
+- Zeichnet die Zwischenergebnisse einer InferenceExplanation in wenigen Sammelabbildungen.
+- Alle Funktionen bekommen nur Arrays und Labels und liefern PNG-Bytes, damit das UI die Bilder
+  über den Inhalt der Daten cachen kann (st.cache_data).
+"""
+
+import io
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+#: Füllfarben der Outputterms
+TERM_COLORS = {'poor': 'salmon', 'medium': 'gold', 'good': 'lightgreen'}
+
+def _png(fig: Figure) -> bytes:
+    # Feste Ränder statt Layout-Engine bzw. bbox_inches="tight": beides zeichnet die Abbildung mehrfach
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    return buf.getvalue()
+
+def _positive(xs: np.ndarray, ys: np.ndarray):
+    # Nur den Träger zeichnen (wie bisher), Nullbereiche bleiben leer
+    mask = ys > 0
+    return xs[mask], ys[mask]
+
+def render_inputs(input_samples: dict, values: dict) -> bytes:
+    """
+    Eine Abbildung mit den Input-MFs aller Variablen nebeneinander und dem aktuellen Wert.
+
+    Args:
+        input_samples (dict): Name -> (xs, labels, curves) aus FuzzyController.sample_inputs.
+        values (dict): Name -> aktueller Crisp-Wert.
+
+    Returns:
+        bytes: PNG-Bild.
+    """
+    fig = Figure(figsize=(3 * len(input_samples), 2.5))
+    axes = np.atleast_1d(fig.subplots(1, len(input_samples), gridspec_kw={
+        "left": 0.05, "right": 0.99, "bottom": 0.1, "top": 0.9, "wspace": 0.3}))
+    for ax, (name, (xs, labels, curves)) in zip(axes, input_samples.items()):
+        for label, ys in zip(labels, curves):
+            ax.plot(*_positive(xs, ys), label=label)
+        ax.axvline(values[name], color='k', linestyle='--')
+        ax.set_title(name)
+        ax.set_ylim(0, 1)
+        ax.set_ylabel('μ')
+        ax.legend(fontsize='x-small')
+    return _png(fig)
+
+def render_rules(xs: np.ndarray, rule_sets: np.ndarray, terms: list, strengths: np.ndarray,
+                 columns: int = 8) -> bytes:
+    """
+    Kleine Vielfache der geclippten Output-Mengen gefeuerter Regeln in einer Abbildung.
+
+    Args:
+        xs (np.ndarray): Stützstellen der Output-Domäne.
+        rule_sets (np.ndarray): (Regeln × len(xs)) implizierte Output-Menge je Regel.
+        terms (list): Outputterm je Regel (Titel und Farbe).
+        strengths (np.ndarray): Aktivierungsstärke je Regel.
+        columns (int): Maximale Anzahl Diagramme pro Zeile.
+
+    Returns:
+        bytes: PNG-Bild.
+    """
+    n = max(len(rule_sets), 1)
+    cols = min(n, columns)
+    rows = -(-n // cols)
+    # Alle Regeln in einer einzigen Achse als eine PolyCollection, versetzt im Datenraster:
+    # eigene Achsen je Regel kosten (Ticks, Spines, Layout) ein Vielfaches des eigentlichen Zeichnens
+    span = xs[-1] - xs[0]
+    cell_w, cell_h = span * 1.08, 1.55
+    fig = Figure(figsize=(1.6 * cols, 1.6 * rows))
+    ax = fig.add_axes((0, 0, 1, 1))
+    polys, frames, colors = [], [], []
+    for i, (ys, term, alpha) in enumerate(zip(rule_sets, terms, strengths)):
+        x0 = (i % cols) * cell_w - xs[0]
+        y0 = -(i // cols) * cell_h
+        px = xs + x0
+        polys.append(np.column_stack((np.r_[px, px[::-1]], np.r_[ys + y0, np.full(len(xs), y0)])))
+        frames.append([(px[0], y0), (px[-1], y0), (px[-1], y0 + 1), (px[0], y0 + 1)])
+        colors.append(TERM_COLORS.get(term, 'lightgray'))
+        ax.text(px[0] + span / 2, y0 + 1.04, f"{term}\nα={alpha:.2f}", fontsize=8,
+                ha='center', va='bottom')
+    ax.add_collection(PolyCollection(polys, facecolors=colors, edgecolors='none', alpha=0.6))
+    ax.add_collection(PolyCollection(frames, facecolors='none', edgecolors='k', linewidths=0.8))
+    ax.set(xlim=(-span * 0.04, cols * cell_w - span * 0.04), ylim=(-(rows - 1) * cell_h - 0.05, cell_h - 0.05))
+    ax.set_axis_off()
+    return _png(fig)
+
+def render_output(xs: np.ndarray, output_terms: list, term_curves: np.ndarray, term_sets: np.ndarray,
+                  term_degrees: np.ndarray, ys: np.ndarray, value: float, xlabel: str = 'Outlook') -> bytes:
+    """
+    Ungewichtete Output-MFs und aggregierte Output-Menge mit defuzzifiziertem Wert nebeneinander.
+
+    Args:
+        xs (np.ndarray): Stützstellen der Output-Domäne.
+        output_terms (list): Labels der Outputterms.
+        term_curves (np.ndarray): (Outputterms × len(xs)) ungewichtete Output-MFs.
+        term_sets (np.ndarray): (Outputterms × len(xs)) implizierte Output-Menge je Term.
+        term_degrees (np.ndarray): Aggregierte Stärke je Outputterm.
+        ys (np.ndarray): Aggregierte Output-MF.
+        value (float): Defuzzifizierter Crisp-Wert.
+        xlabel (str): Achsenbeschriftung der Output-Domäne.
+
+    Returns:
+        bytes: PNG-Bild.
+    """
+    fig = Figure(figsize=(12, 2.5))
+    ax_mf, ax_out = fig.subplots(1, 2, sharey=True, gridspec_kw={
+        "left": 0.04, "right": 0.99, "bottom": 0.2, "top": 0.9, "wspace": 0.05})
+    for label, curve in zip(output_terms, term_curves):
+        ax_mf.plot(*_positive(xs, curve), label=label)
+    ax_mf.set_title('Raw Output Membership Functions', fontsize='medium')
+    ax_mf.set_ylim(0, 1)
+    ax_mf.set_ylabel('μ')
+    ax_mf.legend(fontsize='small')
+
+    for label, term_set, degree in zip(output_terms, term_sets, term_degrees):
+        ax_out.fill_between(xs, term_set, color=TERM_COLORS.get(label, 'lightgray'), alpha=0.4,
+                            label=f"{label} (α={degree:.2f})")
+    ax_out.plot(xs, ys, color='k', linewidth=1)
+    ax_out.axvline(value, color='r', linestyle='--', label=f"Defuzz = {value:.2f}")
+    ax_out.set_title('Aggregated Output & Defuzzification', fontsize='medium')
+    ax_out.set_xlabel(xlabel)
+    ax_out.legend(fontsize='small')
+    return _png(fig)
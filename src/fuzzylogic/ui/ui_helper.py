@@ -4,8 +4,8 @@ Hilfsfunktionen für das Streamlit-UI:
 """
 
 import streamlit as st
-from config import MF_TYPES, MF_PARAM_HELP
-from modules.fuzzy_logic.fuzzy_variable import FuzzyVariable
+from fuzzylogic.config import MF_TYPES, MF_PARAM_HELP
+from fuzzylogic.fuzzy_logic.fuzzy_variable import FuzzyVariable
 
 def mf_params_ui(var, label, mf_type, params):
     """
@@ -36,18 +36,19 @@ def mf_params_ui(var, label, mf_type, params):
         vals.append(val)
     return vals
 
-def build_var_from_ui(varname, config):
+def var_spec_from_ui(varname, config):
     """
-    Baut eine FuzzyVariable durch UI-Eingabe in Streamlit zusammen.
+    Liest MF-Typen und -Parameter einer Variable aus dem UI, ohne Objekte zu bauen.
+    Die Spezifikation ist hashbar und dient als Cache-Key für Variablen, Controller und Kurven.
 
     Args:
         varname (str): Name der Fuzzy-Variable (z.B. 'Health')
         config (dict): Konfiguration der Variable aus VAR_CONFIG
 
     Returns:
-        FuzzyVariable: Das per UI erzeugte Objekt mit allen zugehörigen Membership Functions
+        tuple: ((label, mf_type, (param, ...)), ...) in der Reihenfolge von config["labels"]
     """
-    terms = {}
+    spec = []
     with st.expander(f"{varname} Membership Functions", expanded=False):
         tab_objs = st.tabs(config["labels"])
         for tab, label in zip(tab_objs, config["labels"]):
@@ -61,6 +62,36 @@ def build_var_from_ui(varname, config):
                 )
                 default = default_vals if mf_type == default_type else MF_TYPES[mf_type]["default"]
                 vals = mf_params_ui(varname, label, mf_type, default)
-                mf_func = MF_TYPES[mf_type]["func"]
-                terms[label] = mf_func(*vals)
-    return FuzzyVariable(varname, terms, domain=config["domain"])
+                spec.append((label, mf_type, tuple(vals)))
+    return tuple(spec)
+
+@st.cache_resource(max_entries=64)
+def variable_from_spec(varname, spec, domain):
+    """
+    Baut eine FuzzyVariable aus einer Spezifikation von var_spec_from_ui.
+    Gleiche Spezifikationen liefern über Reruns hinweg dasselbe (gecachte) Objekt.
+
+    Args:
+        varname (str): Name der Fuzzy-Variable
+        spec (tuple): Spezifikation aus var_spec_from_ui
+        domain (tuple): (min, max) Wertebereich
+
+    Returns:
+        FuzzyVariable: Variable mit den spezifizierten Membership Functions
+    """
+    terms = {label: MF_TYPES[mf_type]["func"](*vals) for label, mf_type, vals in spec}
+    return FuzzyVariable(varname, terms, domain=tuple(domain))
+
+def build_var_from_ui(varname, config):
+    """
+    Baut eine FuzzyVariable durch UI-Eingabe in Streamlit zusammen.
+
+    Args:
+        varname (str): Name der Fuzzy-Variable (z.B. 'Health')
+        config (dict): Konfiguration der Variable aus VAR_CONFIG
+
+    Returns:
+        FuzzyVariable: Das per UI erzeugte Objekt mit allen zugehörigen Membership Functions
+    """
+    spec = var_spec_from_ui(varname, config)
+    return variable_from_spec(varname, spec, tuple(config["domain"]))
@@ -1,11 +1,58 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
 
-from modules.fuzzy_logic.fuzzy_rule import FuzzyRule
-from modules.fuzzy_logic.fuzzy_controller import FuzzyController
-from utils.ui_helper import build_var_from_ui
-from config import VAR_CONFIG
+from fuzzylogic.fuzzy_logic.fuzzy_rule import FuzzyRule
+from fuzzylogic.fuzzy_logic.fuzzy_controller import FuzzyController
+from fuzzylogic.fuzzy_logic.rule_optimizer import analyze_rules, optimize_rules
+from fuzzylogic.runtime.commands import command_for
+from fuzzylogic.ui.plots import render_inputs, render_rules, render_output
+from fuzzylogic.ui.ui_helper import var_spec_from_ui, variable_from_spec
+from fuzzylogic.config import VAR_CONFIG, DEFAULT_RULES
+
+# -------------------------------
+# Caches (überleben Reruns)
+# -------------------------------
+
+@st.cache_resource(max_entries=32)
+def get_controller(var_specs, rules_key):
+    """
+    Baut Variablen, Regeln und Controller nur neu, wenn sich MF-Typen/-Parameter
+    oder das Regel-Set geändert haben. Reine Slider-Änderungen treffen den Cache.
+    Das Regel-Set wird vorab verdichtet (Duplikate, abgedeckte und nie aktive Regeln entfernt).
+
+    Args:
+        var_specs (tuple): ((varname, spec), ...) aus var_spec_from_ui
+        rules_key (tuple): Regel-Set als hashbares Tupel ((antecedents, consequent), ...)
+
+    Returns:
+        tuple: (FuzzyController, RuleBaseReport) Controller inkl. gecachter Output-Kurven und
+            kompilierter Regelbasis sowie der Bericht der Regel-Optimierung
+    """
+    variables = {name: variable_from_spec(name, spec, tuple(VAR_CONFIG[name]["domain"]))
+                 for name, spec in var_specs}
+    rules = [FuzzyRule(list(antecedents), cons) for antecedents, cons in rules_key]
+    output_var = variables.pop("Outlook")
+    rules, report = optimize_rules(rules, variables)
+    controller = FuzzyController(variables, output_var, rules)
+    controller.compile()  # Regelbasis vorab kompilieren, nicht erst bei der ersten Inferenz
+    return controller, report
+
+#: Obergrenze für einzeln gezeichnete Regeln (die stärksten werden gezeigt)
+MAX_RULE_PLOTS = 32
+
+# Gerenderte Abbildungen als PNG, gecacht über den Inhalt der Arrays: unveränderte Plots
+# (z.B. Input-MFs bei gleicher Spezifikation und gleichem Wert) werden nicht neu gezeichnet
+
+@st.cache_data(max_entries=64)
+def input_figure(input_samples, values):
+    return render_inputs(input_samples, values)
+
+@st.cache_data(max_entries=64)
+def rule_figure(xs, rule_sets, terms, strengths):
+    return render_rules(xs, rule_sets, terms, strengths)
+
+@st.cache_data(max_entries=64)
+def output_figure(xs, output_terms, term_curves, term_sets, term_degrees, ys, value):
+    return render_output(xs, output_terms, term_curves, term_sets, term_degrees, ys, value)
 
 # -------------------------------
 # Streamlit App Setup & Inputs
@@ -24,6 +71,12 @@ with st.sidebar:
         'Defuzzification Method',
         ['min_of_max', 'max_of_max', 'mean_of_max', 'centroid']
     )
+    exact = st.checkbox(
+        'Analytische Defuzzifizierung',
+        value=False,
+        help="Berechnet den Crisp-Wert exakt aus den Eckpunkten der Trapez-/Dreiecks-MFs "
+             "statt über das Sampling-Gitter (Bell-MFs werden weiterhin gesampelt)."
+    )
 
 # -----------------------------------------
 # Membership Functions für alle Variablen
@@ -31,12 +84,13 @@ with st.sidebar:
 
 st.header("Wähle Membership Functions")
 cols = st.columns(2)
+var_specs = {}
 with cols[0]:
-    health = build_var_from_ui("Health", VAR_CONFIG["Health"])
-    enemies = build_var_from_ui("Enemies", VAR_CONFIG["Enemies"])
+    var_specs["Health"] = var_spec_from_ui("Health", VAR_CONFIG["Health"])
+    var_specs["Enemies"] = var_spec_from_ui("Enemies", VAR_CONFIG["Enemies"])
 with cols[1]:
-    distance = build_var_from_ui("Distance", VAR_CONFIG["Distance"])
-    outlook = build_var_from_ui("Outlook", VAR_CONFIG["Outlook"])
+    var_specs["Distance"] = var_spec_from_ui("Distance", VAR_CONFIG["Distance"])
+    var_specs["Outlook"] = var_spec_from_ui("Outlook", VAR_CONFIG["Outlook"])
 
 # -----------------------------------------
 # Fuzzy-Regel-Editor (Regeln anpassen)
@@ -46,27 +100,8 @@ st.header("Fuzzy-Regel-Editor")
 
 # Session-State für Regeln initialisieren (nur beim ersten Laden)
 if "rules" not in st.session_state:
-    st.session_state.rules = [
-        # Beispiel-Regeln (Initial-Set)
-        ({"Health": "strong", "Enemies": "low"}, ("Outlook", "good")),
-        ({"Health": "strong", "Enemies": "mod"}, ("Outlook", "good")),
-        ({"Health": "strong", "Enemies": "high"}, ("Outlook", "medium")),
-        ({"Health": "medium", "Enemies": "low"}, ("Outlook", "good")),
-        ({"Health": "medium", "Enemies": "mod"}, ("Outlook", "medium")),
-        ({"Health": "medium", "Enemies": "high"}, ("Outlook", "poor")),
-        ({"Health": "weak", "Enemies": "low"}, ("Outlook", "medium")),
-        ({"Health": "weak", "Enemies": "mod"}, ("Outlook", "poor")),
-        ({"Health": "weak", "Enemies": "high"}, ("Outlook", "poor")),
-        ({"Distance": "near", "Enemies": "low"}, ("Outlook", "good")),
-        ({"Distance": "near", "Enemies": "mod"}, ("Outlook", "good")),
-        ({"Distance": "near", "Enemies": "high"}, ("Outlook", "medium")),
-        ({"Distance": "medium", "Enemies": "low"}, ("Outlook", "good")),
-        ({"Distance": "medium", "Enemies": "mod"}, ("Outlook", "medium")),
-        ({"Distance": "medium", "Enemies": "high"}, ("Outlook", "poor")),
-        ({"Distance": "far", "Enemies": "low"}, ("Outlook", "medium")),
-        ({"Distance": "far", "Enemies": "mod"}, ("Outlook", "poor")),
-        ({"Distance": "far", "Enemies": "high"}, ("Outlook", "poor")),
-    ]
+    # Beispiel-Regeln (Initial-Set), als Kopie, damit Änderungen die Defaults nicht verändern
+    st.session_state.rules = [(dict(conds), cons) for conds, cons in DEFAULT_RULES]
 
 # --- UI für das Hinzufügen neuer Regeln ---
 with st.expander("Neue Regel hinzufügen", expanded=False):
@@ -91,22 +126,35 @@ with st.expander("Neue Regel hinzufügen", expanded=False):
         )
         submitted = st.form_submit_button("Regel hinzufügen")
         if submitted:
-            # Regel nur anlegen, wenn mindestens eine Bedingung gesetzt ist und es noch kein Duplikat gibt
+            # Regel nur anlegen, wenn mindestens eine Bedingung gesetzt ist und es noch kein Duplikat gibt;
+            # abgedeckte und widersprüchliche Regeln werden angelegt, aber gemeldet
             rule_ante = {k: v for k, v in antecedents.items() if v is not None}
             if not rule_ante:
                 st.warning("Mindestens eine Bedingung muss gewählt werden!")
             else:
                 rule_cons = ("Outlook", out_label)
-                exists = any(
-                    (old_cons == rule_cons and old_ante == rule_ante)
-                    for old_ante, old_cons in st.session_state.rules
-                )
-                if exists:
+                candidates = st.session_state.rules + [(rule_ante, rule_cons)]
+                new = len(candidates) - 1
+                report = analyze_rules([FuzzyRule(list(a.items()), c) for a, c in candidates])
+                findings = {kind: [other for i, other in getattr(report, kind) if i == new]
+                            for kind in ("duplicates", "subsumed", "conflicts")}
+                if findings["duplicates"]:
                     st.warning("Diese Regel existiert bereits!")
                 else:
                     st.session_state.rules.append((rule_ante, rule_cons))
                     st.success("Regel hinzugefügt!")
 
+                    def describe(i):
+                        conds, cons = candidates[i]
+                        return " & ".join(f"{k}={v}" for k, v in conds.items()) + f" → {cons[0]}={cons[1]}"
+
+                    if findings["subsumed"]:
+                        st.info(f"Die Regel ist durch „{describe(findings['subsumed'][0])}“ abgedeckt "
+                                "und wird bei der Inferenz übersprungen.")
+                    if findings["conflicts"]:
+                        st.warning(f"Konflikt mit „{describe(findings['conflicts'][0])}“: "
+                                   "gleiche Bedingungen, andere Konsequenz.")
+
 # --- Aktuelles Regel-Set anzeigen und Regeln löschen ---
 with st.expander("Aktuelles Regel-Set", expanded=False):
     for i, (conds, cons) in enumerate(st.session_state.rules):
@@ -120,95 +168,54 @@ with st.expander("Aktuelles Regel-Set", expanded=False):
             st.rerun()
 
 # -----------------------------------------
-# Regel-Liste in FuzzyRule-Objekte umwandeln
+# Controller (gecacht über MF-Spezifikation und Regel-Set)
 # -----------------------------------------
 
-custom_rules = []
-for conds, cons in st.session_state.rules:
-    antecedents = [(k, v) for k, v in conds.items()]
-    custom_rules.append(FuzzyRule(antecedents, cons))
+rules_key = tuple((tuple(conds.items()), cons) for conds, cons in st.session_state.rules)
+controller, rule_report = get_controller(tuple(var_specs.items()), rules_key)
+if rule_report.removed or rule_report.conflicts:
+    st.caption(f"Regel-Optimierung: {rule_report.summary()}")
 
 # -----------------------------------------
 # Fuzzy Inferenz und Defuzzifizierung
 # -----------------------------------------
 
-controller = FuzzyController(
-    {'Health': health, 'Enemies': enemies, 'Distance': distance},
-    outlook,
-    custom_rules
-)
-
-fuzzified, agg, ys = controller.infer({
+# explain liefert neben agg/ys alle Zwischenergebnisse (gesampelte Input-MFs, geclippte Mengen
+# je Regel und je Term), die Plots rechnen nichts nach
+explanation = controller.explain({
     'Health': g_health,
     'Enemies': g_enemies,
     'Distance': g_distance
 })
-def_val = controller.defuzzify(ys, method)
+agg, ys = explanation.agg, explanation.ys
+def_val = controller.defuzzify_exact(agg, method) if exact else controller.defuzzify(ys, method)
 
 # -----------------------------------------
 # Visualisierungen (MFs, Regeln, Output)
 # -----------------------------------------
 
 # --- Input Membership Functions ---
-cols = st.columns(3)
-for col, (var, val) in zip(cols, [('Health', g_health), ('Enemies', g_enemies), ('Distance', g_distance)]):
-    fv = controller.input_vars[var]
-    xs = np.linspace(fv.domain[0], fv.domain[1], 400)
-    fig, ax = plt.subplots(figsize=(3, 2.5))
-    for lbl, mf in fv.terms.items():
-        ys_mf = np.array([mf(x) for x in xs])
-        ax.plot(xs[ys_mf > 0], ys_mf[ys_mf > 0], label=lbl)
-    ax.axvline(val, color='k', linestyle='--')
-    ax.set_title(var)
-    ax.set_ylim(0, 1)
-    ax.set_ylabel('μ')
-    ax.legend(fontsize='x-small')
-    col.pyplot(fig)
+input_png = input_figure(explanation.input_samples, explanation.inputs)
+st.image(input_png, use_container_width=True)
 
 # --- Regelaktivierungen: Geclippte Output Sets ---
 st.header("Rule-level Clipped Output Sets")
-color_map = {'poor': 'salmon', 'medium': 'gold', 'good': 'lightgreen'}
-fired = [(r, r.evaluate(fuzzified)) for r in controller.rules]
-fired = [(r, a) for r, a in fired if a > 0]
-cols_r = st.columns(len(fired) or 1)
-for col, (rule, alpha) in zip(cols_r, fired):
-    term = rule.consequent[1]
-    fig_r, ax_r = plt.subplots(figsize=(2, 2))
-    xs_o = controller.xs
-    ys_clip = np.minimum(alpha, np.array([outlook.terms[term](x) for x in xs_o]))
-    ax_r.fill_between(xs_o, ys_clip, color=color_map[term], alpha=0.6)
-    ax_r.set_title(f"{term}\nα={alpha:.2f}", fontsize=8)
-    ax_r.set_ylim(0, 1)
-    ax_r.set_xticks([])
-    ax_r.set_yticks([])
-    col.pyplot(fig_r)
-
-# --- Output MF (ungewichtet) ---
-st.header("Raw Output Membership Functions")
-xs_out = np.linspace(outlook.domain[0], outlook.domain[1], 400)
-fig_mf, ax_mf = plt.subplots(figsize=(6, 2.5))
-for lbl, mf in outlook.terms.items():
-    ys_mf = np.array([mf(x) for x in xs_out])
-    ax_mf.plot(xs_out[ys_mf > 0], ys_mf[ys_mf > 0], label=lbl)
-ax_mf.set_ylim(0, 1)
-ax_mf.set_ylabel('μ')
-ax_mf.legend(fontsize='small')
-st.pyplot(fig_mf)
-
-# --- Aggregierte Ausgabe & Defuzzifizierung ---
-st.header("Aggregated Output & Defuzzification")
-fig_out, ax_out = plt.subplots(figsize=(6, 2.5))
-for term, degree in agg.items():
-    ys_term = np.minimum(degree, np.array([outlook.terms[term](x) for x in controller.xs]))
-    ax_out.fill_between(controller.xs, ys_term, color=color_map[term], alpha=0.4,
-                        label=f"{term} (α={degree:.2f})")
-ax_out.plot(controller.xs, ys, color='k', linewidth=1)
-ax_out.axvline(def_val, color='r', linestyle='--', label=f"Defuzz = {def_val:.2f}")
-ax_out.set_ylim(0, 1)
-ax_out.set_ylabel('μ')
-ax_out.set_xlabel('Outlook')
-ax_out.legend(fontsize='small')
-st.pyplot(fig_out)
+shown = explanation.strongest(MAX_RULE_PLOTS)
+if len(shown) < len(explanation.rules):
+    st.caption(f"{len(explanation.rules)} Regeln aktiv, gezeigt werden die {len(shown)} stärksten.")
+if len(shown):
+    rule_png = rule_figure(explanation.xs, explanation.rule_sets[shown],
+                           tuple(explanation.output_terms[k] for k in explanation.rule_terms[shown]),
+                           explanation.rule_strengths[shown])
+    st.image(rule_png, use_container_width=len(shown) > 4)
+else:
+    st.info("Keine Regel aktiv.")
+
+# --- Output MF (ungewichtet) & Aggregierte Ausgabe mit Defuzzifizierung ---
+st.header("Output Membership Functions & Defuzzification")
+output_png = output_figure(explanation.xs, tuple(explanation.output_terms), explanation.term_curves,
+                           explanation.term_sets, explanation.term_degrees, explanation.ys, def_val)
+st.image(output_png, use_container_width=True)
 
 # --- Ausgabe: Stärken & Crisp-Command ---
 st.markdown('---')
@@ -218,6 +225,6 @@ with c1:
     st.write(agg)
 with c2:
     st.subheader("Crisp Command")
-    # Definierte Schwellenwerte für Ausgabekommandos
-    cmd = 'ANGRIFF' if def_val >= 66 else 'VERTEIDIGUNG' if def_val >= 34 else 'RÜCKZUG'
+    # Schwellenwerte für Ausgabekommandos siehe config.COMMAND_THRESHOLDS
+    cmd = command_for(def_val)
     st.success(cmd)
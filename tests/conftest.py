@@ -0,0 +1,58 @@
+"""
+Gemeinsame Fixtures: Default-Controller aus config und ein kleiner Controller mit Dreiecks-
+und Bell-Termen, dazu reproduzierbare Eingaben inklusive Domänengrenzen und Term-Spitzen.
+"""
+
+import numpy as np
+import pytest
+from fuzzylogic import FuzzyController, FuzzyRule, FuzzyVariable, bell_mf, default_controller, tri_mf
+
+#: Implikation/Aggregation, über die die Äquivalenztests laufen
+OPERATORS = [("min", "max"), ("product", "sum"), ("min", "probor")]
+
+METHODS = ["min_of_max", "max_of_max", "mean_of_max", "centroid"]
+
+def mixed_controller(**kwargs) -> FuzzyController:
+    """Zwei Inputs mit Dreiecken (auch rechtwinklig, b == c) und Bell-Termen, Output mit Dreiecken."""
+    x = FuzzyVariable("X", {"low": tri_mf(0, 0, 50), "mid": tri_mf(20, 50, 80),
+                            "high": tri_mf(50, 100, 100)}, (0, 100))
+    y = FuzzyVariable("Y", {"near": bell_mf(2, 2, 0), "far": bell_mf(3, 2, 10)}, (0, 10))
+    out = FuzzyVariable("Z", {"bad": tri_mf(0, 0, 40), "ok": tri_mf(20, 50, 80),
+                              "good": tri_mf(60, 100, 100)}, (0, 100))
+    rules = [
+        FuzzyRule([("X", "low"), ("Y", "near")], ("Z", "bad")),
+        FuzzyRule([("X", "mid")], ("Z", "ok")),
+        FuzzyRule([("X", "high"), ("Y", "far")], ("Z", "good")),
+        FuzzyRule([("Y", "far")], ("Z", "ok")),
+    ]
+    return FuzzyController({"X": x, "Y": y}, out, rules, **kwargs)
+
+def controller_inputs(controller, n: int = 200, seed: int = 0) -> dict:
+    """Zufällige Spalten über den Input-Domänen, ergänzt um Domänengrenzen und Term-Eckpunkte."""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, var in controller.input_vars.items():
+        lo, hi = var.domain
+        special = [lo, hi]
+        for mf in var.terms.values():
+            bp = mf.breakpoints()
+            if bp is not None:
+                special.extend(float(x) for x in bp[0] if lo <= x <= hi)
+        columns[name] = np.concatenate([rng.uniform(lo, hi, n), special])
+    size = max(len(col) for col in columns.values())
+    return {name: np.resize(col, size) for name, col in columns.items()}
+
+def rows(columns: dict):
+    """Zeilenweise Dicts aus Spalten (Eingabe für infer/decide)."""
+    names = list(columns)
+    for values in zip(*(columns[name] for name in names)):
+        yield dict(zip(names, map(float, values)))
+
+@pytest.fixture(params=["default", "mixed"])
+def make_controller(request):
+    """Fabrik für Default- bzw. gemischten Controller mit wählbaren Operatoren."""
+    def make(implication="min", aggregation="max"):
+        if request.param == "default":
+            return default_controller(implication=implication, aggregation=aggregation)
+        return mixed_controller(implication=implication, aggregation=aggregation)
+    return make
@@ -0,0 +1,60 @@
+"""
+InferenceWorkspace: float64 entspricht decide_batch, float32 liegt innerhalb einer Toleranz,
+und Änderungen am Controller werden von den vorallozierten Puffern übernommen.
+"""
+
+import numpy as np
+import pytest
+from conftest import METHODS, OPERATORS, controller_inputs, rows
+from fuzzylogic import FuzzyRule, InferenceWorkspace
+
+@pytest.mark.parametrize("implication, aggregation", OPERATORS)
+@pytest.mark.parametrize("method", METHODS)
+def test_float64_workspace_matches_decide_batch(make_controller, implication, aggregation, method):
+    controller = make_controller(implication, aggregation)
+    columns = controller_inputs(controller)
+    expected = controller.decide_batch(columns, method)
+    ws = InferenceWorkspace(controller, capacity=64)
+    np.testing.assert_allclose(ws.decide_batch(columns, method), expected, rtol=1e-12, atol=1e-9)
+    single = np.array([ws.decide(row, method) for row in rows(columns)])
+    np.testing.assert_allclose(single, expected, rtol=1e-12, atol=1e-9)
+
+@pytest.mark.parametrize("implication, aggregation", OPERATORS)
+def test_float32_workspace_close_to_float64(make_controller, implication, aggregation):
+    controller = make_controller(implication, aggregation)
+    columns = controller_inputs(controller)
+    expected = controller.decide_batch(columns)
+    ws = InferenceWorkspace(controller, dtype=np.float32)
+    lo, hi = controller.output_var.domain
+    # centroid summiert über len(xs) Stützstellen: Rundungsfehler relativ zur Domänenbreite
+    tolerance = 1e-6 * (hi - lo)
+    np.testing.assert_allclose(ws.decide_batch(columns), expected, atol=tolerance)
+    single = np.array([ws.decide(row) for row in rows(columns)])
+    np.testing.assert_allclose(single, expected, atol=tolerance)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("method", METHODS)
+def test_decide_batch_writes_into_out(make_controller, dtype, method):
+    controller = make_controller()
+    columns = controller_inputs(controller)
+    ws = InferenceWorkspace(controller, dtype=dtype)
+    out = np.empty(len(next(iter(columns.values()))))
+    assert ws.decide_batch(columns, method, out=out) is out
+    assert np.isfinite(out).all()
+
+def test_workspace_follows_controller_changes(make_controller):
+    controller = make_controller()
+    columns = controller_inputs(controller)
+    ws = InferenceWorkspace(controller)
+    ws.decide_batch(columns)
+    row = next(rows(columns))
+    ws.decide(row)
+
+    out_name = controller.output_var.name
+    first_var, first_term = next((name, next(iter(var.terms))) for name, var in controller.input_vars.items())
+    controller.rules.append(FuzzyRule([(first_var, first_term)], (out_name, controller.output_terms[-1])))
+    controller.implication, controller.aggregation = "product", "sum"
+    np.testing.assert_allclose(ws.decide_batch(columns), controller.decide_batch(columns),
+                               rtol=1e-12, atol=1e-9)
+    assert ws.decide(row) == pytest.approx(controller.decide_batch(
+        {name: np.array([value]) for name, value in row.items()})[0], rel=1e-12, abs=1e-9)